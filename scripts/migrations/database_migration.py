@@ -117,6 +117,14 @@ def run_migration(db_path="budget_tracker.db"):
             else:
                 raise
         
+        # Index the month query in the Bank Reconciliation tab
+        # (WHERE date range ... ORDER BY date DESC, id DESC)
+        print("Creating bank_transactions date index...")
+        cursor.execute(
+            'CREATE INDEX IF NOT EXISTS idx_bank_tx_date ON bank_transactions(date DESC, id DESC)'
+        )
+        print("✓ idx_bank_tx_date index created")
+        
         # Commit all changes
         conn.commit()
         print("\n✓ Database migration completed successfully!")
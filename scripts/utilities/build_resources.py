@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Compile GUI image resources into src/gui/zuo_rc.py
+
+PyQt6 no longer ships pyrcc, so the application's images are embedded as
+bytes in a generated Python module instead of a compiled .qrc file. Loading
+them needs no filesystem access and works unchanged in PyInstaller builds.
+
+Run this after changing anything in src/gui/resources/:
+    python scripts/utilities/build_resources.py
+"""
+
+import base64
+import os
+import textwrap
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+RESOURCES_DIR = os.path.join(PROJECT_ROOT, 'src', 'gui', 'resources')
+OUTPUT_FILE = os.path.join(PROJECT_ROOT, 'src', 'gui', 'zuo_rc.py')
+
+# Module constant name -> file in src/gui/resources/
+RESOURCES = {
+    'LOGO_PNG': 'zuo_logo.png',
+    # Pre-scaled copy for the About dialog so it never needs resampling
+    'LOGO_200_PNG': 'zuo_logo_200.png',
+}
+
+
+def main():
+    """Write every resource as a base64-encoded bytes constant"""
+    lines = [
+        '"""',
+        'Embedded GUI resources for Zuo Budget Tracker',
+        '',
+        'Generated by scripts/utilities/build_resources.py - do not edit by hand.',
+        '"""',
+        '',
+        'import base64',
+        '',
+    ]
+    for name, filename in RESOURCES.items():
+        with open(os.path.join(RESOURCES_DIR, filename), 'rb') as f:
+            encoded = base64.b64encode(f.read()).decode('ascii')
+        lines.append(f'# {filename}')
+        lines.append(f'{name} = base64.b64decode(')
+        lines.extend(f'    "{chunk}"' for chunk in textwrap.wrap(encoded, 76))
+        lines.append(')')
+        lines.append('')
+
+    with open(OUTPUT_FILE, 'w') as f:
+        f.write('\n'.join(lines))
+    print(f"✓ Wrote {len(RESOURCES)} resource(s) to {OUTPUT_FILE}")
+
+
+if __name__ == "__main__":
+    main()
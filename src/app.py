@@ -167,19 +167,14 @@ class BudgetApp(QMainWindow):
 
         This method is called whenever the user switches to a different tab.
         It ensures that the newly activated tab displays the most current
-        data by calling its refresh_data method if available.
+        data by calling its refresh_data method.
 
         Args:
             index (int): Index of the newly selected tab
 
         Note:
-            Not all tabs may implement refresh_data(), so we check for
-            its existence before calling it.
+            Every tab subclasses RefreshableTab, so refresh_data() is always
+            available (tabs with nothing to reload inherit a no-op).
         """
-        # Get the widget for the currently selected tab
-        current_widget = self.tabs.currentWidget()
-
-        # Check if the tab has a refresh_data method and call it
-        # This pattern allows tabs to update their display when activated
-        if hasattr(current_widget, 'refresh_data'):
-            current_widget.refresh_data()
\ No newline at end of file
+        # Refresh the widget for the currently selected tab
+        self.tabs.currentWidget().refresh_data()
\ No newline at end of file
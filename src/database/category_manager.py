@@ -28,13 +28,174 @@ Dependencies:
     - csv: For reading category data from CSV files
     - os: For file path operations
     - database.db_manager: For database persistence
+    - pandas (optional): Fast path for parsing very large CSV files
 """
 
 import csv
+import functools
+import io
 import os
-from typing import Dict, List
+import threading
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 from src.database.db_manager import DatabaseManager
 
+# Files smaller than this are parsed with the csv module; importing pandas
+# only pays off for large imports (roughly 10k+ rows)
+_PANDAS_MIN_BYTES = 512 * 1024
+
+# Fallback categories used when data/categories.csv cannot be read. Frozen so
+# every fallback shares one structure instead of rebuilding the literal.
+_DEFAULT_CATEGORIES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'Housing': ('Rent/Mortgage', 'Property Tax', 'HOA Fees', 'Home Insurance', 'Maintenance', 'Repairs', 'Special Assessment', 'Additional Principal', 'Escrow', 'Reserves', 'Labor'),
+    'Utilities': ('Electric', 'Gas', 'Water', 'Internet', 'Phone', 'Cable/Streaming', 'Cell Phone', 'Transit', 'Bus Pass'),
+    'Transportation': ('Car Payment', 'Gas/Fuel', 'Insurance', 'Maintenance', 'Public Transit', 'Parking', 'Tolls', 'Rideshare', 'Repairs', 'DMV', 'Parts', 'Tires', 'Oil Changes', 'Car Wash'),
+    'Food & Dining': ('Groceries', 'Restaurants', 'Coffee Shops', 'Food Delivery', 'Work Meals', 'Take Out', 'Dining Out', 'Party', 'Guests', 'Special Occasion'),
+    'Healthcare': ('Insurance Premiums', 'Doctor Visits', 'Prescriptions', 'Dental', 'Vision', 'Mental Health', 'Primary Care', 'Specialists', 'Vitamins', 'Co-Pay', 'Medical Subscriptions', 'Hygiene', 'Family', 'Haircut'),
+    'Insurance': ('Life Insurance', 'Disability', 'Umbrella Policy', 'Home Insurance', 'Car Insurance'),
+    'Debt Payments': ('Credit Cards', 'Student Loans', 'Personal Loans'),
+    'Savings & Investments': ('Emergency Fund', 'Retirement (401k/IRA)', 'Brokerage', 'HSA/FSA'),
+    'Personal': ('Clothing', 'Haircuts', 'Gym/Fitness', 'Subscriptions', 'Hobbies', 'Shoes', 'Beauty/Grooming'),
+    'Family & Children': ('Childcare', 'Education', 'Activities', 'Supplies', 'Classes', 'Baby Sitting', 'Children\'s Clothing', 'Diapers', 'Toys', 'Food/Snacks'),
+    'Entertainment': ('Movies', 'Events', 'Gaming', 'Sports', 'Vacations', 'Streaming Services', 'Concerts', 'Hobbies'),
+    'Gifts & Donations': ('Gifts', 'Charitable Donations', 'Religious Giving', 'Gatherings', 'Parties'),
+    'Business': ('Office Supplies', 'Software', 'Professional Services', 'Travel', 'Business Meals'),
+    'Pets': ('Pet Food', 'Veterinary', 'Pet Supplies', 'Grooming', 'Pet Insurance'),
+    'Home & Garden': ('Home Necessities', 'Home Décor', 'House Cleaning', 'Bathroom', 'Bedrooms', 'Kitchen', 'Tools/Hardware', 'Storage', 'Homeware', 'Garden Supplies'),
+    'Vacation & Travel': ('Flights/Travel', 'Rental Car', 'Airport', 'Taxi', 'Food', 'Eating Out', 'Gas', 'Activities', 'Lodging', 'Fees', 'Shopping', 'Necessities'),
+    'Miscellaneous': ('Other', 'Uncategorized', 'Cash Withdrawals', 'Fees', 'Reversal', 'Taxes'),
+    'Income': ('Primary Salary', 'Secondary Salary', 'Bonus', 'Investment Income', 'Side Hustle', 'Other Income')
+})
+
+# Lazily imported pandas module (None = not tried yet, False = unavailable)
+_pandas = None
+
+# Category SQL is kept in module constants so every call hands sqlite3 the
+# identical string and hits its per-connection prepared-statement cache
+_SQL_SELECT_CATEGORIES = """
+    SELECT category, subcategory FROM categories
+    ORDER BY category, subcategory
+"""
+_SQL_INSERT_CATEGORY = """
+    INSERT INTO categories (category, subcategory)
+    VALUES (?, ?)
+"""
+_SQL_INSERT_CATEGORY_IF_MISSING = """
+    INSERT OR IGNORE INTO categories (category, subcategory)
+    VALUES (?, ?)
+"""
+# The delete statements carry their own usage check, so checking and
+# deleting happen atomically in one round-trip
+_SQL_DELETE_UNUSED_SUBCATEGORY = """
+    DELETE FROM categories
+    WHERE category = ? AND subcategory = ?
+      AND NOT EXISTS (SELECT 1 FROM expenses WHERE category = ? AND subcategory = ?)
+"""
+_SQL_DELETE_UNUSED_CATEGORY = """
+    DELETE FROM categories
+    WHERE category = ?
+      AND NOT EXISTS (SELECT 1 FROM expenses WHERE category = ?)
+      AND NOT EXISTS (SELECT 1 FROM budget_estimates WHERE category = ?)
+"""
+
+# Characters that can pad a CSV field
+_WS = frozenset(' \t\r\n')
+
+
+def _fast_strip(s: str) -> str:
+    """Strip surrounding whitespace, skipping the copy for already-clean fields."""
+    if not s or (s[0] not in _WS and s[-1] not in _WS):
+        return s
+    return s.strip()
+
+
+def _add_pair(categories: Dict[str, List[str]], category: str, subcategory: str):
+    """Add a category/subcategory pair, skipping blanks and duplicates."""
+    # Only process rows with valid data
+    if category and subcategory:
+        if category not in categories:
+            categories[category] = []
+        # Avoid duplicate subcategories
+        if subcategory not in categories[category]:
+            categories[category].append(subcategory)
+
+
+def _locked(method):
+    """Run a CategoryManager method while holding the instance's writer lock."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _get_pandas():
+    """
+    Import pandas on first use.
+
+    Returns:
+        The pandas module, or None if it is not installed
+    """
+    global _pandas
+    if _pandas is None:
+        try:
+            import pandas
+        except ImportError:
+            _pandas = False
+        else:
+            _pandas = pandas
+    return _pandas or None
+
+
+def _parse_rows_pandas(raw: bytes, encoding: str, pd) -> Dict[str, List[str]]:
+    """
+    Parse category rows with pandas' C CSV parser.
+    """
+    try:
+        df = pd.read_csv(io.BytesIO(raw), usecols=['Category', 'Sub Category'],
+                         encoding=encoding, dtype=str, na_filter=False)
+    except UnicodeDecodeError:
+        raise
+    except ValueError:
+        # Required columns are missing
+        return {}
+
+    df = df.apply(lambda column: column.str.strip())
+    df = df[(df['Category'] != '') & (df['Sub Category'] != '')].drop_duplicates()
+    return {category: group['Sub Category'].tolist()
+            for category, group in df.groupby('Category', sort=False)}
+
+
+def _parse_rows(raw: bytes, encoding: str) -> Dict[str, List[str]]:
+    """
+    Parse the categories CSV into a {category: [subcategories]} dictionary.
+
+    Large files are parsed with pandas when it is installed; everything
+    else goes through csv.DictReader.
+
+    Args:
+        raw (bytes): Raw file contents
+        encoding (str): Encoding to decode the file with
+
+    Returns:
+        Dict[str, List[str]]: Parsed categories in file order
+
+    Raises:
+        UnicodeDecodeError: If the file is not valid in the given encoding
+    """
+    if len(raw) >= _PANDAS_MIN_BYTES:
+        pd = _get_pandas()
+        if pd:
+            return _parse_rows_pandas(raw, encoding, pd)
+
+    categories = {}
+    for row in csv.DictReader(io.StringIO(raw.decode(encoding), newline='')):
+        _add_pair(categories,
+                  _fast_strip(row.get('Category') or ''),
+                  _fast_strip(row.get('Sub Category') or ''))
+    return categories
+
+
 class CategoryManager:
     """
     Manages categories and subcategories from CSV file and database.
@@ -49,38 +210,74 @@ class CategoryManager:
     3. User additions are persisted to database but not CSV
     4. Categories cannot be deleted if they're used in expenses
 
+    The in-memory data is copy-on-write: writers build a new dictionary
+    under a lock and swap it in, so readers always see a consistent
+    snapshot without locking.
+
     Attributes:
-        _categories_data (Dict[str, List[str]]): In-memory category storage
+        _categories_data (Dict[str, List[str]]): In-memory category storage, never mutated once published
                                                Format: {category: [subcategory1, subcategory2, ...]}
+        _snapshot (MappingProxyType): Read-only view of _categories_data handed to callers
+        _lock (threading.RLock): Serializes writers (sync, mutations, refresh)
     """
 
     def __init__(self):
         """
         Initialize the category manager.
 
-        This constructor loads categories from the CSV file and syncs
-        them with the database. It handles encoding issues gracefully
-        and falls back to default categories if the CSV cannot be read.
+        This constructor only loads categories from the CSV file. The
+        database sync is deferred until the first method that needs the
+        full category set, so constructing the manager never blocks on
+        the database. It handles encoding issues gracefully and falls
+        back to default categories if the CSV cannot be read.
         """
+        self._lock = threading.RLock()
         self._categories_data = {}
+        self._snapshot = MappingProxyType(self._categories_data)
+        self._synced = False
         self._load_categories()
 
+    def _publish(self, data: Dict[str, List[str]]):
+        """
+        Swap in a new category dictionary.
+
+        Callers must hold self._lock and must not mutate data afterwards.
+        """
+        self._categories_data = data
+        self._snapshot = MappingProxyType(data)
+
+    def _replace_categories(self, updates: Dict[str, Optional[List[str]]]):
+        """
+        Publish a copy of the current data with some categories replaced.
+
+        Args:
+            updates (Dict[str, Optional[List[str]]]): New subcategory lists by
+                category; None removes the category
+        """
+        data = dict(self._categories_data)
+        for category, subcategories in updates.items():
+            if subcategories is None:
+                data.pop(category, None)
+            else:
+                data[category] = subcategories
+        self._publish(data)
+
     def _load_categories(self):
         """
-        Load categories from CSV file and sync with database.
+        Load categories from CSV file.
 
         This method attempts to load categories from the CSV file using
-        multiple encoding strategies. If successful, it syncs the data
-        with the database. If the CSV file cannot be read, it falls back
-        to a predefined set of default categories.
+        multiple encoding strategies. If the CSV file cannot be read, it
+        falls back to a predefined set of default categories. Syncing with
+        the database happens separately in _ensure_synced().
 
         The loading process:
         1. Try to read CSV with multiple encodings (UTF-8, Latin1, etc.)
         2. Parse category/subcategory pairs from CSV
-        3. Ensure database table exists
-        4. Sync CSV data to database
-        5. Load any additional database-only categories
+        3. Publish the parsed dictionary once, so readers never see a
+           partially loaded one
         """
+        data = {}
         # Load from CSV first
         # Navigate from src/database/ -> project_root/data/categories.csv
         project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
@@ -92,51 +289,53 @@ class CategoryManager:
                 # Common encodings ordered by likelihood of success
                 encodings = ['utf-8', 'utf-8-sig', 'latin1', 'cp1252']
 
+                # Read the raw bytes once; each encoding attempt only re-decodes them
+                with open(categories_file, 'rb') as file:
+                    raw = file.read()
+
                 for encoding in encodings:
                     try:
-                        with open(categories_file, 'r', encoding=encoding) as file:
-                            reader = csv.DictReader(file)
-
-                            # Clear existing data before loading
-                            self._categories_data = {}
-
-                            # Parse each row from the CSV file
-                            for row in reader:
-                                category = row.get('Category', '').strip()
-                                subcategory = row.get('Sub Category', '').strip()
-
-                                # Only process rows with valid data
-                                if category and subcategory:
-                                    if category not in self._categories_data:
-                                        self._categories_data[category] = []
-                                    # Avoid duplicate subcategories
-                                    if subcategory not in self._categories_data[category]:
-                                        self._categories_data[category].append(subcategory)
-
-                        print(f"Loaded {len(self._categories_data)} categories from {categories_file} using {encoding} encoding")
+                        data = _parse_rows(raw, encoding)
+
+                        print(f"Loaded {len(data)} categories from {categories_file} using {encoding} encoding")
                         break  # Success, exit the encoding loop
 
                     except UnicodeDecodeError:
                         continue  # Try next encoding
 
                 # If we get here without breaking, all encodings failed
-                if not self._categories_data:
+                if not data:
                     raise Exception("Could not decode file with any supported encoding")
 
             except Exception as e:
                 print(f"Error loading categories from CSV: {e}")
-                self._load_default_categories()
+                data = self._load_default_categories()
         else:
             print("Categories.csv not found, using default categories")
-            self._load_default_categories()
+            data = self._load_default_categories()
 
-        # Ensure database table exists and sync
-        self._ensure_categories_table()
-        self._sync_with_database()
+        with self._lock:
+            self._publish(data)
+            # The in-memory data no longer reflects the database
+            self._synced = False
 
-    def _load_default_categories(self):
+    def _ensure_synced(self):
         """
-        Load default categories as fallback.
+        Sync with the database the first time it is needed.
+
+        Creates the categories table if necessary and merges CSV and
+        database categories. Subsequent calls are a single flag check.
+        """
+        if not self._synced:
+            with self._lock:
+                if not self._synced:
+                    self._ensure_categories_table()
+                    self._sync_with_database()
+                    self._synced = True
+
+    def _load_default_categories(self) -> Dict[str, List[str]]:
+        """
+        Build the default categories as fallback.
 
         This method provides a comprehensive set of default categories
         when the CSV file cannot be loaded. These categories cover
@@ -149,27 +348,12 @@ class CategoryManager:
         - Healthcare: Medical, dental, prescriptions
         - Transportation: Vehicle costs, gas, parking
         - And many more...
+
+        Returns:
+            Dict[str, List[str]]: A fresh copy of the default categories
         """
-        self._categories_data = {
-            'Housing': ['Rent/Mortgage', 'Property Tax', 'HOA Fees', 'Home Insurance', 'Maintenance', 'Repairs', 'Special Assessment', 'Additional Principal', 'Escrow', 'Reserves', 'Labor'],
-            'Utilities': ['Electric', 'Gas', 'Water', 'Internet', 'Phone', 'Cable/Streaming', 'Cell Phone', 'Transit', 'Bus Pass'],
-            'Transportation': ['Car Payment', 'Gas/Fuel', 'Insurance', 'Maintenance', 'Public Transit', 'Parking', 'Tolls', 'Rideshare', 'Repairs', 'DMV', 'Parts', 'Tires', 'Oil Changes', 'Car Wash'],
-            'Food & Dining': ['Groceries', 'Restaurants', 'Coffee Shops', 'Food Delivery', 'Work Meals', 'Take Out', 'Dining Out', 'Party', 'Guests', 'Special Occasion'],
-            'Healthcare': ['Insurance Premiums', 'Doctor Visits', 'Prescriptions', 'Dental', 'Vision', 'Mental Health', 'Primary Care', 'Specialists', 'Vitamins', 'Co-Pay', 'Medical Subscriptions', 'Hygiene', 'Family', 'Haircut'],
-            'Insurance': ['Life Insurance', 'Disability', 'Umbrella Policy', 'Home Insurance', 'Car Insurance'],
-            'Debt Payments': ['Credit Cards', 'Student Loans', 'Personal Loans'],
-            'Savings & Investments': ['Emergency Fund', 'Retirement (401k/IRA)', 'Brokerage', 'HSA/FSA'],
-            'Personal': ['Clothing', 'Haircuts', 'Gym/Fitness', 'Subscriptions', 'Hobbies', 'Shoes', 'Beauty/Grooming'],
-            'Family & Children': ['Childcare', 'Education', 'Activities', 'Supplies', 'Classes', 'Baby Sitting', 'Children\'s Clothing', 'Diapers', 'Toys', 'Food/Snacks'],
-            'Entertainment': ['Movies', 'Events', 'Gaming', 'Sports', 'Vacations', 'Streaming Services', 'Concerts', 'Hobbies'],
-            'Gifts & Donations': ['Gifts', 'Charitable Donations', 'Religious Giving', 'Gatherings', 'Parties'],
-            'Business': ['Office Supplies', 'Software', 'Professional Services', 'Travel', 'Business Meals'],
-            'Pets': ['Pet Food', 'Veterinary', 'Pet Supplies', 'Grooming', 'Pet Insurance'],
-            'Home & Garden': ['Home Necessities', 'Home Décor', 'House Cleaning', 'Bathroom', 'Bedrooms', 'Kitchen', 'Tools/Hardware', 'Storage', 'Homeware', 'Garden Supplies'],
-            'Vacation & Travel': ['Flights/Travel', 'Rental Car', 'Airport', 'Taxi', 'Food', 'Eating Out', 'Gas', 'Activities', 'Lodging', 'Fees', 'Shopping', 'Necessities'],
-            'Miscellaneous': ['Other', 'Uncategorized', 'Cash Withdrawals', 'Fees', 'Reversal', 'Taxes'],
-            'Income': ['Primary Salary', 'Secondary Salary', 'Bonus', 'Investment Income', 'Side Hustle', 'Other Income']
-        }
+        return {category: list(subcategories)
+                for category, subcategories in _DEFAULT_CATEGORIES.items()}
 
     def _ensure_categories_table(self):
         """
@@ -207,56 +391,52 @@ class CategoryManager:
         This method performs a two-way sync between the in-memory
         categories and the database:
 
-        1. Insert all CSV/default categories into database (if not exists)
-        2. Load any additional categories from database (user-added)
+        1. Read the (category, subcategory) pairs already in the database
+        2. Insert only the CSV/default pairs that are missing
+        3. Merge any additional categories from database (user-added)
 
-        This ensures that both CSV-based and user-added categories
-        are available in the application.
+        On a warm database step 2 inserts nothing, so a steady-state
+        startup costs a single SELECT regardless of the CSV size.
         """
         try:
             with DatabaseManager() as db:
-                # First, insert all CSV categories into database if they don't exist
-                for category, subcategories in self._categories_data.items():
-                    for subcategory in subcategories:
-                        try:
-                            db.execute('''
-                                INSERT OR IGNORE INTO categories (category, subcategory)
-                                VALUES (?, ?)
-                            ''', (category, subcategory))
-                        except Exception as e:
-                            print(f"Error inserting category {category}/{subcategory}: {e}")
-
-                # Then load any additional categories from database
-                db_categories = db.execute('''
-                    SELECT category, subcategory FROM categories
-                    ORDER BY category, subcategory
-                ''').fetchall()
-
-                # Add database categories to in-memory structure
+                # Read everything the database already knows about in one query
+                db_categories = db.execute(_SQL_SELECT_CATEGORIES).fetchall()
+                existing = {(row['category'], row['subcategory']) for row in db_categories}
+
+                # Only insert the CSV categories that are not in the database yet
+                csv_pairs = [
+                    (category, subcategory)
+                    for category, subcategories in self._categories_data.items()
+                    for subcategory in subcategories
+                ]
+                missing = [pair for pair in csv_pairs if pair not in existing]
+                if missing:
+                    db.executemany(_SQL_INSERT_CATEGORY_IF_MISSING, missing)
+
+                # Add database-only categories to a fresh copy of the data
+                data = {category: list(subcategories) for category, subcategories in self._categories_data.items()}
                 for row in db_categories:
-                    category = row['category']
-                    subcategory = row['subcategory']
-
-                    if category not in self._categories_data:
-                        self._categories_data[category] = []
-                    if subcategory not in self._categories_data[category]:
-                        self._categories_data[category].append(subcategory)
+                    _add_pair(data, row['category'], row['subcategory'])
+                self._publish(data)
 
         except Exception as e:
             print(f"Error syncing with database: {e}")
 
-    def get_categories(self) -> Dict[str, List[str]]:
+    def get_categories(self) -> Mapping[str, List[str]]:
         """
         Get all categories and subcategories.
 
-        Returns a copy of the internal categories dictionary to prevent
-        external modification of the internal data structure.
+        Returns a read-only view of the current snapshot. Later changes
+        publish a new snapshot, so the returned mapping never changes
+        underneath the caller and no copy is needed.
 
         Returns:
-            Dict[str, List[str]]: Dictionary mapping categories to subcategory lists
+            Mapping[str, List[str]]: Mapping of categories to subcategory lists
                                 Format: {category: [subcategory1, subcategory2, ...]}
         """
-        return self._categories_data.copy()
+        self._ensure_synced()
+        return self._snapshot
 
     def get_category_names(self) -> List[str]:
         """
@@ -265,7 +445,9 @@ class CategoryManager:
         Returns:
             List[str]: Sorted list of all main category names
         """
-        return sorted(self._categories_data.keys())
+        self._ensure_synced()
+        data = self._categories_data
+        return sorted(data.keys())
 
     def get_subcategories(self, category: str) -> List[str]:
         """
@@ -278,8 +460,11 @@ class CategoryManager:
             List[str]: Copy of subcategory list for the given category
                       Empty list if category doesn't exist
         """
-        return self._categories_data.get(category, []).copy()
+        self._ensure_synced()
+        data = self._categories_data
+        return list(data.get(category, []))
 
+    @_locked
     def add_category(self, category: str) -> bool:
         """
         Add a new category.
@@ -293,6 +478,7 @@ class CategoryManager:
         Returns:
             bool: True if category was added successfully, False if it already exists or an error occurred
         """
+        self._ensure_synced()
         if not category or category in self._categories_data:
             return False
 
@@ -300,19 +486,17 @@ class CategoryManager:
             with DatabaseManager() as db:
                 # Add category with a default subcategory
                 default_subcategory = f"{category} (General)"
-                db.execute('''
-                    INSERT INTO categories (category, subcategory)
-                    VALUES (?, ?)
-                ''', (category, default_subcategory))
+                db.execute(_SQL_INSERT_CATEGORY, (category, default_subcategory))
 
                 # Add to in-memory storage
-                self._categories_data[category] = [default_subcategory]
+                self._replace_categories({category: [default_subcategory]})
                 return True
 
         except Exception as e:
             print(f"Error adding category {category}: {e}")
             return False
 
+    @_locked
     def add_subcategory(self, category: str, subcategory: str) -> bool:
         """
         Add a new subcategory to an existing category.
@@ -324,32 +508,28 @@ class CategoryManager:
         Returns:
             bool: True if subcategory was added successfully, False otherwise
         """
+        self._ensure_synced()
         if not category or not subcategory:
             return False
 
-        # Create category if it doesn't exist
-        if category not in self._categories_data:
-            self._categories_data[category] = []
-
         # Check if subcategory already exists
-        if subcategory in self._categories_data[category]:
+        subcategories = self._categories_data.get(category, [])
+        if subcategory in subcategories:
             return False
 
         try:
             with DatabaseManager() as db:
-                db.execute('''
-                    INSERT INTO categories (category, subcategory)
-                    VALUES (?, ?)
-                ''', (category, subcategory))
+                db.execute(_SQL_INSERT_CATEGORY, (category, subcategory))
 
-                # Add to in-memory storage
-                self._categories_data[category].append(subcategory)
+                # Add to in-memory storage (creating the category if needed)
+                self._replace_categories({category: subcategories + [subcategory]})
                 return True
 
         except Exception as e:
             print(f"Error adding subcategory {category}/{subcategory}: {e}")
             return False
 
+    @_locked
     def remove_subcategory(self, category: str, subcategory: str) -> bool:
         """
         Remove a subcategory (only if not used in expenses).
@@ -365,33 +545,23 @@ class CategoryManager:
         Returns:
             bool: True if removed successfully, False if in use or error occurred
         """
+        self._ensure_synced()
         if category not in self._categories_data or subcategory not in self._categories_data[category]:
             return False
 
         try:
             with DatabaseManager() as db:
-                # Check if subcategory is used in expenses
-                usage_count = db.execute('''
-                    SELECT COUNT(*) as count FROM expenses
-                    WHERE category = ? AND subcategory = ?
-                ''', (category, subcategory)).fetchone()
+                # Remove from database unless the subcategory is used in expenses
+                cursor = db.execute(_SQL_DELETE_UNUSED_SUBCATEGORY,
+                                    (category, subcategory, category, subcategory))
 
-                if usage_count and usage_count['count'] > 0:
+                if cursor.rowcount == 0:
                     print(f"Cannot remove subcategory {category}/{subcategory}: still in use")
                     return False
 
-                # Remove from database
-                db.execute('''
-                    DELETE FROM categories 
-                    WHERE category = ? AND subcategory = ?
-                ''', (category, subcategory))
-
-                # Remove from local data
-                self._categories_data[category].remove(subcategory)
-
-                # Remove category if it has no subcategories
-                if not self._categories_data[category]:
-                    del self._categories_data[category]
+                # Remove from local data, dropping the category if it has no subcategories
+                remaining = [name for name in self._categories_data[category] if name != subcategory]
+                self._replace_categories({category: remaining or None})
 
                 return True
 
@@ -399,6 +569,7 @@ class CategoryManager:
             print(f"Error removing subcategory {category}/{subcategory}: {e}")
             return False
 
+    @_locked
     def rename_category(self, old_name: str, new_name: str) -> bool:
         """
         Rename an existing category.
@@ -413,6 +584,7 @@ class CategoryManager:
         Returns:
             bool: True if renamed successfully, False otherwise
         """
+        self._ensure_synced()
         if not old_name or not new_name:
             return False
             
@@ -447,13 +619,14 @@ class CategoryManager:
                 ''', (new_name, old_name))
                 
                 # Update in-memory storage
-                self._categories_data[new_name] = self._categories_data.pop(old_name)
+                self._replace_categories({old_name: None, new_name: self._categories_data[old_name]})
                 return True
                 
         except Exception as e:
             print(f"Error renaming category {old_name} to {new_name}: {e}")
             return False
 
+    @_locked
     def rename_subcategory(self, category: str, old_name: str, new_name: str) -> bool:
         """
         Rename an existing subcategory.
@@ -469,6 +642,7 @@ class CategoryManager:
         Returns:
             bool: True if renamed successfully, False otherwise
         """
+        self._ensure_synced()
         if not category or not old_name or not new_name:
             return False
             
@@ -506,14 +680,16 @@ class CategoryManager:
                 ''', (new_name, category, old_name))
                 
                 # Update in-memory storage
-                idx = self._categories_data[category].index(old_name)
-                self._categories_data[category][idx] = new_name
+                self._replace_categories({
+                    category: [new_name if name == old_name else name for name in self._categories_data[category]]
+                })
                 return True
                 
         except Exception as e:
             print(f"Error renaming subcategory {category}/{old_name} to {new_name}: {e}")
             return False
 
+    @_locked
     def delete_category(self, category: str) -> bool:
         """
         Delete a category (only if not used by any expenses).
@@ -528,39 +704,21 @@ class CategoryManager:
         Returns:
             bool: True if deleted successfully, False if in use or error occurred
         """
+        self._ensure_synced()
         if category not in self._categories_data:
             return False
             
         try:
             with DatabaseManager() as db:
-                # Check if category is used in expenses
-                usage_count = db.execute('''
-                    SELECT COUNT(*) as count FROM expenses
-                    WHERE category = ?
-                ''', (category,)).fetchone()
-                
-                if usage_count and usage_count['count'] > 0:
-                    print(f"Cannot delete category '{category}': still in use by {usage_count['count']} expense(s)")
-                    return False
-                
-                # Check if category is used in budget estimates
-                budget_count = db.execute('''
-                    SELECT COUNT(*) as count FROM budget_estimates
-                    WHERE category = ?
-                ''', (category,)).fetchone()
-                
-                if budget_count and budget_count['count'] > 0:
-                    print(f"Cannot delete category '{category}': still in use by {budget_count['count']} budget estimate(s)")
+                # Remove from database unless used by expenses or budget estimates
+                cursor = db.execute(_SQL_DELETE_UNUSED_CATEGORY, (category, category, category))
+
+                if cursor.rowcount == 0:
+                    print(f"Cannot delete category '{category}': still in use by expenses or budget estimates")
                     return False
                 
-                # Remove from database
-                db.execute('''
-                    DELETE FROM categories 
-                    WHERE category = ?
-                ''', (category,))
-                
                 # Remove from in-memory storage
-                del self._categories_data[category]
+                self._replace_categories({category: None})
                 return True
                 
         except Exception as e:
@@ -580,15 +738,17 @@ class CategoryManager:
         """
         return self.remove_subcategory(category, subcategory)
 
+    @_locked
     def refresh_from_database(self):
         """
         Refresh categories from database.
 
         This method reloads all category data from the database,
         useful when categories may have been modified externally.
+        The current snapshot stays published until the reload replaces it.
         """
-        self._categories_data = {}
         self._load_categories()
+        self._ensure_synced()
 
     def refresh(self):
         """
@@ -609,8 +769,9 @@ class CategoryManager:
         Returns:
             bool: True if the combination exists, False otherwise
         """
-        return (category in self._categories_data and
-                subcategory in self._categories_data[category])
+        self._ensure_synced()
+        data = self._categories_data
+        return category in data and subcategory in data[category]
 
     def category_exists(self, category: str) -> bool:
         """
@@ -622,7 +783,9 @@ class CategoryManager:
         Returns:
             bool: True if the category exists, False otherwise
         """
-        return category in self._categories_data
+        self._ensure_synced()
+        data = self._categories_data
+        return category in data
 
     def subcategory_exists(self, category: str, subcategory: str) -> bool:
         """
@@ -635,8 +798,9 @@ class CategoryManager:
         Returns:
             bool: True if the subcategory exists in the category, False otherwise
         """
-        return (category in self._categories_data and
-                subcategory in self._categories_data[category])
+        self._ensure_synced()
+        data = self._categories_data
+        return category in data and subcategory in data[category]
 
 
 # Global instance
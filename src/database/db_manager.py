@@ -33,6 +33,7 @@ Dependencies:
 
 import sqlite3
 import os
+from contextlib import contextmanager
 from datetime import datetime
 from typing import List, Dict, Tuple, Optional
 import json
@@ -96,6 +97,20 @@ class DatabaseManager:
                     cls._instance = super(DatabaseManager, cls).__new__(cls)
         return cls._instance
 
+    @classmethod
+    def instance(cls) -> "DatabaseManager":
+        """
+        Return the shared DatabaseManager.
+
+        Equivalent to DatabaseManager(), but makes it explicit at the call
+        site that the application-wide connection (and its statement cache
+        and PRAGMA settings) is reused rather than a new one opened.
+
+        Returns:
+            DatabaseManager: The singleton instance
+        """
+        return cls()
+
     def __init__(self, db_path: str = "budget_tracker.db"):
         """
         Initialize database connection and settings.
@@ -115,6 +130,10 @@ class DatabaseManager:
             self.db_path = db_path
             self.conn = None
             self.cursor = None
+            # Row changes made by connections that have since been closed
+            self._closed_changes = 0
+            # Serializes writer() blocks on the shared connection
+            self._write_lock = threading.RLock()
             self.initialized = True
 
     def connect(self):
@@ -123,7 +142,11 @@ class DatabaseManager:
 
         This method creates a connection to the SQLite database with
         settings optimized for concurrent access and performance:
-        - WAL mode: Allows concurrent reads during writes
+        - WAL mode: Allows concurrent reads during writes (skipped for
+          databases on a network share, where WAL is not supported)
+        - synchronous=NORMAL: Skips the per-commit fsync (safe with WAL)
+        - wal_autocheckpoint: Checkpoints every 1000 pages
+        - In-memory temp storage and a larger page cache
         - Busy timeout: Handles database locking gracefully
         - Row factory: Enables dictionary-style result access
         """
@@ -139,8 +162,22 @@ class DatabaseManager:
             self.conn.row_factory = sqlite3.Row
 
             # Enable WAL (Write-Ahead Logging) mode for better concurrency
-            # This allows multiple readers while one writer is active
-            self.conn.execute("PRAGMA journal_mode=WAL")
+            # This allows multiple readers while one writer is active.
+            # WAL needs shared memory, which network filesystems do not
+            # provide, so databases on a share keep the rollback journal.
+            if not self._on_network_share(self.db_path):
+                self.conn.execute("PRAGMA journal_mode=WAL")
+
+                # In WAL mode NORMAL only syncs at checkpoints instead of on
+                # every commit, and is still safe against application crashes
+                self.conn.execute("PRAGMA synchronous=NORMAL")
+
+                # Keep the WAL file bounded by checkpointing every 1000 pages
+                self.conn.execute("PRAGMA wal_autocheckpoint=1000")
+
+            # Keep temporary tables/indices in memory and allow ~20 MB of page cache
+            self.conn.execute("PRAGMA temp_store=MEMORY")
+            self.conn.execute("PRAGMA cache_size=-20000")
 
             # Set busy timeout to handle locked database gracefully
             self.conn.execute("PRAGMA busy_timeout=30000")  # 30 seconds
@@ -148,6 +185,62 @@ class DatabaseManager:
             # Create cursor for executing SQL commands
             self.cursor = self.conn.cursor()
 
+    @staticmethod
+    def _on_network_share(db_path: str) -> bool:
+        """
+        Check whether a database path points at a network share.
+
+        Only UNC paths (\\\\server\\share) are detected; mapped drives and
+        network mounts look like local paths and are treated as local.
+        """
+        return os.path.abspath(db_path).startswith(('\\\\', '//'))
+
+    @contextmanager
+    def reader(self):
+        """
+        Open a private read connection for use off the GUI thread.
+
+        The singleton connection and cursor are shared by every tab and are
+        not safe to use from two threads at once, so background fetches
+        get their own short-lived connection. WAL mode lets it read while
+        the main connection writes.
+
+        Yields:
+            sqlite3.Connection: Connection with dictionary-style row access
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        conn.row_factory = sqlite3.Row
+        # Readers never write; fail loudly if one tries
+        conn.execute("PRAGMA query_only=ON")
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def writer(self):
+        """
+        Run a block of writes on the shared connection as one transaction.
+
+        Only one writer() block runs at a time. Changes left uncommitted by
+        earlier execute() calls are committed first, so the block can open
+        its own transaction (e.g. with BEGIN IMMEDIATE). The block is
+        committed when it exits normally and rolled back if it raises.
+
+        Yields:
+            sqlite3.Connection: The shared write connection
+        """
+        with self._write_lock:
+            self.connect()
+            if self.conn.in_transaction:
+                self.conn.commit()
+            try:
+                yield self.conn
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+
     def disconnect(self):
         """
         Safely close database connection and cleanup resources.
@@ -157,6 +250,7 @@ class DatabaseManager:
         """
         if self.conn:
             try:
+                self._closed_changes += self.conn.total_changes
                 self.conn.close()
             except:
                 # Ignore errors during connection closure
@@ -166,6 +260,32 @@ class DatabaseManager:
                 self.conn = None
                 self.cursor = None
 
+    @property
+    def data_version(self) -> int:
+        """
+        Monotonic counter of rows inserted, updated or deleted through this manager.
+
+        Survives disconnect()/connect() cycles, so callers can remember the
+        value and later compare it to detect whether any data changed.
+
+        Returns:
+            int: Total number of row changes so far
+        """
+        open_changes = self.conn.total_changes if self.conn else 0
+        return self._closed_changes + open_changes
+
+    def record_external_changes(self, count):
+        """
+        Count row changes made on a private connection towards data_version.
+
+        Workers that write through their own sqlite3 connection call this
+        (on the GUI thread) once their transaction has committed.
+
+        Args:
+            count (int): Number of rows the private connection changed
+        """
+        self._closed_changes += count
+
     def execute(self, query, params=None):
         """
         Execute SQL query with automatic connection management.
@@ -208,6 +328,24 @@ class DatabaseManager:
                 # Re-raise other operational errors
                 raise
 
+    def executemany(self, query, seq_of_params):
+        """
+        Execute SQL query once per parameter tuple with automatic connection management.
+
+        The statement is prepared once by sqlite and re-bound for every row,
+        which is considerably cheaper than calling execute() in a loop.
+
+        Args:
+            query (str): SQL query string to execute
+            seq_of_params (iterable): Sequence of parameter tuples
+
+        Returns:
+            sqlite3.Cursor: Cursor used for the batch
+        """
+        # Ensure we have an active database connection
+        self.connect()
+        return self.cursor.executemany(query, seq_of_params)
+
     def commit(self):
         """
         Commit current transaction to database.
@@ -527,7 +665,9 @@ class DatabaseManager:
         self.conn.commit()
         self.disconnect()
 
-    def get_income(self, start_date: str = None, end_date: str = None, person: str = None):
+    def get_income(self, start_date: str = None, end_date: str = None, person: str = None,
+                   min_amount: float = None, max_amount: float = None, persons=None,
+                   search_text: str = None, search_fields=('description',)):
         """
         Retrieve income entries with optional filtering.
 
@@ -535,6 +675,12 @@ class DatabaseManager:
             start_date (str, optional): Filter start date (YYYY-MM-DD)
             end_date (str, optional): Filter end date (YYYY-MM-DD)
             person (str, optional): Filter by person name
+            min_amount (float, optional): Minimum amount (inclusive)
+            max_amount (float, optional): Maximum amount (inclusive)
+            persons (Iterable[str], optional): Only include these people
+            search_text (str, optional): Case-insensitive substring to look for
+            search_fields (Iterable[str]): Columns searched for search_text
+                ('description' and/or 'person')
 
         Returns:
             List[Dict]: List of income records as dictionaries
@@ -555,6 +701,25 @@ class DatabaseManager:
         if person:
             query += " AND person = ?"
             params.append(person)
+        if min_amount is not None:
+            query += " AND amount >= ?"
+            params.append(min_amount)
+        if max_amount is not None:
+            query += " AND amount <= ?"
+            params.append(max_amount)
+        if persons:
+            persons = list(persons)
+            query += f" AND person IN ({', '.join('?' * len(persons))})"
+            params.extend(persons)
+        if search_text:
+            # Escape LIKE wildcards so the text matches literally
+            pattern = "%" + (search_text.lower().replace("\\", "\\\\")
+                             .replace("%", "\\%").replace("_", "\\_")) + "%"
+            columns = [column for column in ('description', 'person') if column in search_fields]
+            if columns:
+                query += " AND (" + " OR ".join(
+                    f"LOWER({column}) LIKE ? ESCAPE '\\'" for column in columns) + ")"
+                params.extend([pattern] * len(columns))
 
         # Order by date descending (most recent first)
         query += " ORDER BY date DESC"
@@ -564,6 +729,39 @@ class DatabaseManager:
         self.disconnect()
         return results
 
+    def get_income_totals(self, start_date: str = None, end_date: str = None, person: str = None):
+        """
+        Sum income per person with the same filters as get_income().
+
+        Args:
+            start_date (str, optional): Filter start date (YYYY-MM-DD)
+            end_date (str, optional): Filter end date (YYYY-MM-DD), exclusive
+            person (str, optional): Filter by person name
+
+        Returns:
+            Dict[str, float]: Total income keyed by person
+        """
+        self.connect()
+        query = "SELECT person, SUM(amount) AS total FROM income WHERE 1=1"
+        params = []
+
+        if start_date:
+            query += " AND date >= ?"
+            params.append(start_date)
+        if end_date:
+            query += " AND date < ?"
+            params.append(end_date)
+        if person:
+            query += " AND person = ?"
+            params.append(person)
+
+        query += " GROUP BY person"
+
+        self.cursor.execute(query, params)
+        results = {row['person']: row['total'] for row in self.cursor.fetchall()}
+        self.disconnect()
+        return results
+
     # Expense Management Methods
     # ==========================
 
@@ -642,18 +840,36 @@ class DatabaseManager:
         Args:
             expenses (List[Dict]): List of expense dictionaries with required fields
         """
-        self.connect()
-        for expense in expenses:
-            self.cursor.execute(
+        self.add_expenses_bulk([
+            (expense['person'], expense['amount'], expense['date'],
+             expense['category'], expense['subcategory'],
+             expense.get('description'), expense.get('payment_method'),
+             expense.get('realized', False))
+            for expense in expenses
+        ])
+
+    def add_expenses_bulk(self, rows: List[Tuple]):
+        """
+        Insert pre-built expense rows with one executemany() in one transaction.
+
+        Args:
+            rows (List[Tuple]): (person, amount, date, category, subcategory,
+                description, payment_method, realized) tuples
+
+        Returns:
+            int: Number of expenses inserted
+        """
+        if not rows:
+            return 0
+        with self.writer() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
                 """INSERT INTO expenses (person, amount, date, category, subcategory, 
                    description, payment_method, realized) VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                (expense['person'], expense['amount'], expense['date'],
-                 expense['category'], expense['subcategory'],
-                 expense.get('description'), expense.get('payment_method'),
-                 expense.get('realized', False))
+                rows
             )
-        self.conn.commit()
         self.disconnect()
+        return len(rows)
 
     # Net worth methods
     def add_asset(self, person: str, asset_type: str, asset_name: str,
@@ -1283,9 +1499,21 @@ class DatabaseManager:
         self.disconnect()
         return results
 
-    def get_monthly_summary(self, year: int, month: int):
-        """Get monthly income and expense summary"""
-        self.connect()
+    def get_monthly_summary(self, year: int, month: int, conn: sqlite3.Connection = None):
+        """
+        Get monthly income and expense summary
+
+        Args:
+            year (int): Year to summarize
+            month (int): Month to summarize (1-12)
+            conn (sqlite3.Connection, optional): Private connection from reader();
+                the shared connection is used when omitted
+        """
+        if conn is None:
+            self.connect()
+            cursor = self.cursor
+        else:
+            cursor = conn.cursor()
 
         # Get income for the month
         income_query = """
@@ -1294,8 +1522,8 @@ class DatabaseManager:
             WHERE strftime('%Y', date) = ? AND strftime('%m', date) = ?
             GROUP BY person
         """
-        self.cursor.execute(income_query, (str(year), f"{month:02d}"))
-        income_results = self.cursor.fetchall()
+        cursor.execute(income_query, (str(year), f"{month:02d}"))
+        income_results = cursor.fetchall()
 
         # Get expenses for the month
         expense_query = """
@@ -1304,10 +1532,11 @@ class DatabaseManager:
             WHERE strftime('%Y', date) = ? AND strftime('%m', date) = ?
             GROUP BY person
         """
-        self.cursor.execute(expense_query, (str(year), f"{month:02d}"))
-        expense_results = self.cursor.fetchall()
+        cursor.execute(expense_query, (str(year), f"{month:02d}"))
+        expense_results = cursor.fetchall()
 
-        self.disconnect()
+        if conn is None:
+            self.disconnect()
 
         # Format results
         income_dict = {row[0]: row[1] for row in income_results}
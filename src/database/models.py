@@ -4,6 +4,30 @@ Database models and operations
 
 from datetime import datetime, date
 
+def _delete_ids(db, table, ids, batch_size=999):
+    """
+    Delete rows of table by id in one transaction.
+
+    Ids are deleted in IN-list batches of at most batch_size, which
+    keeps each statement within SQLite's default 999-parameter limit.
+
+    Returns:
+        int: Number of rows deleted
+    """
+    ids = list(ids)
+    deleted = 0
+    try:
+        for start in range(0, len(ids), batch_size):
+            batch = ids[start:start + batch_size]
+            placeholders = ",".join("?" * len(batch))
+            cursor = db.execute(f'DELETE FROM {table} WHERE id IN ({placeholders})', batch)
+            deleted += max(cursor.rowcount, 0)
+        db.commit()
+    except Exception:
+        db.conn.rollback()
+        raise
+    return deleted
+
 class IncomeModel:
     """Model for income operations"""
     
@@ -50,12 +74,17 @@ class IncomeModel:
         db.execute('DELETE FROM income WHERE id = ?', (income_id,))
         db.commit()
 
+    @staticmethod
+    def delete_many(db, income_ids, batch_size=999):
+        """Delete several income entries in one transaction and return the count"""
+        return _delete_ids(db, 'income', income_ids, batch_size)
+
 class ExpenseModel:
     """Model for expense operations"""
     
     @staticmethod
     def add(db, date_str, person, amount, category, subcategory, description, payment_method, realized=False):
-        """Add expense entry with validation"""
+        """Add expense entry with validation and return its id"""
         # Validate required fields
         if not date_str or not date_str.strip():
             raise ValueError("Date is required")
@@ -76,11 +105,12 @@ class ExpenseModel:
         description = description.strip() if description else ""
         payment_method = payment_method.strip() if payment_method else ""
 
-        db.execute('''
+        cursor = db.execute('''
             INSERT INTO expenses (date, person, amount, category, subcategory, description, payment_method, realized)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         ''', (date_str, person, amount, category, subcategory, description, payment_method, realized))
         db.commit()
+        return cursor.lastrowid
 
     @staticmethod
     def clear_all(db):
@@ -178,6 +208,70 @@ class ExpenseModel:
         db.execute('DELETE FROM expenses WHERE id = ?', (expense_id,))
         db.commit()
 
+    @staticmethod
+    def summarize_range(db, start_date, end_date):
+        """
+        Count and total expenses per person for start_date <= date < end_date.
+
+        Returns:
+            dict: person -> (count, total)
+        """
+        cursor = db.execute('''
+            SELECT person, COUNT(*) AS count, SUM(amount) AS total
+            FROM expenses
+            WHERE date >= ? AND date < ?
+            GROUP BY person
+        ''', (start_date, end_date))
+        return {row['person']: (row['count'], row['total']) for row in cursor.fetchall()}
+
+    @staticmethod
+    def delete_range(db, start_date, end_date):
+        """Delete every expense with start_date <= date < end_date and return how many"""
+        try:
+            cursor = db.execute('DELETE FROM expenses WHERE date >= ? AND date < ?',
+                                (start_date, end_date))
+            deleted = max(cursor.rowcount, 0)
+            db.commit()
+        except Exception:
+            db.conn.rollback()
+            raise
+        return deleted
+
+    @staticmethod
+    def iter_export_rows(db, start_date=None, end_date=None, person=None, category=None):
+        """
+        Yield (date, person, amount, category, subcategory, description,
+        payment_method) tuples with the same filters and order as
+        DatabaseManager.get_expenses(), streamed from a private read
+        connection instead of built into a list.
+        """
+        query = ('SELECT date, person, amount, category, subcategory, description, payment_method '
+                 'FROM expenses WHERE 1=1')
+        params = []
+        if start_date:
+            query += " AND date >= ?"
+            params.append(start_date)
+        if end_date:
+            query += " AND date < ?"
+            params.append(end_date)
+        if person:
+            query += " AND person = ?"
+            params.append(person)
+        if category:
+            query += " AND category = ?"
+            params.append(category)
+        query += " ORDER BY date DESC"
+
+        with db.reader() as conn:
+            # Plain tuples; the Row factory isn't needed for csv.writer
+            conn.row_factory = None
+            yield from conn.execute(query, params)
+
+    @staticmethod
+    def delete_many(db, expense_ids, batch_size=999):
+        """Delete several expense entries in one transaction and return the count"""
+        return _delete_ids(db, 'expenses', expense_ids, batch_size)
+
 class NetWorthModel:
     """Model for net worth operations"""
 
@@ -2,32 +2,58 @@
 Main window for the budget application
 """
 
-import os
+import importlib
 from PyQt6.QtWidgets import (
     QMainWindow, QTabWidget, QWidget, QVBoxLayout,
     QMenuBar, QMenu, QStatusBar, QMessageBox, QDialog, QLabel, QHBoxLayout
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QAction, QIcon, QPixmap, QFont
+from PyQt6.QtCore import Qt, QTimer, QThreadPool
+from PyQt6.QtGui import QAction, QIcon, QPixmap, QPixmapCache, QFont
 
-from src.gui.tabs.overview_tab import OverviewTab
-from src.gui.tabs.net_worth_tab import NetWorthTab
-from src.gui.tabs.budget_tab import BudgetTab
-from src.gui.tabs.presentation_tab import PresentationTab
-from src.gui.tabs.savings_tab import SavingsTab
-from src.gui.tabs.trends_tab import TrendsTab
+from src.database.db_manager import DatabaseManager
+from src.gui import zuo_rc
+from src.gui.tabs.base import RefreshableTab
+from src.gui.utils.refresh_worker import RefreshWorker, supports_background_refresh
 from src.gui.utils.styles import get_app_stylesheet
 
+
+def _lazy_tab(module_name, class_name, needs_db=False):
+    """Return a factory that imports the tab's module only when the tab is first built"""
+    def factory():
+        tab_class = getattr(importlib.import_module(module_name), class_name)
+        return tab_class(DatabaseManager()) if needs_db else tab_class()
+    return factory
+
+
 class MainWindow(QMainWindow):
+    # QPixmapCache key for the 200x200 logo shared by the About dialog and
+    # any other view that shows the logo
+    LOGO_200_CACHE_KEY = "zuo_logo_200"
+    
+    @staticmethod
+    def _logo_pixmap(data=zuo_rc.LOGO_PNG):
+        """Decode a logo embedded in zuo_rc (no filesystem access)"""
+        pixmap = QPixmap()
+        pixmap.loadFromData(data, "PNG")
+        return pixmap
+    
+    @classmethod
+    def logo_200_pixmap(cls):
+        """Return the 200x200 logo from QPixmapCache, decoding it on a miss"""
+        pixmap = QPixmapCache.find(cls.LOGO_200_CACHE_KEY)
+        if pixmap is None:
+            # The logo ships pre-scaled to 200x200, so no resampling is needed
+            pixmap = cls._logo_pixmap(zuo_rc.LOGO_200_PNG)
+            QPixmapCache.insert(cls.LOGO_200_CACHE_KEY, pixmap)
+        return pixmap
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Zuo - Budget Tracker")
         self.setGeometry(100, 100, 1400, 800)
         
         # Set window icon
-        icon_path = os.path.join(os.path.dirname(__file__), "resources", "zuo_logo.png")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        self.setWindowIcon(QIcon(self._logo_pixmap()))
         
         # Set up central widget and layout
         central_widget = QWidget()
@@ -38,24 +64,56 @@ class MainWindow(QMainWindow):
         self.tabs = QTabWidget()
         layout.addWidget(self.tabs)
         
-        # Create and add tabs
-        self.overview_tab = OverviewTab()
-        self.net_worth_tab = NetWorthTab()
-        self.budget_tab = BudgetTab()
-        self.presentation_tab = PresentationTab()
-        self.savings_tab = SavingsTab()
-        self.trends_tab = TrendsTab()
-        
-        self.tabs.addTab(self.overview_tab, "Budget Overview")
-        self.tabs.addTab(self.net_worth_tab, "Net Worth")
-        self.tabs.addTab(self.budget_tab, "Budget")
-        self.tabs.addTab(self.presentation_tab, "Monthly Presentation")
-        self.tabs.addTab(self.savings_tab, "Savings Goals")
-        self.tabs.addTab(self.trends_tab, "Trends")
-        
-        # Connect tab change signal
+        # Tabs are built the first time they are selected; until then each
+        # slot holds an empty placeholder tab.
+        # index -> (attribute name, tab label, factory)
+        self._tab_factories = {
+            0: ("overview_tab", "Budget Overview",
+                _lazy_tab("src.gui.tabs.overview_tab", "OverviewTab")),
+            1: ("net_worth_tab", "Net Worth",
+                _lazy_tab("src.gui.tabs.net_worth_tab", "NetWorthTab")),
+            2: ("budget_tab", "Budget",
+                _lazy_tab("src.gui.tabs.budget_tab", "BudgetTab")),
+            3: ("presentation_tab", "Monthly Presentation",
+                _lazy_tab("src.gui.tabs.presentation_tab", "PresentationTab", needs_db=True)),
+            4: ("savings_tab", "Savings Goals",
+                _lazy_tab("src.gui.tabs.savings_tab", "SavingsTab", needs_db=True)),
+            5: ("trends_tab", "Trends",
+                _lazy_tab("src.gui.tabs.trends_tab", "TrendsTab")),
+        }
+        self._tab_loaded = set()
+        # Add every page in one layout pass; currentChanged is connected
+        # further down, so the adds cannot trigger on_tab_changed
+        self.tabs.setUpdatesEnabled(False)
+        for index in sorted(self._tab_factories):
+            self.tabs.addTab(RefreshableTab(), self._tab_factories[index][1])
+        self.tabs.setUpdatesEnabled(True)
+        
+        # Background refresh workers still running (kept alive until they report back)
+        self._refresh_workers = set()
+        
+        # Database data_version each tab last refreshed at. A tab is dirty when
+        # the database has changed since then (or it has never refreshed).
+        self.db = DatabaseManager()
+        self._tab_versions = {}
+        
+        # Tab switches and F5 presses only schedule a refresh; bursts within
+        # the interval collapse into a single _do_refresh() call
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        self._force_refresh = False
+        
+        # Connect tab change signal (only after all tabs are added)
         self.tabs.currentChanged.connect(self.on_tab_changed)
         
+        # Build the first tab once the event loop is running
+        QTimer.singleShot(0, lambda: self.on_tab_changed(self.tabs.currentIndex()))
+        
+        # About dialog, built on first open
+        self._about_dialog = None
+        
         # Create menu bar
         self.create_menu_bar()
         
@@ -67,54 +125,106 @@ class MainWindow(QMainWindow):
         # Apply the proper light theme stylesheet
         self.setStyleSheet(get_app_stylesheet())
         
+        # Preload the 200x200 logo so every view reuses one decoded copy
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), 20480))
+        self.logo_200_pixmap()
+        
     def create_menu_bar(self):
         """Create the application menu bar"""
         menubar = self.menuBar()
         
-        # File menu
-        file_menu = menubar.addMenu("&File")
-        
-        export_action = QAction("&Export Data", self)
-        export_action.setShortcut("Ctrl+E")
-        export_action.triggered.connect(self.export_data)
-        file_menu.addAction(export_action)
-        
-        file_menu.addSeparator()
+        # (menu, label, shortcut, slot); a None label adds a separator
+        menu_actions = (
+            ("&File", "&Export Data", "Ctrl+E", self.export_data),
+            ("&File", None, None, None),
+            ("&File", "E&xit", "Ctrl+Q", self.close),
+            ("&Edit", "&Preferences", "Ctrl+,", self.show_preferences),
+            ("&View", "&Refresh", "F5", self.refresh_data),
+            ("&Help", "&About", None, self.show_about),
+        )
         
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
+        menus = {}
+        for menu_title, label, shortcut, slot in menu_actions:
+            menu = menus.get(menu_title)
+            if menu is None:
+                menu = menus[menu_title] = menubar.addMenu(menu_title)
+            if label is None:
+                menu.addSeparator()
+                continue
+            action = QAction(label, self)
+            if shortcut:
+                action.setShortcut(shortcut)
+            action.triggered.connect(slot)
+            menu.addAction(action)
         
-        # Edit menu
-        edit_menu = menubar.addMenu("&Edit")
+    def _load_tab(self, index):
+        """Replace the placeholder at index with the real tab, building it on first use"""
+        if index in self._tab_loaded or index not in self._tab_factories:
+            return
+        attr_name, label, factory = self._tab_factories[index]
+        tab = factory()
+        setattr(self, attr_name, tab)
         
-        preferences_action = QAction("&Preferences", self)
-        preferences_action.setShortcut("Ctrl+,")
-        preferences_action.triggered.connect(self.show_preferences)
-        edit_menu.addAction(preferences_action)
+        # Swapping the current page would emit currentChanged for a neighbour
+        self.tabs.blockSignals(True)
+        placeholder = self.tabs.widget(index)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, tab, label)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+        self._tab_loaded.add(index)
         
-        # View menu
-        view_menu = menubar.addMenu("&View")
+    def _refresh_tab(self, tab):
+        """
+        Refresh a tab's data.
         
-        refresh_action = QAction("&Refresh", self)
-        refresh_action.setShortcut("F5")
-        refresh_action.triggered.connect(self.refresh_data)
-        view_menu.addAction(refresh_action)
+        Tabs implementing fetch_args/fetch_data/apply_data are refreshed on the
+        global thread pool so the GUI thread never waits on the database; other
+        tabs fall back to a synchronous refresh_data().
+        """
+        if supports_background_refresh(tab):
+            self._tab_versions[tab] = self.db.data_version
+            worker = RefreshWorker(tab.fetch_data, *tab.fetch_args())
+            worker.signals.finished.connect(tab.apply_data)
+            worker.signals.finished.connect(lambda _result: self._refresh_workers.discard(worker))
+            worker.signals.failed.connect(lambda _message: self._refresh_workers.discard(worker))
+            self._refresh_workers.add(worker)
+            QThreadPool.globalInstance().start(worker)
+            return
+        tab.refresh_data()
+        self._tab_versions[tab] = self.db.data_version
         
-        # Help menu
-        help_menu = menubar.addMenu("&Help")
+    def is_tab_dirty(self, tab):
+        """Check whether the database changed since the tab last refreshed"""
+        return self._tab_versions.get(tab) != self.db.data_version
         
-        about_action = QAction("&About", self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+    def mark_tab_dirty(self, tab=None):
+        """Force a refresh the next time a tab (or, with no argument, every tab) is shown"""
+        if tab is None:
+            self._tab_versions.clear()
+        else:
+            self._tab_versions.pop(tab, None)
         
     def on_tab_changed(self, index):
         """Handle tab change events"""
+        self._load_tab(index)
+        
         # Refresh data in the newly selected tab
+        self._refresh_timer.start()
+        
+    def _do_refresh(self):
+        """Run the refresh scheduled by on_tab_changed/refresh_data"""
+        force = self._force_refresh
+        self._force_refresh = False
+        
+        # Skip tab switches when nothing has changed since the tab last refreshed
         current_tab = self.tabs.currentWidget()
-        if hasattr(current_tab, 'refresh_data'):
-            current_tab.refresh_data()
+        if not force and not self.is_tab_dirty(current_tab):
+            return
+        self._refresh_tab(current_tab)
+        if force:
+            self.status_bar.showMessage("Data refreshed", 2000)
             
     def export_data(self):
         """Export data to file"""
@@ -126,15 +236,18 @@ class MainWindow(QMainWindow):
         
     def refresh_data(self):
         """Refresh current tab data"""
-        current_tab = self.tabs.currentWidget()
-        if hasattr(current_tab, 'refresh_data'):
-            current_tab.refresh_data()
-            self.status_bar.showMessage("Data refreshed", 2000)
+        self._force_refresh = True
+        self._refresh_timer.start()
             
     def show_about(self):
         """Show about dialog with logo"""
-        import os
+        # The dialog is built once and reused on later opens
+        if self._about_dialog is None:
+            self._about_dialog = self._build_about_dialog()
+        self._about_dialog.exec()
         
+    def _build_about_dialog(self):
+        """Build the about dialog with logo"""
         dialog = QDialog(self)
         dialog.setWindowTitle("About Zuo")
         dialog.setFixedSize(400, 350)
@@ -143,26 +256,26 @@ class MainWindow(QMainWindow):
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         # Logo
-        logo_path = os.path.join(os.path.dirname(__file__), "resources", "zuo_logo.png")
-        if os.path.exists(logo_path):
-            logo_label = QLabel()
-            pixmap = QPixmap(logo_path)
-            scaled_pixmap = pixmap.scaled(200, 200, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            logo_label.setPixmap(scaled_pixmap)
-            logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.addWidget(logo_label)
-        
-        # App info
-        info_label = QLabel(
-            "<h2 style='color: #1e3a5f;'>Zuo Budget Tracker</h2>"
-            "<p style='color: #10b981; font-style: italic;'>Win with Money.</p>"
-            "<p>Version 1.0</p>"
-            "<p>A comprehensive budget management application<br>"
-            "for individuals, couples, and families.</p>"
-            "<p style='color: #64748b;'>© 2024 All rights reserved</p>"
-        )
-        info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        info_label.setWordWrap(True)
-        layout.addWidget(info_label)
+        logo_label = QLabel()
+        logo_label.setPixmap(self.logo_200_pixmap())
+        logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(logo_label)
+        
+        # App info - plain-text labels; their colors come from the
+        # QLabel#about* rules in the application stylesheet
+        for object_name, text in (
+            ("aboutTitle", "Zuo Budget Tracker"),
+            ("aboutTagline", "Win with Money."),
+            ("aboutDetails", "Version 1.0\n\n"
+                             "A comprehensive budget management application\n"
+                             "for individuals, couples, and families."),
+            ("aboutCopyright", "© 2024 All rights reserved"),
+        ):
+            label = QLabel(text)
+            label.setObjectName(object_name)
+            label.setTextFormat(Qt.TextFormat.PlainText)
+            label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            label.setWordWrap(True)
+            layout.addWidget(label)
         
-        dialog.exec()
\ No newline at end of file
+        return dialog
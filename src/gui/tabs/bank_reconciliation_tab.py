@@ -14,18 +14,389 @@ Date,Bank RTN,Account Number,Transaction Type,Description,Debit,Credit,Check Num
 """
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog,
-    QMessageBox, QDateEdit, QGroupBox, QCheckBox, QComboBox,
-    QDialog, QDialogButtonBox, QLineEdit, QFormLayout
+    QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QTableView, QHeaderView, QFileDialog, QStyledItemDelegate, QStyle,
+    QMessageBox, QDateEdit, QGroupBox, QComboBox,
+    QDialog, QDialogButtonBox, QLineEdit, QFormLayout, QProgressDialog,
+    QMainWindow, QMenu
 )
-from PyQt6.QtCore import Qt, QDate
-from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtCore import (
+    Qt, QDate, QTimer, QAbstractTableModel, QModelIndex, QEvent, QRect,
+    QObject, QRunnable, QThreadPool, pyqtSignal
+)
+from PyQt6.QtGui import QFont, QColor, QPainter, QPen
 from datetime import datetime
 import csv
+import os
+import sqlite3
+import time
+import traceback
+from itertools import chain
+from collections import namedtuple
 from src.database.db_manager import DatabaseManager
 from src.database.category_manager import get_category_manager
+from src.gui.utils.checkbox_styles import create_form_checkbox
+from src.gui.utils.bulk_import_dialog import BulkImportPreviewDialog
 from src.config import get_user_names
+from src.gui.tabs.base import RefreshableTab
+
+# Bank CSV columns, in file order (see "CSV Format Expected" above)
+_CSV_FIELDS = (
+    'Date', 'Bank RTN', 'Account Number', 'Transaction Type', 'Description',
+    'Debit', 'Credit', 'Check Number', 'Account Running Balance'
+)
+
+# Statements run against bank_transactions. Each is a single module-level
+# string, so sqlite3's per-connection statement cache (keyed by SQL text)
+# compiles it once and re-binds it on every later call.
+_SQL_CREATE_DATE_INDEX = (
+    'CREATE INDEX IF NOT EXISTS idx_bank_tx_date ON bank_transactions(date DESC, id DESC)'
+)
+_SQL_INSERT_TRANSACTION = '''
+    INSERT OR IGNORE INTO bank_transactions
+    (date, bank_rtn, account_number, transaction_type, description,
+     debit, credit, check_number, account_balance)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+_SQL_SELECT_MONTH = '''
+    SELECT * FROM bank_transactions
+    WHERE date >= ? AND date < ?
+    ORDER BY date DESC, id DESC
+'''
+# Classifies rows like BankTransactionModel.classify(): a positive credit
+# makes a row a credit, otherwise a positive debit makes it a debit
+_SQL_MONTH_SUMMARY = '''
+    SELECT
+        COALESCE(SUM(CASE WHEN credit > 0 THEN 0
+                          WHEN debit > 0 THEN debit ELSE 0 END), 0),
+        COALESCE(SUM(CASE WHEN credit > 0 THEN credit ELSE 0 END), 0),
+        COALESCE(SUM(CASE WHEN reconciled THEN 1 ELSE 0 END), 0),
+        COUNT(*)
+    FROM bank_transactions
+    WHERE date >= ? AND date < ?
+'''
+_SQL_SET_RECONCILED = 'UPDATE bank_transactions SET reconciled = ? WHERE id = ?'
+# Reconcile many rows per statement; stays under SQLite's default
+# 999 host-parameter limit on older builds
+_RECONCILE_BATCH_SIZE = 500
+_SQL_SET_COMMENT = 'UPDATE bank_transactions SET comment = ? WHERE id = ?'
+_SQL_MARK_IMPORTED = 'UPDATE bank_transactions SET imported_to_budget = 1 WHERE id = ?'
+_SQL_INSERT_EXPENSE = (
+    'INSERT INTO expenses (date, person, amount, category, subcategory, '
+    'description, payment_method, realized, created_at) '
+    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)'
+)
+_SQL_INSERT_INCOME = (
+    'INSERT INTO income (date, person, amount, source, notes, created_at) '
+    'VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)'
+)
+_SQL_DELETE_ALL = 'DELETE FROM bank_transactions'
+# Expenses per multi-row INSERT: 8 parameters a row keeps each statement
+# under SQLite's default 999 host-parameter limit on older builds
+_EXPENSE_INSERT_BATCH_SIZE = 900 // 8
+_SQL_INSERT_EXPENSE_BATCH = (
+    'INSERT INTO expenses (date, person, amount, category, subcategory, '
+    'description, payment_method, realized, created_at) VALUES '
+    + ', '.join(['(?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)'] * _EXPENSE_INSERT_BATCH_SIZE)
+)
+
+# Files smaller than this are parsed with the csv module; importing pyarrow
+# only pays off for large statements (roughly 10k+ rows)
+_ARROW_MIN_BYTES = 1024 * 1024
+
+# Rows inserted per executemany call during an import, between progress updates
+_IMPORT_CHUNK_SIZE = 5000
+
+# pyarrow modules, imported on first large import (False if unavailable)
+_pyarrow_csv = None
+
+# Characters stripped from CSV currency values ("$1,234.56" -> "1234.56")
+_CURRENCY_STRIP = str.maketrans('', '', ',$')
+
+
+def _to_float(value):
+    """Parse a CSV currency value, returning None when empty or invalid"""
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        return float(value.translate(_CURRENCY_STRIP))
+    except ValueError:
+        return None
+
+
+def _parse_date(date_str):
+    """
+    Normalize a CSV date to YYYY-MM-DD.
+
+    Accepts MM/DD/YY, MM/DD/YYYY and YYYY-MM-DD. The format is picked from
+    the string's shape, so only one strptime call is made per date. Dates
+    in any other format are returned unchanged.
+    """
+    if '/' in date_str:
+        # Two-digit year after the last slash means MM/DD/YY
+        fmt = '%m/%d/%y' if len(date_str) - date_str.rfind('/') == 3 else '%m/%d/%Y'
+    else:
+        fmt = '%Y-%m-%d'
+    try:
+        return datetime.strptime(date_str, fmt).strftime('%Y-%m-%d')
+    except ValueError:
+        return date_str
+
+
+def _clean_row(values):
+    """
+    Convert one CSV row (in _CSV_FIELDS order) into a bank_transactions tuple.
+
+    Returns:
+        tuple: Insert parameters, or None for rows without a date
+    """
+    (date_str, bank_rtn, account_number, transaction_type, description,
+     debit, credit, check_number, account_balance) = values
+    date_str = date_str.strip()
+    if not date_str:
+        return None
+    return (
+        _parse_date(date_str),
+        bank_rtn.strip(),
+        account_number.strip(),
+        transaction_type.strip(),
+        description.strip(),
+        # Amounts - handle empty strings and currency formatting
+        _to_float(debit),
+        _to_float(credit),
+        check_number.strip(),
+        _to_float(account_balance),
+    )
+
+
+class ImportValidationError(ValueError):
+    """Raised when a transaction cannot be imported into the budget as-is"""
+
+
+def _validate_import_data(data):
+    """
+    Check an income or expense import before it reaches SQLite.
+
+    Args:
+        data (dict): Import data with at least 'date' and 'amount'; expense
+                     imports also carry 'category'
+
+    Raises:
+        ImportValidationError: If the amount is not a positive number, the
+            date is not YYYY-MM-DD or an expense has no category
+    """
+    amount = data['amount']
+    if isinstance(amount, bool) or not isinstance(amount, (int, float)) or not amount > 0:
+        raise ImportValidationError(f"Invalid amount: {amount!r}")
+    try:
+        datetime.strptime(data['date'] or '', '%Y-%m-%d')
+    except ValueError:
+        raise ImportValidationError(f"Invalid date (expected YYYY-MM-DD): {data['date']!r}") from None
+    if 'category' in data and not data['category']:
+        raise ImportValidationError("Missing category")
+
+
+def _read_rows_csv(file_path):
+    """Parse a bank CSV with the csv module"""
+    rows = []
+    with open(file_path, 'r', encoding='utf-8') as f:
+        # Columns are mapped by position, so banks that word their
+        # header differently still import; short rows get None
+        csv_reader = csv.DictReader(f, fieldnames=_CSV_FIELDS)
+        
+        # Skip header row
+        next(csv_reader, None)
+        
+        for row in csv_reader:
+            # Skip short (malformed) rows
+            if row['Account Running Balance'] is None:
+                continue
+            parsed = _clean_row([row[name] for name in _CSV_FIELDS])
+            if parsed:
+                rows.append(parsed)
+    return rows
+
+
+def _get_pyarrow_csv():
+    """
+    Import pyarrow's CSV reader on first use.
+
+    Returns:
+        tuple: (pyarrow, pyarrow.csv), or None if pyarrow is not installed
+    """
+    global _pyarrow_csv
+    if _pyarrow_csv is None:
+        try:
+            import pyarrow
+            import pyarrow.csv
+        except ImportError:
+            _pyarrow_csv = False
+        else:
+            _pyarrow_csv = (pyarrow, pyarrow.csv)
+    return _pyarrow_csv or None
+
+
+def _read_rows_arrow(file_path, pa, pv):
+    """
+    Parse a bank CSV with pyarrow's multithreaded reader, 1 MB at a time.
+
+    Columns are read as strings and mapped by position like the csv module
+    path; rows with a different field count are skipped.
+
+    Raises:
+        pyarrow.ArrowInvalid: If the file does not have the expected columns
+    """
+    # The header row is skipped, so columns are named f0..fN by position
+    columns = [f"f{i}" for i in range(len(_CSV_FIELDS))]
+    reader = pv.open_csv(
+        file_path,
+        read_options=pv.ReadOptions(skip_rows=1, autogenerate_column_names=True,
+                                    block_size=1 << 20),
+        parse_options=pv.ParseOptions(invalid_row_handler=lambda row: 'skip'),
+        convert_options=pv.ConvertOptions(
+            include_columns=columns,
+            column_types={name: pa.string() for name in columns},
+        ),
+    )
+    rows = []
+    for batch in reader:
+        values = [batch.column(i).to_pylist() for i in range(len(columns))]
+        for parsed in map(_clean_row, zip(*values)):
+            if parsed:
+                rows.append(parsed)
+    return rows
+
+
+def _read_bank_csv(file_path):
+    """
+    Parse a bank CSV into bank_transactions insert tuples.
+
+    Large files are parsed with pyarrow when it is installed; everything
+    else, and any file pyarrow rejects, goes through the csv module.
+
+    Returns:
+        list: One parameter tuple per row with a date
+    """
+    if os.path.getsize(file_path) >= _ARROW_MIN_BYTES:
+        arrow = _get_pyarrow_csv()
+        if arrow:
+            try:
+                return _read_rows_arrow(file_path, *arrow)
+            except Exception as e:
+                print(f"pyarrow could not parse {file_path}, using csv module: {e}")
+    return _read_rows_csv(file_path)
+
+
+class ImportSignals(QObject):
+    """
+    Signals emitted by an ImportWorker.
+
+    QRunnable is not a QObject, so the signals live on this helper object.
+    Connections made from the GUI thread are delivered back on the GUI thread.
+    """
+
+    started = pyqtSignal(int)              # total rows parsed
+    progress = pyqtSignal(int)             # rows inserted so far
+    done = pyqtSignal(int, int, str)       # imported, duplicates, error message ('' on success)
+
+
+class ImportWorker(QRunnable):
+    """
+    Parse and insert a bank CSV on a thread pool thread.
+
+    Uses its own SQLite connection (the shared DatabaseManager connection
+    must stay on the GUI thread) and inserts every row in one transaction,
+    in chunks so progress can be reported.
+
+    Attributes:
+        signals (ImportSignals): Emits started, progress and done
+    """
+
+    def __init__(self, file_path, db_path):
+        super().__init__()
+        self.file_path = file_path
+        self.db_path = db_path
+        self.signals = ImportSignals()
+
+    def run(self):
+        """Import the file and report the counts through the signals."""
+        try:
+            rows = _read_bank_csv(self.file_path)
+            self.signals.started.emit(len(rows))
+
+            conn = sqlite3.connect(self.db_path, timeout=30.0)
+            try:
+                conn.execute("PRAGMA synchronous=NORMAL")
+                imported_count = 0
+                # One transaction for the whole file; nothing is left
+                # half-imported if a chunk fails
+                with conn:
+                    for start in range(0, len(rows), _IMPORT_CHUNK_SIZE):
+                        chunk = rows[start:start + _IMPORT_CHUNK_SIZE]
+                        cursor = conn.executemany(_SQL_INSERT_TRANSACTION, chunk)
+                        imported_count += max(cursor.rowcount, 0)
+                        self.signals.progress.emit(start + len(chunk))
+            finally:
+                conn.close()
+        except Exception as e:
+            traceback.print_exc()
+            self.signals.done.emit(0, 0, str(e))
+            return
+        self.signals.done.emit(imported_count, len(rows) - imported_count, "")
+
+
+class ImportExpenseSignals(QObject):
+    """Signals emitted by an ImportExpenseTask"""
+
+    done = pyqtSignal(bool, str)           # success, error message ('' on success)
+
+
+class ImportExpenseTask(QRunnable):
+    """
+    Insert one imported expense and mark its bank transaction as imported,
+    on a thread pool thread.
+
+    Like ImportWorker it opens its own SQLite connection; both statements run
+    in a single BEGIN IMMEDIATE transaction.
+
+    Attributes:
+        signals (ImportExpenseSignals): Emits done
+    """
+
+    def __init__(self, db_path, expense_params, transaction_id):
+        super().__init__()
+        self.db_path = db_path
+        self.expense_params = expense_params
+        self.transaction_id = transaction_id
+        # Rows changed by the committed transaction, set by run()
+        self.changes = 0
+        self.signals = ImportExpenseSignals()
+
+    def run(self):
+        """Write the expense and report the outcome through the signals."""
+        try:
+            # Autocommit mode, so the explicit BEGIN IMMEDIATE opens the transaction
+            conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+            try:
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute('BEGIN IMMEDIATE')
+                try:
+                    conn.execute(_SQL_INSERT_EXPENSE, self.expense_params)
+                    conn.execute(_SQL_MARK_IMPORTED, (self.transaction_id,))
+                    conn.execute('COMMIT')
+                except Exception:
+                    conn.execute('ROLLBACK')
+                    raise
+                self.changes = conn.total_changes
+            finally:
+                conn.close()
+        except Exception as e:
+            traceback.print_exc()
+            self.signals.done.emit(False, str(e))
+            return
+        self.signals.done.emit(True, "")
+
 
 class ImportTransactionDialog(QDialog):
     """Dialog for importing a bank transaction as income or expense"""
@@ -35,6 +406,8 @@ class ImportTransactionDialog(QDialog):
         self.transaction = transaction
         self.transaction_type = transaction_type  # 'income' or 'expense'
         self.category_manager = get_category_manager()
+        # Read-only {category: [subcategories]} snapshot, fetched once per dialog
+        self._categories = self.category_manager.get_categories()
         self.setup_ui()
         
     def setup_ui(self):
@@ -79,9 +452,8 @@ class ImportTransactionDialog(QDialog):
             settings_layout.addRow("Person:", self.person_combo)
 
             # Category selector
-            categories = self.category_manager.get_all_categories()
             self.category_combo = QComboBox()
-            category_names = sorted(list(set([cat['category'] for cat in categories])))
+            category_names = sorted(self._categories)
             self.category_combo.addItems(category_names)
             self.category_combo.currentTextChanged.connect(self.on_category_changed)
             settings_layout.addRow("Category:", self.category_combo)
@@ -99,6 +471,14 @@ class ImportTransactionDialog(QDialog):
             self.payment_method_combo.addItems(["Checking", "Credit Card", "Cash", "Debit Card", "Other"])
             settings_layout.addRow("Payment Method:", self.payment_method_combo)
             
+            # Realized - bank transactions have usually cleared already
+            self.realized_checkbox = create_form_checkbox(
+                "Already taken from joint checking",
+                "Check if this expense has already been paid from the joint checking account"
+            )
+            self.realized_checkbox.setChecked(True)
+            settings_layout.addRow("", self.realized_checkbox)
+            
             # Initialize subcategories
             if len(category_names) > 0:
                 self.on_category_changed(category_names[0])
@@ -115,9 +495,7 @@ class ImportTransactionDialog(QDialog):
     def on_category_changed(self, category):
         """Update subcategories when category changes"""
         self.subcategory_combo.clear()
-        categories = self.category_manager.get_all_categories()
-        subcategories = [cat['subcategory'] for cat in categories if cat['category'] == category]
-        self.subcategory_combo.addItems(sorted(subcategories))
+        self.subcategory_combo.addItems(sorted(self._categories.get(category, ())))
         
     def get_import_data(self):
         """Get the data to import"""
@@ -136,20 +514,386 @@ class ImportTransactionDialog(QDialog):
             data['subcategory'] = self.subcategory_combo.currentText()
             data['description'] = self.description_input.text()
             data['payment_method'] = self.payment_method_combo.currentText()
+            data['realized'] = self.realized_checkbox.isChecked()
 
         return data
 
+    def get_import_tuple(self):
+        """
+        Get an expense import as parameters for _SQL_INSERT_EXPENSE.
+
+        Returns:
+            tuple: (date, person, amount, category, subcategory, description,
+                    payment_method, realized)
+        """
+        return (
+            self.transaction['date'],
+            self.person_combo.currentText(),
+            abs(self.transaction['amount']),
+            self.category_combo.currentText(),
+            self.subcategory_combo.currentText(),
+            self.description_input.text(),
+            self.payment_method_combo.currentText(),
+            self.realized_checkbox.isChecked(),
+        )
+
+
+# One table row: the transaction dict, its classification, and the
+# preformatted text and color for the read-only columns
+_BankRow = namedtuple('_BankRow', 'transaction trans_type amount display color')
+
+
+class BankTransactionModel(QAbstractTableModel):
+    """
+    Table model over one month of bank transactions.
+
+    Display strings are formatted once per reset, so repaints and scrolling
+    only index into precomputed tuples, and edits update the affected cell
+    through dataChanged instead of rebuilding the table.
+    Edits made in the view are reported through comment_edited and
+    reconciled_toggled so the tab can persist them.
+    """
+
+    HEADERS = ("Date", "Type", "Description", "Amount", "Balance", "Comment", "Reconciled")
+    COMMENT_COLUMN = 5
+    RECONCILED_COLUMN = 6
+
+    # Shared by every cell; data() hands out the same objects for every row
+    RED = QColor("#ff6b6b")    # Brighter red for dark theme
+    GREEN = QColor("#69db7c")  # Brighter green for dark theme
+    # Type/amount color by classify() sign: debits red, everything else green
+    SIGN_COLORS = {1: GREEN, -1: RED, 0: GREEN}
+
+    comment_edited = pyqtSignal(int, str)        # transaction id, comment text
+    reconciled_toggled = pyqtSignal(int, bool)   # transaction id, reconciled
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # _BankRow per table row
+        self._rows = []
+        # Transaction id -> row number, rebuilt whenever the rows move
+        self._row_of = {}
+        # Last (column, order) requested by the view, re-applied on reset
+        self._sort_order = None
+        self._font = QFont("Arial", 12)
+        self._bold_font = QFont("Arial", 12, QFont.Weight.Bold)
+
+    @staticmethod
+    def classify(transaction):
+        """
+        Determine the display type, signed amount and sign of a transaction.
+
+        Returns:
+            tuple: (type label, amount, sign) - sign is 1 for credits,
+                   -1 for debits (whose amount is negative) and 0 otherwise
+        """
+        # Credit column has value = CREDIT, Debit column has value = DEBIT
+        credit_val = transaction['credit'] or 0
+        if credit_val > 0:
+            return "CREDIT", credit_val, 1
+        debit_val = transaction['debit'] or 0
+        if debit_val > 0:
+            return "DEBIT", -debit_val, -1
+        # No amount in either column
+        return transaction['transaction_type'] or "N/A", 0, 0
+
+    def set_transactions(self, transactions):
+        """Replace the model contents with a new list of transaction dicts"""
+        self.beginResetModel()
+        self._rows = [self._make_row(t) for t in transactions]
+        if self._sort_order is not None:
+            self._sort_rows(*self._sort_order)
+        self._index_rows()
+        self.endResetModel()
+
+    def _index_rows(self):
+        """Rebuild the transaction id -> row number map"""
+        self._row_of = {row.transaction['id']: i for i, row in enumerate(self._rows)}
+
+    def _make_row(self, transaction):
+        """Classify a transaction and format its read-only columns"""
+        trans_type, amount, sign = self.classify(transaction)
+        balance = transaction['account_balance']
+        display = (
+            transaction['date'],
+            trans_type,
+            transaction['description'],
+            f"${abs(amount):,.2f}",                   # Format with commas ($##,###.##)
+            f"${balance:,.2f}" if balance else "",
+        )
+        return _BankRow(transaction, trans_type, amount, display, self.SIGN_COLORS[sign])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == self.COMMENT_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        transaction = row.transaction
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column < self.COMMENT_COLUMN:
+                return row.display[column]
+            if column == self.COMMENT_COLUMN:
+                # The comment column may not exist in older databases
+                return transaction.get('comment') or ""
+            return None
+        if role == Qt.ItemDataRole.EditRole and column == self.COMMENT_COLUMN:
+            return transaction.get('comment') or ""
+        if role == Qt.ItemDataRole.UserRole and column == self.RECONCILED_COLUMN:
+            return bool(transaction['reconciled'])
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if column in (0, 1):
+                return Qt.AlignmentFlag.AlignCenter
+            if column in (3, 4):
+                return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+            return None
+        if role == Qt.ItemDataRole.FontRole:
+            return self._bold_font if column in (1, 3) else self._font
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if column in (1, 3):
+                return row.color
+        return None
 
-class BankReconciliationTab(QWidget):
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        transaction = self._rows[index.row()].transaction
+        column = index.column()
+
+        if column == self.COMMENT_COLUMN:
+            text = value or ""
+            if text == (transaction.get('comment') or ""):
+                return True
+            transaction['comment'] = text
+            self.dataChanged.emit(index, index)
+            self.comment_edited.emit(transaction['id'], text)
+            return True
+        if column == self.RECONCILED_COLUMN:
+            transaction['reconciled'] = 1 if value else 0
+            self.dataChanged.emit(index, index)
+            self.reconciled_toggled.emit(transaction['id'], bool(value))
+            return True
+        return False
+
+    def reconcile_rows(self, rows):
+        """
+        Mark rows reconciled in place without emitting reconciled_toggled.
+
+        Args:
+            rows (iterable): Model row numbers
+
+        Returns:
+            list: Ids of the transactions that were not reconciled before
+        """
+        changed_ids = []
+        for row in rows:
+            transaction = self._rows[row].transaction
+            if not transaction['reconciled']:
+                transaction['reconciled'] = 1
+                changed_ids.append(transaction['id'])
+                index = self.index(row, self.RECONCILED_COLUMN)
+                self.dataChanged.emit(index, index)
+        return changed_ids
+
+    def mark_imported(self, transaction_ids):
+        """
+        Flag transactions as imported to the budget in place.
+
+        Transactions that are not in the model (another month) are ignored.
+        """
+        for transaction_id in transaction_ids:
+            row = self._row_of.get(transaction_id)
+            if row is None:
+                continue
+            self._rows[row].transaction['imported_to_budget'] = 1
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def transactions_at(self, rows):
+        """Return the transaction dicts shown in the given model rows"""
+        return [self._rows[row].transaction for row in rows]
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Sort rows by the natural value of a column (amounts numerically)"""
+        self._sort_order = (column, order)
+        self.layoutAboutToBeChanged.emit()
+        self._sort_rows(column, order)
+        self._index_rows()
+        self.layoutChanged.emit()
+
+    def _sort_rows(self, column, order):
+        """Sort the row list in place (stable, so ties keep the query order)"""
+        keys = {
+            0: lambda row: row.transaction['date'] or "",
+            1: lambda row: row.trans_type,
+            2: lambda row: row.transaction['description'] or "",
+            3: lambda row: row.amount,
+            4: lambda row: row.transaction['account_balance'] or 0,
+            5: lambda row: row.transaction.get('comment') or "",
+            6: lambda row: bool(row.transaction['reconciled']),
+        }
+        if column in keys:
+            self._rows.sort(key=keys[column], reverse=(order == Qt.SortOrder.DescendingOrder))
+
+
+class CommentDelegate(QStyledItemDelegate):
+    """
+    Edits the Comment column with a QLineEdit created only while editing.
+
+    Empty comments are painted with an "Add notes..." placeholder, so the
+    column still invites input without a widget in every row.
+    """
+
+    EDITOR_STYLE = """
+        QLineEdit {
+            background-color: #2d3748;
+            color: #e2e8f0;
+            border: 1px solid #4a5568;
+            border-radius: 4px;
+            padding: 6px;
+            font-size: 12px;
+        }
+        QLineEdit:focus {
+            border: 1px solid #4c51bf;
+            background-color: #374151;
+        }
+    """
+    PLACEHOLDER = "Add notes..."
+    PLACEHOLDER_COLOR = QColor("#718096")
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        if not index.data(Qt.ItemDataRole.DisplayRole):
+            painter.save()
+            painter.setPen(self.PLACEHOLDER_COLOR)
+            painter.drawText(option.rect.adjusted(8, 0, -8, 0),
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                             self.PLACEHOLDER)
+            painter.restore()
+
+    def createEditor(self, parent, option, index):
+        editor = QLineEdit(parent)
+        editor.setPlaceholderText(self.PLACEHOLDER)
+        editor.setStyleSheet(self.EDITOR_STYLE)
+        return editor
+
+    def setEditorData(self, editor, index):
+        editor.setText(index.data(Qt.ItemDataRole.EditRole) or "")
+
+    def setModelData(self, editor, model, index):
+        # The model reports the change through comment_edited, which saves it
+        model.setData(index, editor.text(), Qt.ItemDataRole.EditRole)
+
+
+class ReconciledDelegate(QStyledItemDelegate):
+    """
+    Paints the Reconciled column and toggles it on click.
+
+    Reconciled rows show a big red checkmark; unreconciled rows show an
+    empty checkbox. No per-row widgets are created.
+    """
+
+    CHECKMARK_COLOR = QColor("#ff4444")
+    BOX_BORDER = QColor("#6b7280")
+    BOX_FILL = QColor("#374151")
+    BOX_HOVER_FILL = QColor("#4a5568")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._checkmark_font = QFont("Arial")
+        self._checkmark_font.setPixelSize(28)
+        self._checkmark_font.setBold(True)
+        self._box_pen = QPen(self.BOX_BORDER, 2)
+        self._box_hover_pen = QPen(self.CHECKMARK_COLOR, 2)
+
+    def paint(self, painter, option, index):
+        # Background, alternating colors and selection
+        super().paint(painter, option, index)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if index.data(Qt.ItemDataRole.UserRole):
+            painter.setFont(self._checkmark_font)
+            painter.setPen(self.CHECKMARK_COLOR)
+            painter.drawText(option.rect, Qt.AlignmentFlag.AlignCenter, "✓")
+        else:
+            hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+            box = QRect(0, 0, 26, 26)
+            box.moveCenter(option.rect.center())
+            painter.setPen(self._box_hover_pen if hovered else self._box_pen)
+            painter.setBrush(self.BOX_HOVER_FILL if hovered else self.BOX_FILL)
+            painter.drawRoundedRect(box, 4, 4)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton
+                and option.rect.contains(event.position().toPoint())):
+            model.setData(index, not index.data(Qt.ItemDataRole.UserRole), Qt.ItemDataRole.EditRole)
+            return True
+        return False
+
+
+class BankReconciliationTab(RefreshableTab):
     """Tab for bank reconciliation and transaction import"""
     
+    # Summary label styles
+    _RED_SUMMARY_STYLE = "color: #ff6b6b; font-weight: bold; font-size: 14px;"
+    _GREEN_SUMMARY_STYLE = "color: #69db7c; font-weight: bold; font-size: 14px;"
+    _PLAIN_SUMMARY_STYLE = "color: #e2e8f0; font-weight: bold; font-size: 14px;"
+    
     def __init__(self):
         super().__init__()
-        self.db = DatabaseManager()
+        self.db = DatabaseManager.instance()
         self.transactions = []
+        self.reconciled_count = 0
+        self.transaction_count = 0
+        # (year, month) currently shown in the table
+        self.loaded_month = None
+        # Running CSV import (kept alive until it reports back)
+        self.import_worker = None
+        self.import_progress = None
+        # Running single-expense imports (kept alive until they report back)
+        self.expense_tasks = set()
+        # Income imports schedule a reload instead of running one each;
+        # several finishing within 150 ms share a single refresh_data()
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(150)
+        self.refresh_timer.timeout.connect(self.refresh_data)
+        self.ensure_indexes()
         self.setup_ui()
         self.refresh_data()
         
+    def ensure_indexes(self):
+        """
+        Create the index behind the month query if the database predates it.
+
+        Lets refresh_data() range-scan idx_bank_tx_date (which also satisfies
+        its ORDER BY) instead of scanning the whole table.
+        """
+        try:
+            self.db.execute(_SQL_CREATE_DATE_INDEX)
+            self.db.commit()
+        except sqlite3.OperationalError as e:
+            print(f"Error creating bank transaction index: {e}")
+        
     def setup_ui(self):
         """Setup the UI"""
         layout = QVBoxLayout(self)
@@ -171,13 +915,19 @@ class BankReconciliationTab(QWidget):
         self.month_selector.setDisplayFormat("MMMM yyyy")
         self.month_selector.setDate(QDate.currentDate())
         self.month_selector.setCalendarPopup(True)
-        self.month_selector.dateChanged.connect(self.refresh_data)
+        # Typing or spinning through dates fires dateChanged repeatedly;
+        # only reload once the selection has settled for 150 ms
+        self.month_timer = QTimer(self)
+        self.month_timer.setSingleShot(True)
+        self.month_timer.setInterval(150)
+        self.month_timer.timeout.connect(self.on_month_changed)
+        self.month_selector.dateChanged.connect(lambda _date: self.month_timer.start())
         controls_layout.addWidget(self.month_selector)
         
         controls_layout.addStretch()
         
         # Import CSV button
-        import_btn = QPushButton("📁 Import Bank CSV")
+        self.import_btn = import_btn = QPushButton("📁 Import Bank CSV")
         import_btn.setStyleSheet("""
             QPushButton {
                 background-color: #4c51bf;
@@ -219,6 +969,51 @@ class BankReconciliationTab(QWidget):
         """)
         clear_btn.clicked.connect(self.clear_all_transactions)
         controls_layout.addWidget(clear_btn)
+        
+        # Reconcile Selected button - one UPDATE and commit for every selected row
+        reconcile_btn = QPushButton("✓ Mark Selected Reconciled")
+        reconcile_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #38a169;
+                color: white;
+                padding: 12px 24px;
+                font-weight: bold;
+                font-size: 14px;
+                border-radius: 6px;
+                border: none;
+            }
+            QPushButton:hover {
+                background-color: #48bb78;
+            }
+            QPushButton:pressed {
+                background-color: #2f855a;
+            }
+        """)
+        reconcile_btn.clicked.connect(self.reconcile_selected)
+        controls_layout.addWidget(reconcile_btn)
+        
+        # Import Selected button - every selected debit goes in as an expense
+        # in one transaction
+        import_selected_btn = QPushButton("📥 Import Selected as Expenses")
+        import_selected_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #4c51bf;
+                color: white;
+                padding: 12px 24px;
+                font-weight: bold;
+                font-size: 14px;
+                border-radius: 6px;
+                border: none;
+            }
+            QPushButton:hover {
+                background-color: #5a67d8;
+            }
+            QPushButton:pressed {
+                background-color: #434190;
+            }
+        """)
+        import_selected_btn.clicked.connect(self.import_selected)
+        controls_layout.addWidget(import_selected_btn)
 
         layout.addLayout(controls_layout)
         
@@ -247,6 +1042,13 @@ class BankReconciliationTab(QWidget):
         self.net_change_label = QLabel("Net Change: $0.00")
         self.reconciled_count_label = QLabel("Reconciled: 0/0")
         
+        # Styles are applied once here; refresh_data() only restyles the
+        # net change label, and only when its sign flips
+        self.total_debits_label.setStyleSheet(self._RED_SUMMARY_STYLE)
+        self.total_credits_label.setStyleSheet(self._GREEN_SUMMARY_STYLE)
+        self.net_change_label.setStyleSheet(self._GREEN_SUMMARY_STYLE)
+        self.reconciled_count_label.setStyleSheet(self._PLAIN_SUMMARY_STYLE)
+        
         summary_layout.addWidget(self.total_debits_label)
         summary_layout.addWidget(self.total_credits_label)
         summary_layout.addWidget(self.net_change_label)
@@ -255,18 +1057,29 @@ class BankReconciliationTab(QWidget):
         summary_group.setLayout(summary_layout)
         layout.addWidget(summary_group)
         
-        # Transactions table
-        self.transactions_table = QTableWidget()
-        self.transactions_table.setColumnCount(7)
-        self.transactions_table.setHorizontalHeaderLabels([
-            "Date", "Type", "Description", "Amount", "Balance", "Comment", "Reconciled"
-        ])
+        # Transactions table - a view over BankTransactionModel, so only the
+        # visible rows are formatted and painted
+        self.transactions_model = BankTransactionModel(self)
+        self.transactions_model.comment_edited.connect(self.save_comment)
+        self.transactions_model.reconciled_toggled.connect(self.toggle_reconciled)
+        self.transactions_table = QTableView()
+        self.transactions_table.setModel(self.transactions_model)
+        self.transactions_table.setItemDelegateForColumn(
+            BankTransactionModel.COMMENT_COLUMN, CommentDelegate(self.transactions_table)
+        )
+        self.transactions_table.setItemDelegateForColumn(
+            BankTransactionModel.RECONCILED_COLUMN, ReconciledDelegate(self.transactions_table)
+        )
+        self.transactions_table.setMouseTracking(True)  # Hover highlight on checkboxes
+        self.transactions_table.setEditTriggers(QTableView.EditTrigger.AllEditTriggers)
+        self.transactions_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.transactions_table.setSelectionMode(QTableView.SelectionMode.ExtendedSelection)
         
         # Style the table - match dark theme from other tabs
         self.transactions_table.setAlternatingRowColors(True)
         self.transactions_table.setSortingEnabled(True)
         self.transactions_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #374151;
                 alternate-background-color: #2d3748;
                 gridline-color: #4a5568;
@@ -276,11 +1089,11 @@ class BankReconciliationTab(QWidget):
                 selection-background-color: #4c51bf;
                 font-size: 14px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px;
                 border-bottom: 1px solid #4a5568;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #4c51bf;
                 color: #ffffff;
             }
@@ -315,6 +1128,10 @@ class BankReconciliationTab(QWidget):
         self.transactions_table.verticalHeader().setDefaultSectionSize(40)
         self.transactions_table.verticalHeader().setVisible(False)
 
+        # Right-click a row to import that single transaction
+        self.transactions_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.transactions_table.customContextMenuRequested.connect(self.show_transaction_menu)
+
         layout.addWidget(self.transactions_table)
         
     def import_csv(self):
@@ -326,89 +1143,49 @@ class BankReconciliationTab(QWidget):
         if not file_path:
             return
             
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                csv_reader = csv.reader(f)
-                
-                # Skip header row
-                header = next(csv_reader)
-                
-                imported_count = 0
-                duplicate_count = 0
-                
-                for row in csv_reader:
-                    if len(row) < 9:
-                        continue
-                        
-                    # Parse CSV row
-                    date_str = row[0].strip()
-                    bank_rtn = row[1].strip() if len(row) > 1 else ""
-                    account_number = row[2].strip() if len(row) > 2 else ""
-                    transaction_type = row[3].strip() if len(row) > 3 else ""
-                    description = row[4].strip() if len(row) > 4 else ""
-                    debit = row[5].strip() if len(row) > 5 else ""
-                    credit = row[6].strip() if len(row) > 6 else ""
-                    check_number = row[7].strip() if len(row) > 7 else ""
-                    account_balance = row[8].strip() if len(row) > 8 else ""
-                    
-                    # Parse date
-                    try:
-                        # Try multiple date formats
-                        for fmt in ['%m/%d/%y', '%m/%d/%Y', '%Y-%m-%d']:
-                            try:
-                                date_obj = datetime.strptime(date_str, fmt)
-                                date_str = date_obj.strftime('%Y-%m-%d')
-                                break
-                            except ValueError:
-                                continue
-                    except:
-                        continue
-                    
-                    # Parse amounts - handle empty strings and currency formatting
-                    try:
-                        debit_amt = float(debit.replace(',', '').replace('$', '')) if debit and debit.strip() else None
-                    except (ValueError, AttributeError):
-                        debit_amt = None
-
-                    try:
-                        credit_amt = float(credit.replace(',', '').replace('$', '')) if credit and credit.strip() else None
-                    except (ValueError, AttributeError):
-                        credit_amt = None
-
-                    try:
-                        balance = float(account_balance.replace(',', '').replace('$', '')) if account_balance and account_balance.strip() else None
-                    except (ValueError, AttributeError):
-                        balance = None
-
-                    # Insert into database (OR IGNORE skips duplicates based on unique constraint)
-                    try:
-                        self.db.execute('''
-                            INSERT OR IGNORE INTO bank_transactions 
-                            (date, bank_rtn, account_number, transaction_type, description, 
-                             debit, credit, check_number, account_balance)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ''', (date_str, bank_rtn, account_number, transaction_type, description,
-                              debit_amt, credit_amt, check_number, balance))
-                        # Check if row was actually inserted
-                        if self.db.execute('SELECT changes()').fetchone()[0] > 0:
-                            imported_count += 1
-                        else:
-                            duplicate_count += 1
-                    except Exception as e:
-                        print(f"Error importing transaction: {e}")
-
-                self.db.commit()
-                
-                QMessageBox.information(
-                    self, "Import Complete",
-                    f"Imported {imported_count} new transactions.\n"
-                    f"{duplicate_count} duplicates skipped."
-                )
-                
-                self.refresh_data()
-                
-        except Exception as e:
-            QMessageBox.critical(self, "Import Error", f"Failed to import CSV: {str(e)}")
+        # Parse and insert on the thread pool so the window stays responsive
+        self.import_btn.setEnabled(False)
+        self.import_progress = QProgressDialog("Reading CSV file...", None, 0, 0, self)
+        self.import_progress.setWindowTitle("Importing Bank Transactions")
+        self.import_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self.import_progress.setMinimumDuration(0)
+        self.import_progress.show()
+        
+        self.import_worker = ImportWorker(file_path, self.db.db_path)
+        self.import_worker.signals.started.connect(self.on_import_started)
+        self.import_worker.signals.progress.connect(self.import_progress.setValue)
+        self.import_worker.signals.done.connect(self.on_import_done)
+        QThreadPool.globalInstance().start(self.import_worker)
+        
+    def on_import_started(self, total_rows):
+        """Switch the progress dialog from busy to a row count once parsing ends"""
+        self.import_progress.setLabelText(f"Importing {total_rows} transactions...")
+        self.import_progress.setRange(0, max(total_rows, 1))
+        
+    def on_import_done(self, imported_count, duplicate_count, error):
+        """Report the result of a background import and reload the table once"""
+        self.import_progress.close()
+        self.import_progress = None
+        self.import_worker = None
+        self.import_btn.setEnabled(True)
+        
+        if error:
+            QMessageBox.critical(self, "Import Error", f"Failed to import CSV: {error}")
+            return
+        
+        QMessageBox.information(
+            self, "Import Complete",
+            f"Imported {imported_count} new transactions.\n"
+            f"{duplicate_count} duplicates skipped."
+        )
+        
+        self.refresh_data()
+            
+    def on_month_changed(self):
+        """Reload the table if a different month was selected"""
+        selected_date = self.month_selector.date()
+        if (selected_date.year(), selected_date.month()) != self.loaded_month:
+            self.refresh_data()
             
     def refresh_data(self):
         """Refresh the transactions table"""
@@ -416,6 +1193,7 @@ class BankReconciliationTab(QWidget):
         selected_date = self.month_selector.date()
         year = selected_date.year()
         month = selected_date.month()
+        self.loaded_month = (year, month)
         
         # Calculate month range
         month_start = f"{year}-{month:02d}-01"
@@ -424,205 +1202,92 @@ class BankReconciliationTab(QWidget):
         else:
             month_end = f"{year}-{month + 1:02d}-01"
         
-        # Query transactions for the month
-        self.transactions = self.db.execute('''
-            SELECT * FROM bank_transactions
-            WHERE date >= ? AND date < ?
-            ORDER BY date DESC, id DESC
-        ''', (month_start, month_end)).fetchall()
-        
-        # Update table
-        self.transactions_table.setRowCount(len(self.transactions))
-        
-        total_debits = 0
-        total_credits = 0
-        reconciled_count = 0
-        
-        for row_idx, transaction in enumerate(self.transactions):
-            # Determine transaction type and amount based on which column has a value
-            # Credit column has value = CREDIT, Debit column has value = DEBIT
-            debit_val = transaction['debit'] if transaction['debit'] else 0
-            credit_val = transaction['credit'] if transaction['credit'] else 0
-
-            # Determine type based on which column has a value (not both)
-            if credit_val > 0:
-                # Credit column has a value - label as CREDIT
-                trans_type = "CREDIT"
-                amount = credit_val
-                total_credits += credit_val
-            elif debit_val > 0:
-                # Debit column has a value - label as DEBIT
-                trans_type = "DEBIT"
-                amount = -debit_val
-                total_debits += debit_val
-            else:
-                # No amount in either column
-                trans_type = transaction['transaction_type'] or "N/A"
-                amount = 0
-
-            # Date
-            date_item = QTableWidgetItem(transaction['date'])
-            date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            date_item.setFont(QFont("Arial", 12))
-            self.transactions_table.setItem(row_idx, 0, date_item)
-            
-            # Type
-            type_item = QTableWidgetItem(trans_type)
-            type_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            type_item.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-            if trans_type == "DEBIT":
-                type_item.setForeground(QColor("#ff6b6b"))  # Brighter red for dark theme
-            else:
-                type_item.setForeground(QColor("#69db7c"))  # Brighter green for dark theme
-            self.transactions_table.setItem(row_idx, 1, type_item)
-            
-            # Description
-            desc_item = QTableWidgetItem(transaction['description'])
-            desc_item.setFont(QFont("Arial", 12))
-            self.transactions_table.setItem(row_idx, 2, desc_item)
-
-            # Amount - format with commas ($##,###.##)
-            amount_item = QTableWidgetItem(f"${abs(amount):,.2f}")
-            amount_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            amount_item.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-            if amount < 0:
-                amount_item.setForeground(QColor("#ff6b6b"))  # Brighter red for dark theme
-            else:
-                amount_item.setForeground(QColor("#69db7c"))  # Brighter green for dark theme
-            self.transactions_table.setItem(row_idx, 3, amount_item)
-            
-            # Balance - format with commas ($##,###.##)
-            if transaction['account_balance']:
-                balance_text = f"${transaction['account_balance']:,.2f}"
-            else:
-                balance_text = ""
-            balance_item = QTableWidgetItem(balance_text)
-            balance_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            balance_item.setFont(QFont("Arial", 12))
-            self.transactions_table.setItem(row_idx, 4, balance_item)
+        # Query transactions for the month (as dicts, so edits can update them in place)
+        rows = self.db.execute(_SQL_SELECT_MONTH, (month_start, month_end)).fetchall()
+        self.transactions = [dict(row) for row in rows]
+        
+        # Repaint the table and summary labels once, after everything is updated
+        self.setUpdatesEnabled(False)
+        try:
+            # Update table
+            self.transactions_model.set_transactions(self.transactions)
             
-            # Comment - editable text field for user notes
-            comment_widget = QWidget()
-            comment_widget.setStyleSheet("background-color: transparent;")
-            comment_layout = QHBoxLayout(comment_widget)
-            comment_layout.setContentsMargins(4, 4, 4, 4)
-
-            comment_input = QLineEdit()
-            # Safely get comment value (may not exist in older databases)
-            try:
-                comment_text = transaction['comment'] if transaction['comment'] else ""
-            except (KeyError, IndexError):
-                comment_text = ""
-            comment_input.setText(comment_text)
-            comment_input.setPlaceholderText("Add notes...")
-            comment_input.setStyleSheet("""
-                QLineEdit {
-                    background-color: #2d3748;
-                    color: #e2e8f0;
-                    border: 1px solid #4a5568;
-                    border-radius: 4px;
-                    padding: 6px;
-                    font-size: 12px;
-                }
-                QLineEdit:focus {
-                    border: 1px solid #4c51bf;
-                    background-color: #374151;
-                }
-            """)
-            # Save comment when user finishes editing
-            comment_input.editingFinished.connect(
-                lambda tid=transaction['id'], input_field=comment_input: self.save_comment(tid, input_field.text())
-            )
-            comment_layout.addWidget(comment_input)
+            total_debits, total_credits, reconciled_count, transaction_count = \
+                self._fetch_summary(month_start, month_end)
 
-            self.transactions_table.setCellWidget(row_idx, 5, comment_widget)
+            # Update summary with comma formatting
+            net_change = total_credits - total_debits
+            self.total_debits_label.setText(f"Total Debits: ${total_debits:,.2f}")
+            self.total_credits_label.setText(f"Total Credits: ${total_credits:,.2f}")
+            self.net_change_label.setText(f"Net Change: ${net_change:,.2f}")
+            net_change_style = self._GREEN_SUMMARY_STYLE if net_change >= 0 else self._RED_SUMMARY_STYLE
+            if self.net_change_label.styleSheet() != net_change_style:
+                self.net_change_label.setStyleSheet(net_change_style)
+            self.reconciled_count = reconciled_count
+            self.transaction_count = transaction_count
+            self.update_reconciled_label()
+        finally:
+            self.setUpdatesEnabled(True)
 
-            # Reconciled checkbox with big red checkmark when checked
-            reconciled_widget = QWidget()
-            reconciled_widget.setStyleSheet("background-color: transparent;")
-            reconciled_layout = QHBoxLayout(reconciled_widget)
-            reconciled_layout.setContentsMargins(0, 0, 0, 0)
-            reconciled_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            if transaction['reconciled']:
-                # Show big red checkmark for reconciled items
-                checkmark_label = QLabel("✓")
-                checkmark_label.setStyleSheet("""
-                    QLabel {
-                        color: #ff4444;
-                        font-size: 28px;
-                        font-weight: bold;
-                    }
-                """)
-                checkmark_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                checkmark_label.setCursor(Qt.CursorShape.PointingHandCursor)
-                checkmark_label.mousePressEvent = lambda event, tid=transaction['id']: self.toggle_reconciled_from_label(tid, False)
-                reconciled_layout.addWidget(checkmark_label)
-                reconciled_count += 1
-            else:
-                # Show checkbox for unreconciled items
-                reconciled_cb = QCheckBox()
-                reconciled_cb.setChecked(False)
-                reconciled_cb.setStyleSheet("""
-                    QCheckBox {
-                        spacing: 0px;
-                    }
-                    QCheckBox::indicator {
-                        width: 26px;
-                        height: 26px;
-                        border-radius: 4px;
-                        border: 2px solid #6b7280;
-                        background-color: #374151;
-                    }
-                    QCheckBox::indicator:hover {
-                        border-color: #ff4444;
-                        background-color: #4a5568;
-                    }
-                """)
-                reconciled_cb.stateChanged.connect(lambda state, tid=transaction['id']: self.toggle_reconciled(tid, state))
-                reconciled_layout.addWidget(reconciled_cb)
-
-            self.transactions_table.setCellWidget(row_idx, 6, reconciled_widget)
-
-        # Update summary with comma formatting
-        net_change = total_credits - total_debits
-        self.total_debits_label.setText(f"Total Debits: ${total_debits:,.2f}")
-        self.total_debits_label.setStyleSheet("color: #ff6b6b; font-weight: bold; font-size: 14px;")
-        self.total_credits_label.setText(f"Total Credits: ${total_credits:,.2f}")
-        self.total_credits_label.setStyleSheet("color: #69db7c; font-weight: bold; font-size: 14px;")
-        self.net_change_label.setText(f"Net Change: ${net_change:,.2f}")
-        if net_change >= 0:
-            self.net_change_label.setStyleSheet("color: #69db7c; font-weight: bold; font-size: 14px;")
-        else:
-            self.net_change_label.setStyleSheet("color: #ff6b6b; font-weight: bold; font-size: 14px;")
-        self.reconciled_count_label.setText(f"Reconciled: {reconciled_count}/{len(self.transactions)}")
-        self.reconciled_count_label.setStyleSheet("color: #e2e8f0; font-weight: bold; font-size: 14px;")
-
-    def toggle_reconciled(self, transaction_id, state):
-        """Toggle reconciled status"""
-        self.db.execute(
-            'UPDATE bank_transactions SET reconciled = ? WHERE id = ?',
-            (1 if state == Qt.CheckState.Checked.value else 0, transaction_id)
-        )
-        self.db.commit()
-        self.refresh_data()
+    def _fetch_summary(self, month_start, month_end):
+        """
+        Aggregate the month's totals in SQL.
 
-    def toggle_reconciled_from_label(self, transaction_id, new_state):
-        """Toggle reconciled status when clicking the checkmark label"""
-        self.db.execute(
-            'UPDATE bank_transactions SET reconciled = ? WHERE id = ?',
-            (1 if new_state else 0, transaction_id)
-        )
+        Returns:
+            tuple: (total_debits, total_credits, reconciled_count, transaction_count)
+        """
+        row = self.db.execute(_SQL_MONTH_SUMMARY, (month_start, month_end)).fetchone()
+        return tuple(row)
+
+    def show_status(self, message):
+        """Show a short-lived message in the main window's status bar"""
+        window = self.window()
+        if isinstance(window, QMainWindow):
+            window.statusBar().showMessage(message, 3000)
+
+    def update_reconciled_label(self):
+        """Show the reconciled count for the month"""
+        self.reconciled_count_label.setText(f"Reconciled: {self.reconciled_count}/{self.transaction_count}")
+
+    def toggle_reconciled(self, transaction_id, new_state):
+        """Toggle reconciled status when the Reconciled cell is clicked"""
+        self.db.execute(_SQL_SET_RECONCILED, (new_state, transaction_id))
         self.db.commit()
-        self.refresh_data()
+        
+        # The model already updated the row in place; only the count changes
+        self.reconciled_count += 1 if new_state else -1
+        self.update_reconciled_label()
+
+    def reconcile_selected(self):
+        """Mark every selected row reconciled in a single transaction"""
+        rows = {index.row() for index in self.transactions_table.selectionModel().selectedRows()}
+        ids = self.transactions_model.reconcile_rows(sorted(rows))
+        if not ids:
+            return
+        
+        try:
+            for start in range(0, len(ids), _RECONCILE_BATCH_SIZE):
+                batch = ids[start:start + _RECONCILE_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                self.db.execute(
+                    f'UPDATE bank_transactions SET reconciled = 1 WHERE id IN ({placeholders})',
+                    batch
+                )
+            self.db.commit()
+        except Exception as e:
+            self.db.conn.rollback()
+            QMessageBox.critical(self, "Error", f"Failed to reconcile transactions: {str(e)}")
+            # Reload so the table matches the database again
+            self.refresh_data()
+            return
+        
+        self.reconciled_count += len(ids)
+        self.update_reconciled_label()
 
     def save_comment(self, transaction_id, comment_text):
         """Save comment/note for a transaction"""
         try:
-            self.db.execute(
-                'UPDATE bank_transactions SET comment = ? WHERE id = ?',
-                (comment_text, transaction_id)
-            )
+            self.db.execute(_SQL_SET_COMMENT, (comment_text, transaction_id))
             self.db.commit()
         except Exception as e:
             print(f"Error saving comment: {e}")
@@ -640,13 +1305,33 @@ class BankReconciliationTab(QWidget):
 
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                self.db.execute('DELETE FROM bank_transactions')
+                self.db.execute(_SQL_DELETE_ALL)
                 self.db.commit()
                 QMessageBox.information(self, "Success", "All bank transactions have been deleted.")
                 self.refresh_data()
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to clear transactions: {str(e)}")
 
+    def show_transaction_menu(self, pos):
+        """Offer single income/expense imports for the row under the cursor"""
+        index = self.transactions_table.indexAt(pos)
+        if not index.isValid():
+            return
+        transaction = self.transactions_model.transactions_at([index.row()])[0]
+        
+        menu = QMenu(self)
+        income_action = menu.addAction("Import as Income...")
+        expense_action = menu.addAction("Import as Expense...")
+        if transaction['imported_to_budget']:
+            income_action.setEnabled(False)
+            expense_action.setEnabled(False)
+        
+        action = menu.exec(self.transactions_table.viewport().mapToGlobal(pos))
+        if action is income_action:
+            self.import_as_income(transaction)
+        elif action is expense_action:
+            self.import_as_expense(transaction)
+
     def import_as_income(self, transaction):
         """Import transaction as income"""
         # Prepare transaction data - use credit if available, otherwise debit
@@ -662,63 +1347,166 @@ class BankReconciliationTab(QWidget):
         dialog = ImportTransactionDialog(self, trans_data, 'income')
         if dialog.exec() == QDialog.DialogCode.Accepted:
             data = dialog.get_import_data()
+            try:
+                _validate_import_data(data)
+            except ImportValidationError as e:
+                QMessageBox.warning(self, "Cannot Import", str(e))
+                return
             
             # Insert income
             try:
-                self.db.execute('''
-                    INSERT INTO income (date, person, amount, source, notes, created_at)
-                    VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                ''', (data['date'], data['person'], data['amount'], data['source'], data['notes']))
+                self.db.execute(_SQL_INSERT_INCOME, (
+                    data['date'], data['person'], data['amount'], data['source'], data['notes']))
 
                 # Mark as imported
-                self.db.execute(
-                    'UPDATE bank_transactions SET imported_to_budget = 1 WHERE id = ?',
-                    (transaction['id'],)
-                )
+                self.db.execute(_SQL_MARK_IMPORTED, (transaction['id'],))
                 
                 self.db.commit()
-                
-                QMessageBox.information(self, "Success", "Transaction imported as income!")
-                self.refresh_data()
-                
-            except Exception as e:
+            except (sqlite3.IntegrityError, sqlite3.OperationalError) as e:
+                self.db.conn.rollback()
                 QMessageBox.critical(self, "Error", f"Failed to import: {str(e)}")
+                return
+            
+            self.show_status(f"Imported as income: {data['source']}")
+            self.refresh_timer.start()
     
-    def import_as_expense(self, transaction):
-        """Import transaction as expense"""
-        # Prepare transaction data - use debit if available, otherwise credit
+    @staticmethod
+    def _expense_trans_data(transaction):
+        """Build the expense dialog's transaction details - debit if available, otherwise credit"""
         amount = transaction['debit'] if transaction['debit'] else (transaction['credit'] if transaction['credit'] else 0)
-        trans_data = {
+        return {
             'date': transaction['date'],
             'description': transaction['description'],
             'amount': amount,
             'transaction_type': transaction['transaction_type']
         }
+
+    def import_as_expense(self, transaction):
+        """Import transaction as expense"""
         # Show import dialog
-        dialog = ImportTransactionDialog(self, trans_data, 'expense')
+        dialog = ImportTransactionDialog(self, self._expense_trans_data(transaction), 'expense')
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            data = dialog.get_import_data()
+            expense_params = dialog.get_import_tuple()
+            try:
+                _validate_import_data({'date': expense_params[0], 'amount': expense_params[2],
+                                       'category': expense_params[3]})
+            except ImportValidationError as e:
+                QMessageBox.warning(self, "Cannot Import", str(e))
+                return
             
-            # Insert expense
+            # Insert the expense and mark the transaction imported on the
+            # thread pool, so the window stays responsive during the commit
+            task = ImportExpenseTask(self.db.db_path, expense_params, transaction['id'])
+            task.signals.done.connect(
+                lambda success, error: self.on_expense_import_done(task, success, error))
+            self.expense_tasks.add(task)
+            QThreadPool.globalInstance().start(task)
+
+    def on_expense_import_done(self, task, success, error):
+        """Report the result of a background expense import"""
+        self.expense_tasks.discard(task)
+        if not success:
+            QMessageBox.critical(self, "Error", f"Failed to import: {error}")
+            return
+        # The task wrote through its own connection; let data_version see it
+        self.db.record_external_changes(task.changes)
+        # Only the imported flag changed; patch the row instead of reloading
+        self.transactions_model.mark_imported((task.transaction_id,))
+        self.show_status(f"Imported as expense: {task.expense_params[5]}")
+
+    def import_selected(self):
+        """Import the selected, not yet imported debits as expenses"""
+        rows = sorted({index.row() for index in self.transactions_table.selectionModel().selectedRows()})
+        transactions = [
+            t for t in self.transactions_model.transactions_at(rows)
+            if t['debit'] and not t['imported_to_budget']
+        ]
+        if not transactions:
+            QMessageBox.information(self, "Import Selected",
+                                    "Select one or more debits that have not been imported yet.")
+            return
+        self.import_selected_as_expenses(transactions)
+
+    def import_selected_as_expenses(self, transactions):
+        """
+        Import several transactions as expenses in a single transaction.
+
+        All transactions are reviewed together in one BulkImportPreviewDialog
+        (unchecked rows are skipped), and every accepted row is written with
+        one commit, so the import costs one fsync instead of one per row.
+        """
+        # Categories are left blank so the preview dialog fills in learned
+        # suggestions, as the budget tab's CSV import does
+        categories = get_category_manager().get_categories()
+        user_a_name, _ = get_user_names()
+        expenses = [{
+            'bank_transaction_id': t['id'],
+            'date': t['date'],
+            'amount': abs(self._expense_trans_data(t)['amount']),
+            'description': t['description'] or '',
+            'person': user_a_name,
+            'category': '',
+            'subcategory': '',
+            'payment_method': 'Debit Card',
+        } for t in transactions]
+        
+        dialog = BulkImportPreviewDialog(expenses, categories, self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        # Rows that fail validation are left out and listed in the summary
+        selected = []
+        invalid = []
+        for expense in dialog.get_selected_expenses():
             try:
-                self.db.execute('''
-                    INSERT INTO expenses (date, person, amount, category, subcategory, 
-                                         description, payment_method, realized, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                ''', (data['date'], data['person'], data['amount'], data['category'],
-                      data['subcategory'], data['description'], data['payment_method'],
-                      1 if data['realized'] else 0))
+                _validate_import_data(expense)
+            except ImportValidationError as e:
+                invalid.append(f"{expense['date']} {expense['description']}: {e}")
+                continue
+            selected.append(expense)
+        if not selected:
+            if invalid:
+                QMessageBox.warning(self, "Cannot Import", "\n".join(invalid))
+            return
+        # Bank transactions have already cleared, so they go in as realized
+        expense_rows = [
+            (e['date'], e['person'], e['amount'], e['category'], e['subcategory'],
+             e['description'], e['payment_method'], True)
+            for e in selected
+        ]
+        imported_ids = [(e['bank_transaction_id'],) for e in selected]
+        
+        started = time.perf_counter()
+        try:
+            with self.db.writer() as conn:
+                # Take the write lock up front so the batch cannot hit SQLITE_BUSY halfway
+                conn.execute('BEGIN IMMEDIATE')
+                self._bulk_insert_expenses(conn, expense_rows)
+                conn.executemany(_SQL_MARK_IMPORTED, imported_ids)
+        except (sqlite3.IntegrityError, sqlite3.OperationalError) as e:
+            QMessageBox.critical(self, "Error", f"Failed to import: {str(e)}")
+            return
+        
+        # Only the imported flags changed; patch the rows instead of reloading
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.transactions_model.mark_imported(tid for tid, in imported_ids)
+        skipped = len(transactions) - len(expense_rows)
+        message = (f"Imported {len(expense_rows)} transaction(s) as expenses in {elapsed_ms:.0f} ms.\n"
+                   f"{skipped} skipped.")
+        if invalid:
+            message += "\n\nNot imported:\n" + "\n".join(invalid)
+        QMessageBox.information(self, "Import Complete", message)
 
-                # Mark as imported
-                self.db.execute(
-                    'UPDATE bank_transactions SET imported_to_budget = 1 WHERE id = ?',
-                    (transaction['id'],)
-                )
-                
-                self.db.commit()
-                
-                QMessageBox.information(self, "Success", "Transaction imported as expense!")
-                self.refresh_data()
-                
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to import: {str(e)}")
+    @staticmethod
+    def _bulk_insert_expenses(conn, rows):
+        """
+        Insert expense parameter tuples using multi-row VALUES statements.
+
+        Full batches share one statement text, so sqlite3 compiles it once;
+        the remainder (fewer than a batch) goes through executemany.
+        """
+        full = len(rows) - len(rows) % _EXPENSE_INSERT_BATCH_SIZE
+        for start in range(0, full, _EXPENSE_INSERT_BATCH_SIZE):
+            batch = rows[start:start + _EXPENSE_INSERT_BATCH_SIZE]
+            conn.execute(_SQL_INSERT_EXPENSE_BATCH, list(chain.from_iterable(batch)))
+        if full < len(rows):
+            conn.executemany(_SQL_INSERT_EXPENSE, rows[full:])
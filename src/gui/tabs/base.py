@@ -0,0 +1,16 @@
+"""
+Base class for the application's main tabs
+
+Every top-level tab subclasses RefreshableTab, so the main windows can call
+refresh_data() on the current tab unconditionally when it is activated.
+"""
+
+from PyQt6.QtWidgets import QWidget
+
+
+class RefreshableTab(QWidget):
+    """A tab that can reload its data when it becomes the current tab"""
+
+    def refresh_data(self):
+        """Reload the tab's data from the database (no-op by default)"""
+        pass
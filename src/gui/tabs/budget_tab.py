@@ -4,25 +4,31 @@ Budget Tab - Manages income and expenses with two sub-tabs
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTableWidget, QTableWidgetItem, QGroupBox, QGridLayout,
+    QTableView, QGroupBox, QGridLayout,
     QComboBox, QLineEdit, QDateEdit, QTabWidget,
     QHeaderView, QMessageBox, QFileDialog, QDialog,
-    QDialogButtonBox, QCheckBox
+    QDialogButtonBox
 )
-from PyQt6.QtCore import Qt, QDate
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, QDate, QTimer, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt6.QtGui import QFont, QColor, QBrush
+from collections import namedtuple
 from datetime import datetime
 import csv
 import os
+import re
 from src.database.db_manager import DatabaseManager
 from src.database.category_manager import get_category_manager
+from src.database.models import IncomeModel, ExpenseModel
 from src.gui.utils.expense_loader import ExpenseLoader
-from src.gui.utils.table_items import CurrencyTableWidgetItem, DateTableWidgetItem
+from src.gui.utils.bulk_import_dialog import BulkImportPreviewDialog
+from src.gui.utils.category_management_dialog import CategoryManagementDialog
 from src.gui.utils.advanced_filter_dialog import AdvancedFilterDialog
-from src.gui.utils.checkbox_styles import create_form_checkbox, create_table_checkbox
+from src.gui.utils.checkbox_styles import create_form_checkbox
 from src.config import get_user_names
+from src.gui.tabs.base import RefreshableTab
 
-class BudgetTab(QWidget):
+
+class BudgetTab(RefreshableTab):
     def __init__(self):
         super().__init__()
         self.db = DatabaseManager()
@@ -42,19 +48,7 @@ class BudgetTab(QWidget):
         
         # Add Manage Categories button
         manage_categories_btn = QPushButton("⚙️ Manage Categories")
-        manage_categories_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1e3a5f;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2c5282;
-            }
-        """)
+        manage_categories_btn.setStyleSheet(_STYLE_MANAGE_BTN)
         manage_categories_btn.clicked.connect(self.show_category_management)
         header_layout.addWidget(manage_categories_btn)
         
@@ -64,11 +58,11 @@ class BudgetTab(QWidget):
         self.sub_tabs = QTabWidget()
         
         # Income Tab
-        self.income_tab = IncomeSubTab()
+        self.income_tab = IncomeSubTab(self.db)
         self.sub_tabs.addTab(self.income_tab, "💵 Income")
         
         # Expenses Tab
-        self.expenses_tab = ExpensesSubTab()
+        self.expenses_tab = ExpensesSubTab(self.db)
         self.sub_tabs.addTab(self.expenses_tab, "💳 Expenses")
         
         layout.addWidget(self.sub_tabs)
@@ -76,17 +70,17 @@ class BudgetTab(QWidget):
     
     def show_category_management(self):
         """Show the category management dialog"""
-        from src.gui.utils.category_management_dialog import CategoryManagementDialog
-        
         dialog = CategoryManagementDialog(self)
         dialog.categoriesChanged.connect(self.on_categories_changed)
         dialog.exec()
     
     def on_categories_changed(self):
         """Handle categories being changed"""
-        # Reload categories in both sub-tabs
+        # Reload categories and user names in both sub-tabs
         self.income_tab.load_categories()
         self.expenses_tab.load_categories()
+        self.income_tab.reload_user_names()
+        self.expenses_tab.reload_user_names()
         
         # Refresh the data to show any changes
         self.refresh_data()
@@ -97,21 +91,473 @@ class BudgetTab(QWidget):
         self.expenses_tab.refresh_data()
 
 
+# Shared by every row of the expense table, instead of resolved per row
+_EXPENSE_AMOUNT_BRUSH = QBrush(Qt.GlobalColor.red)
+_format_currency = "${:,.2f}".format
+
+# Rows (beyond the visible ones) a table header measures when sizing its
+# ResizeToContents columns; -1 would measure every row on each model reset
+_RESIZE_CONTENTS_PRECISION = 200
+
+# Thousands separators, dollar signs and whitespace allowed in typed amounts,
+# removed in a single pass before float()
+_AMOUNT_STRIP = re.compile(r'[,$\s]')
+
+# Filter combo entries shared by both sub-tabs; the year range is fixed at
+# startup (two years back through next year)
+_MONTHS_LIST = (
+    "All", "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
+_CURRENT_YEAR = datetime.now().year
+_YEARS_LIST = ("All",) + tuple(str(year) for year in range(_CURRENT_YEAR - 2, _CURRENT_YEAR + 2))
+
+# Button and summary card stylesheets, shared by every widget that uses them
+# rather than rebuilt as string literals each time a tab is constructed
+_STYLE_MANAGE_BTN = """
+QPushButton {
+    background-color: #1e3a5f;
+    color: white;
+    border: none;
+    padding: 8px 16px;
+    border-radius: 4px;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background-color: #2c5282;
+}
+"""
+_STYLE_PRIMARY_BTN = """
+QPushButton {
+    background-color: #2a82da;
+    color: white;
+    padding: 8px;
+    font-weight: bold;
+    border-radius: 4px;
+}
+QPushButton:hover {
+    background-color: #1e5fa8;
+}
+"""
+_STYLE_WARN_BTN = """
+QPushButton {
+    background-color: #f0ad4e;
+    color: white;
+    padding: 8px 16px;
+    font-weight: bold;
+    border-radius: 4px;
+}
+QPushButton:hover {
+    background-color: #ec971f;
+}
+"""
+_STYLE_INCOME_SUMMARY_GROUP = """
+QGroupBox {
+    font-weight: bold;
+    border: 2px solid #555;
+    border-radius: 5px;
+    margin-top: 10px;
+    padding-top: 10px;
+}
+"""
+_STYLE_SUCCESS_BTN = """
+QPushButton {
+    background-color: #5cb85c;
+    color: white;
+    padding: 8px;
+    font-weight: bold;
+    border-radius: 4px;
+}
+QPushButton:hover {
+    background-color: #449d44;
+}
+"""
+_STYLE_INFO_SMALL_BTN = """
+QPushButton {
+    background-color: #5bc0de;
+    color: white;
+    padding: 6px 12px;
+    font-weight: bold;
+    border-radius: 4px;
+}
+QPushButton:hover {
+    background-color: #46b8da;
+}
+"""
+_STYLE_NEUTRAL_SMALL_BTN = """
+QPushButton {
+    background-color: #777;
+    color: white;
+    padding: 6px 12px;
+    font-weight: bold;
+    border-radius: 4px;
+}
+QPushButton:hover {
+    background-color: #666;
+}
+"""
+_STYLE_DANGER_BTN = """
+QPushButton {
+    background-color: #d9534f;
+    color: white;
+    padding: 8px 16px;
+    font-weight: bold;
+    border-radius: 4px;
+}
+QPushButton:hover {
+    background-color: #c9302c;
+}
+"""
+_STYLE_DANGER_OUTLINED_BTN = """
+QPushButton {
+    background-color: #d9534f;
+    color: white;
+    padding: 8px 16px;
+    font-weight: bold;
+    border-radius: 4px;
+    border: 2px solid #c9302c;
+}
+QPushButton:hover {
+    background-color: #c9302c;
+    border-color: #ac2925;
+}
+"""
+_STYLE_EXPENSE_SUMMARY_GROUP = """
+QGroupBox {
+    font-weight: bold;
+    border: 2px solid #555;
+    border-radius: 5px;
+    margin-top: 10px;
+    padding-top: 10px;
+    min-width: 150px;
+}
+"""
+_STYLE_CANCEL_BTN = """
+QPushButton {
+    background-color: #777;
+    color: white;
+    padding: 8px 16px;
+    border-radius: 4px;
+}
+QPushButton:hover {
+    background-color: #666;
+}
+"""
+
+
+# One income table row: the income dict and its preformatted column text
+_IncomeRow = namedtuple('_IncomeRow', 'income display')
+
+
+class IncomeTableModel(QAbstractTableModel):
+    """
+    Read-only table model over a list of income dicts.
+
+    Column text is formatted once per reset, so painting and scrolling only
+    index into precomputed tuples and no per-cell items are allocated.
+    """
+
+    HEADERS = ("Date", "Person", "Amount", "Description")
+    AMOUNT_COLUMN = 2
+    AMOUNT_COLOR = QColor(Qt.GlobalColor.darkGreen)
+
+    # Sort key per column; amounts sort numerically, dates as ISO strings
+    SORT_KEYS = (
+        lambda row: row.income['date'] or "",
+        lambda row: row.income['person'] or "",
+        lambda row: row.income['amount'] or 0,
+        lambda row: row.display[3],
+    )
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # _IncomeRow per table row
+        self._rows = []
+        # Last (column, order) requested by the view, re-applied on reset
+        self._sort_order = None
+
+    def set_income(self, income_data):
+        """Replace the model contents with a new list of income dicts"""
+        self.beginResetModel()
+        self._rows = [
+            _IncomeRow(income, (
+                income['date'],
+                income['person'],
+                _format_currency(income['amount']),
+                income.get('description') or '',
+            ))
+            for income in income_data
+        ]
+        if self._sort_order is not None:
+            self._sort_rows(*self._sort_order)
+        self.endResetModel()
+
+    def ids_at(self, rows):
+        """Return the income ids shown in the given model rows"""
+        return [self._rows[row].income['id'] for row in rows]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()].display[index.column()]
+        if role == Qt.ItemDataRole.ForegroundRole and index.column() == self.AMOUNT_COLUMN:
+            return self.AMOUNT_COLOR
+        return None
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Sort rows by the natural value of a column"""
+        self._sort_order = (column, order)
+        self.layoutAboutToBeChanged.emit()
+        self._sort_rows(column, order)
+        self.layoutChanged.emit()
+
+    def _sort_rows(self, column, order):
+        """Sort the row list in place (stable, so ties keep the query order)"""
+        if 0 <= column < len(self.SORT_KEYS):
+            self._rows.sort(key=self.SORT_KEYS[column],
+                            reverse=(order == Qt.SortOrder.DescendingOrder))
+
+
+# One expense table row: the expense dict and its preformatted column text
+_ExpenseRow = namedtuple('_ExpenseRow', 'expense display')
+
+
+class ExpenseTableModel(QAbstractTableModel):
+    """
+    Table model over a list of expense dicts.
+
+    Like IncomeTableModel, column text is formatted once per reset and no
+    per-cell items or widgets are allocated. The Select and Joint Account
+    columns are plain check states: Select marks are kept as a set of expense
+    ids (so they follow their rows through sorting), and Joint Account toggles
+    are reported through realized_toggled so the tab can persist them.
+    """
+
+    HEADERS = ("Select", "Date", "Person", "Amount", "Category", "Subcategory",
+               "Description", "Payment", "Joint Account")
+    SELECT_COLUMN = 0
+    AMOUNT_COLUMN = 3
+    REALIZED_COLUMN = 8
+    TOOLTIPS = {
+        SELECT_COLUMN: "Click to select this expense for deletion",
+        REALIZED_COLUMN: "Click to toggle if this expense has been paid from joint account",
+    }
+
+    # Sort key per data column; amounts sort numerically, dates as ISO strings
+    SORT_KEYS = {
+        1: lambda row: row.expense['date'] or "",
+        2: lambda row: row.expense['person'] or "",
+        3: lambda row: row.expense['amount'] or 0,
+        4: lambda row: row.display[4],
+        5: lambda row: row.display[5],
+        6: lambda row: row.display[6],
+        7: lambda row: row.display[7],
+        8: lambda row: bool(row.expense.get('realized')),
+    }
+
+    realized_toggled = pyqtSignal(int, bool)   # expense id, realized
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # _ExpenseRow per table row
+        self._rows = []
+        # Ids of the expenses ticked in the Select column
+        self._checked = set()
+        # Last (column, order) requested by the view, re-applied on reset
+        self._sort_order = None
+
+    @staticmethod
+    def _display(expense):
+        """Format an expense's column text (the check columns have none)"""
+        return (
+            "",
+            expense['date'],
+            expense['person'],
+            _format_currency(expense['amount']),
+            expense['category'],
+            expense['subcategory'],
+            expense.get('description') or '',
+            expense.get('payment_method') or '',
+            "",
+        )
+
+    def set_expenses(self, expense_data):
+        """Replace the model contents with a new list of expense dicts (clears Select marks)"""
+        self.beginResetModel()
+        self._rows = [_ExpenseRow(expense, self._display(expense)) for expense in expense_data]
+        self._checked = set()
+        if self._sort_order is not None:
+            self._sort_rows(*self._sort_order)
+        self.endResetModel()
+
+    def append_expense(self, expense):
+        """Insert one expense dict, at its place in the current sort order"""
+        row = _ExpenseRow(expense, self._display(expense))
+        position = len(self._rows)
+        if self._sort_order is not None:
+            column, order = self._sort_order
+            key = self._sort_key(column)
+            if key is not None:
+                new_key = key(row)
+                descending = order == Qt.SortOrder.DescendingOrder
+                # First row the new one sorts before; equal keys stay ahead,
+                # as a stable sort of the whole list would leave them
+                for i, existing in enumerate(self._rows):
+                    existing_key = key(existing)
+                    if (existing_key < new_key) if descending else (new_key < existing_key):
+                        position = i
+                        break
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.insert(position, row)
+        self.endInsertRows()
+
+    def checked_ids(self):
+        """Return the ids of the expenses ticked in the Select column"""
+        return list(self._checked)
+
+    def checked_count(self):
+        """Return how many expenses are ticked in the Select column"""
+        return len(self._checked)
+
+    def set_all_checked(self, checked):
+        """Tick or untick the Select column of every row"""
+        self._checked = {row.expense['id'] for row in self._rows} if checked else set()
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, self.SELECT_COLUMN),
+                self.index(len(self._rows) - 1, self.SELECT_COLUMN),
+                [Qt.ItemDataRole.CheckStateRole],
+            )
+
+    def set_realized(self, expense_id, realized):
+        """Update one expense's Joint Account state without emitting realized_toggled"""
+        for row_number, row in enumerate(self._rows):
+            if row.expense['id'] == expense_id:
+                row.expense['realized'] = 1 if realized else 0
+                index = self.index(row_number, self.REALIZED_COLUMN)
+                self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+                return
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() in self.TOOLTIPS:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row.display[column]
+        if role == Qt.ItemDataRole.CheckStateRole:
+            if column == self.SELECT_COLUMN:
+                checked = row.expense['id'] in self._checked
+            elif column == self.REALIZED_COLUMN:
+                checked = bool(row.expense.get('realized'))
+            else:
+                return None
+            return Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+        if role == Qt.ItemDataRole.ForegroundRole and column == self.AMOUNT_COLUMN:
+            return _EXPENSE_AMOUNT_BRUSH
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self.TOOLTIPS.get(column)
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        expense = self._rows[index.row()].expense
+        checked = Qt.CheckState(value) == Qt.CheckState.Checked
+        column = index.column()
+
+        if column == self.SELECT_COLUMN:
+            if checked:
+                self._checked.add(expense['id'])
+            else:
+                self._checked.discard(expense['id'])
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+            return True
+        if column == self.REALIZED_COLUMN:
+            expense['realized'] = 1 if checked else 0
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+            self.realized_toggled.emit(expense['id'], checked)
+            return True
+        return False
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Sort rows by the natural value of a column"""
+        self._sort_order = (column, order)
+        self.layoutAboutToBeChanged.emit()
+        self._sort_rows(column, order)
+        self.layoutChanged.emit()
+
+    def _sort_key(self, column):
+        """Return the sort key function for a column (None if it can't be sorted)"""
+        if column == self.SELECT_COLUMN:
+            return lambda row: row.expense['id'] in self._checked
+        return self.SORT_KEYS.get(column)
+
+    def _sort_rows(self, column, order):
+        """Sort the row list in place (stable, so ties keep the query order)"""
+        key = self._sort_key(column)
+        if key is not None:
+            self._rows.sort(key=key, reverse=(order == Qt.SortOrder.DescendingOrder))
+
+
 class IncomeSubTab(QWidget):
     """Sub-tab for managing income entries"""
     
-    def __init__(self):
+    def __init__(self, db=None):
         super().__init__()
-        self.db = DatabaseManager()
+        # BudgetTab passes down its shared DatabaseManager
+        self.db = db if db is not None else DatabaseManager()
+        # User names read from settings once; see reload_user_names()
+        self._user_a, self._user_b = get_user_names()
+        # Filter changes and other refresh requests only schedule a reload;
+        # a burst within 100 ms (e.g. three combos set in a row) runs it once
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(100)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        # A whole year of income per (year, person filter), so scrubbing the
+        # month filter is served from memory. Valid for _year_cache_version.
+        self._year_cache = {}
+        self._year_cache_version = None
         self.init_ui()
-        self.refresh_data()
+        self._do_refresh()
         
     def init_ui(self):
         """Initialize the Income UI"""
         layout = QVBoxLayout()
         
-        # Get user names from config
-        user_a, user_b = get_user_names()
+        # User names from config
+        user_a, user_b = self._user_a, self._user_b
         
         # Top section - Add Income Form
         form_group = QGroupBox("Add Income")
@@ -144,18 +590,7 @@ class IncomeSubTab(QWidget):
         
         # Add button
         add_btn = QPushButton("Add Income")
-        add_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2a82da;
-                color: white;
-                padding: 8px;
-                font-weight: bold;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #1e5fa8;
-            }
-        """)
+        add_btn.setStyleSheet(_STYLE_PRIMARY_BTN)
         add_btn.clicked.connect(self.add_income)
         form_layout.addWidget(add_btn, 2, 0, 1, 4)
         
@@ -195,10 +630,7 @@ class IncomeSubTab(QWidget):
         
         filter_layout.addWidget(QLabel("Month:"))
         self.filter_month = QComboBox()
-        self.filter_month.addItems([
-            "All", "January", "February", "March", "April", "May", "June",
-            "July", "August", "September", "October", "November", "December"
-        ])
+        self.filter_month.addItems(_MONTHS_LIST)
         # FIXED: Set to "All" by default instead of current month
         self.filter_month.setCurrentIndex(0)  # "All" is at index 0
         self.filter_month.currentIndexChanged.connect(self.refresh_data)
@@ -206,8 +638,7 @@ class IncomeSubTab(QWidget):
         
         filter_layout.addWidget(QLabel("Year:"))
         self.filter_year = QComboBox()
-        current_year = datetime.now().year
-        self.filter_year.addItems(["All"] + [str(year) for year in range(current_year - 2, current_year + 2)])
+        self.filter_year.addItems(_YEARS_LIST)
         # FIXED: Set to "All" by default instead of current year
         self.filter_year.setCurrentText("All")
         self.filter_year.currentTextChanged.connect(self.refresh_data)
@@ -217,18 +648,7 @@ class IncomeSubTab(QWidget):
         
         # Advanced Filter button
         advanced_filter_btn = QPushButton("Advanced Filters")
-        advanced_filter_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f0ad4e;
-                color: white;
-                padding: 8px 16px;
-                font-weight: bold;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #ec971f;
-            }
-        """)
+        advanced_filter_btn.setStyleSheet(_STYLE_WARN_BTN)
         advanced_filter_btn.clicked.connect(self.show_advanced_filter)
         filter_layout.addWidget(advanced_filter_btn)
 
@@ -239,22 +659,21 @@ class IncomeSubTab(QWidget):
         
         history_layout.addLayout(filter_layout)
         
-        # Income table
-        self.income_table = QTableWidget()
-        self.income_table.setColumnCount(5)
-        self.income_table.setHorizontalHeaderLabels([
-            "Date", "Person", "Amount", "Description", "ID"
-        ])
-        self.income_table.hideColumn(4)  # Hide ID column
+        # Income table - a view over IncomeTableModel; ids stay in the model
+        self.income_model = IncomeTableModel(self)
+        self.income_table = QTableView()
+        self.income_table.setModel(self.income_model)
         
         # Enable sorting and alternating row colors
         self.income_table.setSortingEnabled(True)
         self.income_table.setAlternatingRowColors(True)
-        self.income_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.income_table.setSelectionMode(QTableWidget.SelectionMode.MultiSelection)
+        self.income_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.income_table.setSelectionMode(QTableView.SelectionMode.MultiSelection)
 
-        # Set column widths
+        # Set column widths (sized from a sample of rows, see
+        # _RESIZE_CONTENTS_PRECISION)
         header = self.income_table.horizontalHeader()
+        header.setResizeContentsPrecision(_RESIZE_CONTENTS_PRECISION)
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
@@ -269,19 +688,15 @@ class IncomeSubTab(QWidget):
     def load_categories(self):
         """Stub method - Income tab doesn't use categories"""
         pass
+
+    def reload_user_names(self):
+        """Re-read the user names after the settings may have changed"""
+        self._user_a, self._user_b = get_user_names()
         
     def create_summary_card(self, title, value):
         """Create a summary card widget"""
         group = QGroupBox(title)
-        group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #555;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-        """)
+        group.setStyleSheet(_STYLE_INCOME_SUMMARY_GROUP)
         
         layout = QVBoxLayout()
         value_label = QLabel(value)
@@ -308,13 +723,14 @@ class IncomeSubTab(QWidget):
                 return
                 
             try:
-                amount = float(amount_text.replace(",", "").replace("$", ""))
+                amount = float(_AMOUNT_STRIP.sub('', amount_text))
             except ValueError:
                 QMessageBox.warning(self, "Warning", "Please enter a valid number for amount")
                 return
             
             # Add to database
             self.db.add_income(person, amount, date, description)
+            self._year_cache.clear()
             
             # Clear form
             self.amount_input.clear()
@@ -330,13 +746,7 @@ class IncomeSubTab(QWidget):
             
     def delete_selected_income(self):
         """Delete selected income entries"""
-        selected_rows = []
-        for row in range(self.income_table.rowCount()):
-            if self.income_table.item(row, 0) and self.income_table.item(row, 0).isSelected():
-                selected_rows.append(row)
-            elif any(self.income_table.item(row, col) and self.income_table.item(row, col).isSelected()
-                    for col in range(self.income_table.columnCount())):
-                selected_rows.append(row)
+        selected_rows = sorted({index.row() for index in self.income_table.selectionModel().selectedRows()})
 
         if not selected_rows:
             QMessageBox.warning(self, "Warning", "Please select one or more income entries to delete.")
@@ -355,17 +765,9 @@ class IncomeSubTab(QWidget):
             return
 
         try:
-            # Delete each selected income entry
-            deleted_count = 0
-            for row in reversed(selected_rows):  # Reverse to maintain row indices
-                income_id_item = self.income_table.item(row, 4)  # ID is in column 4
-                if income_id_item:
-                    income_id = int(income_id_item.text())
-
-                    # Delete from database using the model's delete method
-                    from src.database.models import IncomeModel
-                    IncomeModel.delete(self.db, income_id)
-                    deleted_count += 1
+            # Delete every selected income entry in one transaction
+            deleted_count = IncomeModel.delete_many(self.db, self.income_model.ids_at(selected_rows))
+            self._year_cache.clear()
 
             # Refresh the table
             self.refresh_data()
@@ -380,67 +782,66 @@ class IncomeSubTab(QWidget):
             QMessageBox.critical(self, "Error", f"Failed to delete income entries: {str(e)}")
 
     def refresh_data(self):
+        """Schedule a refresh of the income data display"""
+        self._refresh_timer.start()
+
+    def _do_refresh(self):
         """Refresh the income data display"""
         try:
-            # CRITICAL FIX: Disable sorting during table population to prevent data loss
-            self.income_table.setSortingEnabled(False)
-
             # Build filter parameters
             person_filter = None if self.filter_person.currentText() == "All" else self.filter_person.currentText()
             
-            # Date filters
-            start_date = None
-            end_date = None
-            
             if self.filter_month.currentIndex() > 0 and self.filter_year.currentText() != "All":
+                # Serve the month from the year's cached rows
                 year = int(self.filter_year.currentText())
-                month = self.filter_month.currentIndex()
-                start_date = f"{year:04d}-{month:02d}-01"
-                if month == 12:
-                    end_date = f"{year+1:04d}-01-01"
-                else:
-                    end_date = f"{year:04d}-{month+1:02d}-01"
+                month_prefix = f"{year:04d}-{self.filter_month.currentIndex():02d}-"
+                income_data = [income for income in self._year_income(year, person_filter)
+                               if income['date'].startswith(month_prefix)]
+                self.update_income_table(income_data)
+                return
             
             # Get income data
-            income_data = self.db.get_income(start_date, end_date, person_filter)
+            income_data = self.db.get_income(None, None, person_filter)
             
-            # Clear and populate table
-            self.income_table.setRowCount(0)
+            # Populate table (the model re-applies the current sort)
+            self.income_model.set_income(income_data)
             
-            user_a, user_b = get_user_names()
-            user_a_total = 0
-            user_b_total = 0
-            
-            for income in income_data:
-                row = self.income_table.rowCount()
-                self.income_table.insertRow(row)
-                
-                self.income_table.setItem(row, 0, DateTableWidgetItem(income['date']))
-                self.income_table.setItem(row, 1, QTableWidgetItem(income['person']))
-                
-                amount = income['amount']
-                amount_item = CurrencyTableWidgetItem(f"${amount:,.2f}")
-                amount_item.setForeground(Qt.GlobalColor.darkGreen)
-                self.income_table.setItem(row, 2, amount_item)
-                self.income_table.setItem(row, 3, QTableWidgetItem(income.get('description', '')))
-                self.income_table.setItem(row, 4, QTableWidgetItem(str(income['id'])))
-                
-                # Calculate totals
-                if income['person'] == user_a:
-                    user_a_total += amount
-                else:
-                    user_b_total += amount
-            
-            # Update summary cards
-            self.user_a_summary.value_label.setText(f"${user_a_total:,.2f}")
-            self.user_b_summary.value_label.setText(f"${user_b_total:,.2f}")
-            self.total_summary.value_label.setText(f"${user_a_total + user_b_total:,.2f}")
+            # Update summary cards from per-person totals summed in SQL
+            self.update_summary_cards(self.db.get_income_totals(None, None, person_filter))
             
         except Exception as e:
             print(f"Error refreshing income data: {e}")
-        finally:
-            # CRITICAL FIX: Re-enable sorting after table is fully populated
-            self.income_table.setSortingEnabled(True)
+
+    def _year_income(self, year, person_filter):
+        """
+        Return every income entry in a year, fetching the year on first use.
+
+        The cache is dropped whenever the database has changed since it was
+        filled, so edits made elsewhere in the app are picked up.
+        """
+        data_version = self.db.data_version
+        if data_version != self._year_cache_version:
+            self._year_cache.clear()
+            self._year_cache_version = data_version
+        key = (year, person_filter)
+        if key not in self._year_cache:
+            self._year_cache[key] = self.db.get_income(
+                f"{year:04d}-01-01", f"{year + 1:04d}-01-01", person_filter)
+        return self._year_cache[key]
+
+    def update_summary_cards(self, totals):
+        """
+        Show per-person income totals in the summary cards.
+
+        Args:
+            totals (dict): Total income keyed by person; anyone other than
+                           user A counts towards user B's card
+        """
+        user_a_total = totals.get(self._user_a, 0)
+        total = sum(totals.values())
+        self.user_a_summary.value_label.setText(f"${user_a_total:,.2f}")
+        self.user_b_summary.value_label.setText(f"${total - user_a_total:,.2f}")
+        self.total_summary.value_label.setText(f"${total:,.2f}")
 
     def show_advanced_filter(self):
         """Show the advanced filter dialog for income"""
@@ -458,61 +859,42 @@ class IncomeSubTab(QWidget):
             start_date = filters.get('start_date')
             end_date = filters.get('end_date')
 
-            # Person filter
-            person_filter = None
-            if 'persons' in filters:
-                if len(filters['persons']) == 1:
-                    person_filter = filters['persons'][0]
-                # If multiple persons selected, we'll handle in the query
+            # Amount bounds and the person set are applied by SQL
+            query_filters = {
+                'min_amount': filters.get('min_amount'),
+                'max_amount': filters.get('max_amount'),
+                'persons': filters.get('persons'),
+            }
+
+            # Text search; 'Description' searches description, 'All Fields'
+            # also searches person
+            predicates = []
+            if filters.get('search_text'):
+                search_field = filters.get('search_field', 'All Fields')
+                fields = []
+                if search_field in ('Description', 'All Fields'):
+                    fields.append('description')
+                if search_field == 'All Fields':
+                    fields.append('person')
+                if not fields:
+                    # The other search fields have no income column to match
+                    predicates.append(lambda income: False)
+                elif not filters.get('case_sensitive', False):
+                    # Case-insensitive substring search maps onto LOWER(...) LIKE ?
+                    query_filters['search_text'] = filters['search_text']
+                    query_filters['search_fields'] = fields
+                else:
+                    search_text = filters['search_text']
+                    predicates.append(lambda income: any(
+                        search_text in (income.get(field) or '') for field in fields))
 
             # Get income data with filters
-            income_data = self.db.get_income(start_date, end_date, person_filter)
+            income_data = self.db.get_income(start_date, end_date, **query_filters)
 
-            # Apply additional filters
-            filtered_data = []
-            for income in income_data:
-                # Amount filter
-                if 'min_amount' in filters or 'max_amount' in filters:
-                    amount = income['amount']
-                    if 'min_amount' in filters and amount < filters['min_amount']:
-                        continue
-                    if 'max_amount' in filters and amount > filters['max_amount']:
-                        continue
-
-                # Text search filter
-                if 'search_text' in filters:
-                    search_text = filters['search_text']
-                    search_field = filters.get('search_field', 'All Fields')
-                    case_sensitive = filters.get('case_sensitive', False)
-
-                    if not case_sensitive:
-                        search_text = search_text.lower()
-
-                    found = False
-                    if search_field == 'Description' or search_field == 'All Fields':
-                        desc = income.get('description', '')
-                        if not case_sensitive:
-                            desc = desc.lower()
-                        if search_text in desc:
-                            found = True
-
-                    if search_field == 'All Fields' and not found:
-                        # Search in person name
-                        person = income.get('person', '')
-                        if not case_sensitive:
-                            person = person.lower()
-                        if search_text in person:
-                            found = True
-
-                    if not found:
-                        continue
-
-                # Person filter (for multiple persons)
-                if 'persons' in filters and len(filters['persons']) > 1:
-                    if income['person'] not in filters['persons']:
-                        continue
-
-                filtered_data.append(income)
+            filtered_data = [
+                income for income in income_data
+                if all(predicate(income) for predicate in predicates)
+            ]
 
             # Update the table with filtered data
             self.update_income_table(filtered_data)
@@ -523,46 +905,17 @@ class IncomeSubTab(QWidget):
     def update_income_table(self, income_data):
         """Update the income table with filtered data"""
         try:
-            # CRITICAL FIX: Disable sorting during table population
-            self.income_table.setSortingEnabled(False)
-
-            # Clear and populate table
-            self.income_table.setRowCount(0)
-
-            user_a, user_b = get_user_names()
-            user_a_total = 0
-            user_b_total = 0
+            # Populate table (the model re-applies the current sort)
+            self.income_model.set_income(income_data)
 
+            # Rows were filtered in Python, so total them here per person
+            totals = {}
             for income in income_data:
-                row = self.income_table.rowCount()
-                self.income_table.insertRow(row)
-
-                self.income_table.setItem(row, 0, DateTableWidgetItem(income['date']))
-                self.income_table.setItem(row, 1, QTableWidgetItem(income['person']))
-
-                amount = income['amount']
-                amount_item = CurrencyTableWidgetItem(f"${amount:,.2f}")
-                amount_item.setForeground(Qt.GlobalColor.darkGreen)
-                self.income_table.setItem(row, 2, amount_item)
-                self.income_table.setItem(row, 3, QTableWidgetItem(income.get('description', '')))
-                self.income_table.setItem(row, 4, QTableWidgetItem(str(income['id'])))
-
-                # Calculate totals
-                if income['person'] == user_a:
-                    user_a_total += amount
-                else:
-                    user_b_total += amount
-
-            # Update summary cards
-            self.user_a_summary.value_label.setText(f"${user_a_total:,.2f}")
-            self.user_b_summary.value_label.setText(f"${user_b_total:,.2f}")
-            self.total_summary.value_label.setText(f"${user_a_total + user_b_total:,.2f}")
+                totals[income['person']] = totals.get(income['person'], 0) + income['amount']
+            self.update_summary_cards(totals)
 
         except Exception as e:
             print(f"Error updating income table: {e}")
-        finally:
-            # CRITICAL FIX: Re-enable sorting after table population
-            self.income_table.setSortingEnabled(True)
 
     def show_advanced_filter(self):
         """Show the advanced filter dialog"""
@@ -586,11 +939,22 @@ class IncomeSubTab(QWidget):
 class ExpensesSubTab(QWidget):
     """Sub-tab for managing expense entries"""
     
-    def __init__(self):
+    def __init__(self, db=None):
         super().__init__()
-        self.db = DatabaseManager()
+        # BudgetTab passes down its shared DatabaseManager
+        self.db = db if db is not None else DatabaseManager()
         self.category_manager = get_category_manager()
         self.categories_data = self.category_manager.get_categories()
+        # User names read from settings once; see reload_user_names()
+        self._user_a, self._user_b = get_user_names()
+        # Summary card totals of the shown expenses: [user A, user B] and
+        # per category; set by refresh_data, updated in place by add_expense
+        self._person_totals = [0, 0]
+        self._category_totals = {}
+        # Category suggestions by normalized description, valid for
+        # _suggestion_cache_version; see _suggest_category()
+        self._suggestion_cache = {}
+        self._suggestion_cache_version = None
         self.init_ui()
         self.load_categories()  # Add this line to populate category dropdowns
         self.refresh_data()
@@ -599,8 +963,8 @@ class ExpensesSubTab(QWidget):
         """Initialize the Expenses UI"""
         layout = QVBoxLayout()
         
-        # Get user names from config
-        user_a, user_b = get_user_names()
+        # User names from config
+        user_a, user_b = self._user_a, self._user_b
         
         # Top section - Add Expense Form
         form_group = QGroupBox("Add Expense")
@@ -657,34 +1021,12 @@ class ExpensesSubTab(QWidget):
         button_layout = QHBoxLayout()
 
         add_btn = QPushButton("Add Expense")
-        add_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2a82da;
-                color: white;
-                padding: 8px;
-                font-weight: bold;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #1e5fa8;
-            }
-        """)
+        add_btn.setStyleSheet(_STYLE_PRIMARY_BTN)
         add_btn.clicked.connect(self.add_expense)
         button_layout.addWidget(add_btn)
         
         import_btn = QPushButton("Import from File")
-        import_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #5cb85c;
-                color: white;
-                padding: 8px;
-                font-weight: bold;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #449d44;
-            }
-        """)
+        import_btn.setStyleSheet(_STYLE_SUCCESS_BTN)
         import_btn.clicked.connect(self.import_expenses)
         button_layout.addWidget(import_btn)
         
@@ -737,10 +1079,7 @@ class ExpensesSubTab(QWidget):
         
         filter_layout.addWidget(QLabel("Month:"))
         self.filter_month = QComboBox()
-        self.filter_month.addItems([
-            "All", "January", "February", "March", "April", "May", "June",
-            "July", "August", "September", "October", "November", "December"
-        ])
+        self.filter_month.addItems(_MONTHS_LIST)
         # FIXED: Set to "All" by default instead of current month
         self.filter_month.setCurrentIndex(0)  # "All" is at index 0
         self.filter_month.currentIndexChanged.connect(self.refresh_data)
@@ -748,8 +1087,7 @@ class ExpensesSubTab(QWidget):
         
         filter_layout.addWidget(QLabel("Year:"))
         self.filter_year = QComboBox()
-        current_year = datetime.now().year
-        self.filter_year.addItems(["All"] + [str(year) for year in range(current_year - 2, current_year + 2)])
+        self.filter_year.addItems(_YEARS_LIST)
         # FIXED: Set to "All" by default instead of current year
         self.filter_year.setCurrentText("All")
         self.filter_year.currentTextChanged.connect(self.refresh_data)
@@ -760,37 +1098,11 @@ class ExpensesSubTab(QWidget):
         # Bulk selection controls
         bulk_layout = QHBoxLayout()
 
-        select_all_btn = QPushButton("Select All")
-        select_all_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #5bc0de;
-                color: white;
-                padding: 6px 12px;
-                font-weight: bold;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #46b8da;
-            }
-        """)
-        select_all_btn.clicked.connect(self.select_all_expenses)
-        bulk_layout.addWidget(select_all_btn)
-
-        select_none_btn = QPushButton("Select None")
-        select_none_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #777;
-                color: white;
-                padding: 6px 12px;
-                font-weight: bold;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #666;
-            }
-        """)
-        select_none_btn.clicked.connect(self.select_none_expenses)
-        bulk_layout.addWidget(select_none_btn)
+        # (label, stylesheet, slot) for each button, in layout order
+        self._add_buttons(bulk_layout, (
+            ("Select All", _STYLE_INFO_SMALL_BTN, self.select_all_expenses),
+            ("Select None", _STYLE_NEUTRAL_SMALL_BTN, self.select_none_expenses),
+        ))
 
         # Selected count label
         self.selected_count_label = QLabel("Selected: 0")
@@ -799,69 +1111,28 @@ class ExpensesSubTab(QWidget):
 
         bulk_layout.addStretch()
 
-        # Export and Delete buttons
-        export_btn = QPushButton("Export to CSV")
-        export_btn.clicked.connect(self.export_expenses)
-        bulk_layout.addWidget(export_btn)
-
-        delete_btn = QPushButton("Delete Selected")
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #d9534f;
-                color: white;
-                padding: 8px 16px;
-                font-weight: bold;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #c9302c;
-            }
-        """)
-        delete_btn.clicked.connect(self.delete_selected_expenses)
-        bulk_layout.addWidget(delete_btn)
-
-        # Add Clear All Expenses button
-        clear_all_btn = QPushButton("Clear All Expenses")
-        clear_all_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #d9534f;
-                color: white;
-                padding: 8px 16px;
-                font-weight: bold;
-                border-radius: 4px;
-                border: 2px solid #c9302c;
-            }
-            QPushButton:hover {
-                background-color: #c9302c;
-                border-color: #ac2925;
-            }
-        """)
-        clear_all_btn.clicked.connect(self.clear_all_expenses)
-        bulk_layout.addWidget(clear_all_btn)
+        # Export, Delete and Clear All Expenses buttons
+        self._add_buttons(bulk_layout, (
+            ("Export to CSV", None, self.export_expenses),
+            ("Delete Selected", _STYLE_DANGER_BTN, self.delete_selected_expenses),
+            ("Clear All Expenses", _STYLE_DANGER_OUTLINED_BTN, self.clear_all_expenses),
+        ))
 
         history_layout.addLayout(filter_layout)
         history_layout.addLayout(bulk_layout)
 
-        # Expense table
-        self.expense_table = QTableWidget()
-        self.expense_table.setColumnCount(10)  # Added column for realized status
-        self.expense_table.setHorizontalHeaderLabels([
-            "Select", "Date", "Person", "Amount", "Category", "Subcategory",
-            "Description", "Payment", "Joint Account", "ID"
-        ])
-        self.expense_table.hideColumn(9)  # Hide ID column (moved to position 9)
+        # Expense table - a view over ExpenseTableModel; ids and check
+        # states stay in the model
+        self.expense_model = ExpenseTableModel(self)
+        self.expense_model.realized_toggled.connect(self.on_realized_toggled)
+        # Ticking a Select box (or select all/none, or a reload) updates the count
+        self.expense_model.dataChanged.connect(self.on_expense_data_changed)
+        self.expense_model.modelReset.connect(self.update_selected_count)
+        self.expense_table = QTableView()
+        self.expense_table.setModel(self.expense_model)
 
         # Set column widths
-        header = self.expense_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)      # Select checkbox
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)  # Date
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # Person
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)  # Amount
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)  # Category
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)  # Subcategory
-        header.setSectionResizeMode(6, QHeaderView.ResizeMode.Stretch)           # Description
-        header.setSectionResizeMode(7, QHeaderView.ResizeMode.ResizeToContents)  # Payment
-        header.setSectionResizeMode(8, QHeaderView.ResizeMode.Fixed)      # Joint Account checkbox
+        self.apply_expense_resize_modes()
 
         self.expense_table.setColumnWidth(0, 80)  # Select column width
         self.expense_table.setColumnWidth(8, 100)  # Joint Account column width
@@ -869,11 +1140,8 @@ class ExpensesSubTab(QWidget):
         # Enable sorting and alternating row colors
         self.expense_table.setSortingEnabled(True)
         self.expense_table.setAlternatingRowColors(True)
-        self.expense_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.expense_table.setSelectionMode(QTableWidget.SelectionMode.MultiSelection)
-
-        # Connect cell click to handle checkbox selection
-        self.expense_table.cellClicked.connect(self.on_cell_clicked)
+        self.expense_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.expense_table.setSelectionMode(QTableView.SelectionMode.MultiSelection)
 
         history_layout.addWidget(self.expense_table)
         history_group.setLayout(history_layout)
@@ -881,19 +1149,20 @@ class ExpensesSubTab(QWidget):
         layout.addWidget(history_group)
         self.setLayout(layout)
 
+    @staticmethod
+    def _add_buttons(layout, buttons):
+        """Add (label, stylesheet or None, slot) push buttons to a layout"""
+        for label, style, slot in buttons:
+            button = QPushButton(label)
+            if style:
+                button.setStyleSheet(style)
+            button.clicked.connect(slot)
+            layout.addWidget(button)
+
     def create_summary_card(self, title, value):
         """Create a summary card widget"""
         group = QGroupBox(title)
-        group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #555;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-                min-width: 150px;
-            }
-        """)
+        group.setStyleSheet(_STYLE_EXPENSE_SUMMARY_GROUP)
 
         layout = QVBoxLayout()
         value_label = QLabel(value)
@@ -906,11 +1175,39 @@ class ExpensesSubTab(QWidget):
         group.value_label = value_label  # Store reference for updating
         return group
 
+    def reload_user_names(self):
+        """Re-read the user names after the settings may have changed"""
+        self._user_a, self._user_b = get_user_names()
+
+    # Expense table section resize modes, by column
+    EXPENSE_RESIZE_MODES = (
+        QHeaderView.ResizeMode.Fixed,             # Select checkbox
+        QHeaderView.ResizeMode.ResizeToContents,  # Date
+        QHeaderView.ResizeMode.ResizeToContents,  # Person
+        QHeaderView.ResizeMode.ResizeToContents,  # Amount
+        QHeaderView.ResizeMode.ResizeToContents,  # Category
+        QHeaderView.ResizeMode.ResizeToContents,  # Subcategory
+        QHeaderView.ResizeMode.Stretch,           # Description
+        QHeaderView.ResizeMode.ResizeToContents,  # Payment
+        QHeaderView.ResizeMode.Fixed,             # Joint Account checkbox
+    )
+
+    def apply_expense_resize_modes(self):
+        """Set the expense table's per-column resize modes"""
+        header = self.expense_table.horizontalHeader()
+        # Size ResizeToContents columns from the visible rows plus a sample,
+        # rather than calling the model's data() for every row and role
+        header.setResizeContentsPrecision(_RESIZE_CONTENTS_PRECISION)
+        for column, mode in enumerate(self.EXPENSE_RESIZE_MODES):
+            header.setSectionResizeMode(column, mode)
+
     def load_categories(self):
         """Load categories from the centralized category manager"""
         try:
             # Get categories from centralized manager
             self.categories_data = self.category_manager.get_categories()
+            # Suggestions may name categories that no longer exist
+            self._suggestion_cache.clear()
 
             # Populate category combo
             self.category_combo.clear()
@@ -929,15 +1226,35 @@ class ExpensesSubTab(QWidget):
         if category in self.categories_data:
             self.subcategory_combo.addItems(self.categories_data[category])
 
+    def _suggest_category(self, description):
+        """
+        Return the learned category suggestion for a normalized description.
+
+        Suggestions are remembered until the database changes, since both the
+        category history and the expenses table feed them. Descriptions with
+        no suggestion are not remembered, so they are looked up again once
+        something has been learned.
+        """
+        data_version = self.db.data_version
+        if data_version != self._suggestion_cache_version:
+            self._suggestion_cache.clear()
+            self._suggestion_cache_version = data_version
+        suggestion = self._suggestion_cache.get(description)
+        if suggestion is None:
+            suggestion = self.db.get_suggested_category(description)
+            if suggestion is not None:
+                self._suggestion_cache[description] = suggestion
+        return suggestion
+
     def suggest_category_from_description(self):
         """Suggest category and subcategory based on description using learned patterns"""
-        description = self.description_input.text().strip()
+        description = self.description_input.text().strip().lower()
         if not description:
             return
 
         try:
-            # Get suggested category from database
-            suggestion = self.db.get_suggested_category(description)
+            # Get suggested category from database (memoized per description)
+            suggestion = self._suggest_category(description)
 
             if suggestion and suggestion.get('confidence', 0) > 0.3:
                 category = suggestion['category']
@@ -992,7 +1309,7 @@ class ExpensesSubTab(QWidget):
                 return
 
             try:
-                amount = float(amount_text.replace(",", "").replace("$", ""))
+                amount = float(_AMOUNT_STRIP.sub('', amount_text))
             except ValueError:
                 QMessageBox.warning(self, "Warning", "Please enter a valid number for amount")
                 return
@@ -1003,9 +1320,8 @@ class ExpensesSubTab(QWidget):
             # Use database context manager to ensure proper transaction handling
             with self.db as db:
                 # Add to database using the ExpenseModel.add method
-                from src.database.models import ExpenseModel
-                ExpenseModel.add(db, date, person, amount, category, subcategory,
-                               description, payment_method, realized)
+                expense_id = ExpenseModel.add(db, date, person, amount, category, subcategory,
+                                              description, payment_method, realized)
 
                 # Force commit within the transaction
                 db.commit()
@@ -1017,36 +1333,29 @@ class ExpensesSubTab(QWidget):
                     except Exception as e:
                         print(f"DEBUG: Could not save category mapping: {e}")
 
-                # Verify the expense was added by checking the database immediately
-                verify_expenses = db.get_expenses()
-                print(f"DEBUG: Total expenses in database after add: {len(verify_expenses)}")
-
-                # Check if our specific expense is there
-                our_expense = [exp for exp in verify_expenses if
-                              exp['date'] == date and
-                              exp['person'] == person and
-                              abs(exp['amount'] - amount) < 0.01]
-                print(f"DEBUG: Found our expense: {len(our_expense) > 0}")
-
             # Clear form
             self.amount_input.clear()
             self.description_input.clear()
             self.realized_checkbox.setChecked(False)  # Reset checkbox
 
-            # Add a longer delay to ensure database consistency across all connections
-            import time
-            time.sleep(0.2)  # Increase delay
-
             # Debug: Check what filters are currently set
             print(f"DEBUG: Current filters - Person: {self.filter_person.currentText()}, "
                   f"Month: {self.filter_month.currentText()}, Year: {self.filter_year.currentText()}, "
                   f"Category: {self.filter_category.currentText()}")
 
-            # Refresh display
-            self.refresh_data()
-
-            # Debug: Check table count after refresh
-            print(f"DEBUG: Table rows after refresh: {self.expense_table.rowCount()}")
+            # Show the new expense without reloading the table: insert its row
+            # and add it to the running summary totals
+            expense = {
+                'id': expense_id, 'date': date, 'person': person, 'amount': amount,
+                'category': category, 'subcategory': subcategory,
+                'description': description, 'payment_method': payment_method,
+                'realized': 1 if realized else 0,
+            }
+            if self.matches_expense_filters(expense):
+                self.expense_model.append_expense(expense)
+                self._person_totals[0 if person == self._user_a else 1] += amount
+                self._category_totals[category] = self._category_totals.get(category, 0) + amount
+                self.show_expense_summary()
 
             QMessageBox.information(self, "Success", "Expense added successfully!")
 
@@ -1114,8 +1423,7 @@ class ExpensesSubTab(QWidget):
 
             # Feature 1: Prompt user for who these expenses are for
             from PyQt6.QtWidgets import QInputDialog
-            user_a_name, user_b_name = get_user_names()
-            persons = [user_a_name, user_b_name]
+            persons = [self._user_a, self._user_b]
             default_person, ok = QInputDialog.getItem(
                 self,
                 "Who are these expenses for?",
@@ -1129,8 +1437,6 @@ class ExpensesSubTab(QWidget):
                 return  # User cancelled
 
             # Use the new BulkImportPreviewDialog with proper category handling
-            from src.gui.utils.bulk_import_dialog import BulkImportPreviewDialog
-
             # Get categories from the loader to ensure they match
             loader_categories = loader.get_available_categories()
 
@@ -1171,42 +1477,15 @@ class ExpensesSubTab(QWidget):
                 return
                 
             # Get current filter settings
-            person_filter = None if self.filter_person.currentText() == "All" else self.filter_person.currentText()
-            category_filter = None if self.filter_category.currentText() == "All Categories" else self.filter_category.currentText()
-            
-            # Build date filters
-            start_date = None
-            end_date = None
+            start_date, end_date, person_filter, category_filter = self.expense_filters()
             
-            if self.filter_month.currentIndex() > 0 and self.filter_year.currentText() != "All":
-                year = int(self.filter_year.currentText())
-                month = self.filter_month.currentIndex()
-                start_date = f"{year:04d}-{month:02d}-01"
-                if month == 12:
-                    end_date = f"{year+1:04d}-01-01"
-                else:
-                    end_date = f"{year:04d}-{month+1:02d}-01"
-            
-            # Get expense data
-            expenses = self.db.get_expenses(start_date, end_date, person_filter, category_filter)
-            
-            # Write to CSV
+            # Write to CSV, streaming rows straight from the query
             with open(file_path, 'w', newline='') as csvfile:
-                fieldnames = ['date', 'person', 'amount', 'category', 'subcategory', 
-                            'description', 'payment_method']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                writer.writeheader()
-                for expense in expenses:
-                    writer.writerow({
-                        'date': expense['date'],
-                        'person': expense['person'],
-                        'amount': expense['amount'],
-                        'category': expense['category'],
-                        'subcategory': expense['subcategory'],
-                        'description': expense.get('description', ''),
-                        'payment_method': expense.get('payment_method', '')
-                    })
+                writer = csv.writer(csvfile)
+                writer.writerow(['date', 'person', 'amount', 'category', 'subcategory',
+                                 'description', 'payment_method'])
+                writer.writerows(ExpenseModel.iter_export_rows(
+                    self.db, start_date, end_date, person_filter, category_filter))
             
             QMessageBox.information(self, "Success", f"Expenses exported to {file_path}")
             
@@ -1215,17 +1494,10 @@ class ExpensesSubTab(QWidget):
             
     def delete_selected_expenses(self):
         """Delete selected expense entries"""
-        selected_rows = []
+        # Ids of the rows ticked in the Select column
+        selected_ids = self.expense_model.checked_ids()
 
-        # Check which rows have their checkboxes selected
-        for row in range(self.expense_table.rowCount()):
-            checkbox_widget = self.expense_table.cellWidget(row, 0)
-            if checkbox_widget:
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                if checkbox and checkbox.isChecked():
-                    selected_rows.append(row)
-
-        if not selected_rows:
+        if not selected_ids:
             QMessageBox.warning(self, "Warning", "Please select one or more expense entries to delete using the checkboxes.")
             return
 
@@ -1233,7 +1505,7 @@ class ExpensesSubTab(QWidget):
         reply = QMessageBox.question(
             self,
             "Confirm Deletion",
-            f"Are you sure you want to delete {len(selected_rows)} expense entr{'y' if len(selected_rows) == 1 else 'ies'}?\n\nThis action cannot be undone.",
+            f"Are you sure you want to delete {len(selected_ids)} expense entr{'y' if len(selected_ids) == 1 else 'ies'}?\n\nThis action cannot be undone.",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No
         )
@@ -1242,19 +1514,8 @@ class ExpensesSubTab(QWidget):
             return
 
         try:
-            # Delete each selected expense entry
-            deleted_count = 0
-            for row in reversed(selected_rows):  # Reverse to maintain row indices
-                expense_id_item = self.expense_table.item(row, 9)  # ID is in column 9 (the last column)
-                if expense_id_item:
-                    expense_id = int(expense_id_item.text())
-                    print(f"DEBUG: Attempting to delete expense ID {expense_id}")
-
-                    # Delete from database using the model's delete method
-                    from src.database.models import ExpenseModel
-                    ExpenseModel.delete(self.db, expense_id)
-                    deleted_count += 1
-                    print(f"DEBUG: Successfully deleted expense ID {expense_id}")
+            # Delete every selected expense entry in one transaction
+            deleted_count = ExpenseModel.delete_many(self.db, selected_ids)
 
             # Refresh the table
             self.refresh_data()
@@ -1337,31 +1598,10 @@ class ExpensesSubTab(QWidget):
             button_layout = QHBoxLayout()
 
             proceed_btn = QPushButton("Proceed")
-            proceed_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #d9534f;
-                    color: white;
-                    padding: 8px 16px;
-                    font-weight: bold;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #c9302c;
-                }
-            """)
+            proceed_btn.setStyleSheet(_STYLE_DANGER_BTN)
 
             cancel_btn = QPushButton("Cancel")
-            cancel_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #777;
-                    color: white;
-                    padding: 8px 16px;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #666;
-                }
-            """)
+            cancel_btn.setStyleSheet(_STYLE_CANCEL_BTN)
 
             button_layout.addWidget(cancel_btn)
             button_layout.addWidget(proceed_btn)
@@ -1390,10 +1630,10 @@ class ExpensesSubTab(QWidget):
                 else:
                     end_date = f"{year:04d}-{month+1:02d}-01"
 
-                # Get expenses for this month
-                month_expenses = self.db.get_expenses(start_date, end_date)
+                # Count and total this month's expenses per person in SQL
+                month_summary = ExpenseModel.summarize_range(self.db, start_date, end_date)
 
-                if not month_expenses:
+                if not month_summary:
                     QMessageBox.information(
                         self,
                         "No Expenses Found",
@@ -1402,14 +1642,13 @@ class ExpensesSubTab(QWidget):
                     return
 
                 # Show summary and confirm
-                user_a, user_b = get_user_names()
-                user_a_count = sum(1 for exp in month_expenses if exp['person'] == user_a)
-                user_b_count = sum(1 for exp in month_expenses if exp['person'] == user_b)
-                user_a_total = sum(exp['amount'] for exp in month_expenses if exp['person'] == user_a)
-                user_b_total = sum(exp['amount'] for exp in month_expenses if exp['person'] == user_b)
+                user_a, user_b = self._user_a, self._user_b
+                user_a_count, user_a_total = month_summary.get(user_a, (0, 0.0))
+                user_b_count, user_b_total = month_summary.get(user_b, (0, 0.0))
+                month_count = sum(count for count, _total in month_summary.values())
 
                 confirmation_msg = (
-                    f"Found {len(month_expenses)} expenses for {month_name} {year}:\n\n"
+                    f"Found {month_count} expenses for {month_name} {year}:\n\n"
                     f"{user_a}: {user_a_count} expenses, ${user_a_total:,.2f}\n"
                     f"{user_b}: {user_b_count} expenses, ${user_b_total:,.2f}\n"
                     f"Total: ${user_a_total + user_b_total:,.2f}\n\n"
@@ -1428,12 +1667,8 @@ class ExpensesSubTab(QWidget):
                 if reply != QMessageBox.StandardButton.Yes:
                     return
 
-                # Delete expenses for this month
-                from src.database.models import ExpenseModel
-                deleted_count = 0
-                for expense in month_expenses:
-                    ExpenseModel.delete(self.db, expense['id'])
-                    deleted_count += 1
+                # Delete expenses for this month in one statement
+                deleted_count = ExpenseModel.delete_range(self.db, start_date, end_date)
 
                 # Refresh the table
                 self.refresh_data()
@@ -1464,7 +1699,6 @@ class ExpensesSubTab(QWidget):
                     return
 
                 # Use the ExpenseModel.clear_all method to completely clear expenses
-                from src.database.models import ExpenseModel
                 count = ExpenseModel.clear_all(self.db)
 
                 # Refresh the table to show empty state
@@ -1481,78 +1715,68 @@ class ExpensesSubTab(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to clear expenses: {str(e)}")
 
-    def on_cell_clicked(self, row, column):
-        """Handle cell clicks to toggle checkboxes when clicking anywhere in the row"""
-        if column == 0:
-            # Direct checkbox click - let it handle itself
-            return
-
-        # For clicks on other columns, toggle the checkbox in column 0
-        checkbox_widget = self.expense_table.cellWidget(row, 0)
-        if checkbox_widget:
-            checkbox = checkbox_widget.findChild(QCheckBox)
-            if checkbox:
-                checkbox.setChecked(not checkbox.isChecked())
-                self.update_selected_count()
-
     def select_all_expenses(self):
         """Select all expense entries"""
-        for row in range(self.expense_table.rowCount()):
-            checkbox_widget = self.expense_table.cellWidget(row, 0)
-            if checkbox_widget:
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                if checkbox:
-                    checkbox.setChecked(True)
-        self.update_selected_count()
+        self.expense_model.set_all_checked(True)
 
     def select_none_expenses(self):
         """Deselect all expense entries"""
-        for row in range(self.expense_table.rowCount()):
-            checkbox_widget = self.expense_table.cellWidget(row, 0)
-            if checkbox_widget:
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                if checkbox:
-                    checkbox.setChecked(False)
-        self.update_selected_count()
+        self.expense_model.set_all_checked(False)
+
+    def on_expense_data_changed(self, top_left, bottom_right, roles=()):
+        """Recount the selection when the Select column changed (not Joint Account toggles)"""
+        if top_left.column() <= ExpenseTableModel.SELECT_COLUMN <= bottom_right.column():
+            self.update_selected_count()
 
     def update_selected_count(self):
         """Update the selected count label"""
-        selected_count = 0
-        for row in range(self.expense_table.rowCount()):
-            checkbox_widget = self.expense_table.cellWidget(row, 0)
-            if checkbox_widget:
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                if checkbox and checkbox.isChecked():
-                    selected_count += 1
+        self.selected_count_label.setText(f"Selected: {self.expense_model.checked_count()}")
+
+    def expense_filters(self):
+        """
+        Read the expense filter combos.
+
+        Dates are only filtered when both a month and a year are selected
+        (not "All"); end_date is the exclusive first day of the next month.
+
+        Returns:
+            tuple: (start_date, end_date, person, category), None where unfiltered
+        """
+        person_filter = None if self.filter_person.currentText() == "All" else self.filter_person.currentText()
+        category_filter = None if self.filter_category.currentText() == "All Categories" else self.filter_category.currentText()
+
+        start_date = None
+        end_date = None
+        if (self.filter_month.currentIndex() > 0 and
+            self.filter_year.currentText() != "All"):
+            year = int(self.filter_year.currentText())
+            month = self.filter_month.currentIndex()
+            start_date = f"{year:04d}-{month:02d}-01"
+            if month == 12:
+                end_date = f"{year+1:04d}-01-01"
+            else:
+                end_date = f"{year:04d}-{month+1:02d}-01"
+
+        return start_date, end_date, person_filter, category_filter
 
-        self.selected_count_label.setText(f"Selected: {selected_count}")
+    def matches_expense_filters(self, expense):
+        """Check whether an expense dict passes the current filter combos"""
+        start_date, end_date, person_filter, category_filter = self.expense_filters()
+        if person_filter and expense['person'] != person_filter:
+            return False
+        if category_filter and expense['category'] != category_filter:
+            return False
+        if start_date and not (start_date <= expense['date'] < end_date):
+            return False
+        return True
 
     def refresh_data(self):
         """Refresh the expense data display"""
         try:
             print("DEBUG: Starting refresh_data")
 
-            # CRITICAL FIX: Disable sorting during table population to prevent column disappearing
-            self.expense_table.setSortingEnabled(False)
-
             # Build filter parameters
-            person_filter = None if self.filter_person.currentText() == "All" else self.filter_person.currentText()
-            category_filter = None if self.filter_category.currentText() == "All Categories" else self.filter_category.currentText()
-
-            # Date filters - Show all expenses when filters are "All"
-            start_date = None
-            end_date = None
-
-            # Only apply date filtering if BOTH month AND year are explicitly selected (not "All")
-            if (self.filter_month.currentIndex() > 0 and
-                self.filter_year.currentText() != "All"):
-                year = int(self.filter_year.currentText())
-                month = self.filter_month.currentIndex()
-                start_date = f"{year:04d}-{month:02d}-01"
-                if month == 12:
-                    end_date = f"{year+1:04d}-01-01"
-                else:
-                    end_date = f"{year:04d}-{month+1:02d}-01"
+            start_date, end_date, person_filter, category_filter = self.expense_filters()
 
             print(f"DEBUG: Filter parameters - Person: {person_filter}, Category: {category_filter}, "
                   f"Start Date: {start_date}, End Date: {end_date}")
@@ -1564,12 +1788,12 @@ class ExpensesSubTab(QWidget):
             if expense_data:
                 print(f"DEBUG: First expense has fields: {list(expense_data[0].keys())}")
 
-            # Clear and populate table
-            self.expense_table.setRowCount(0)
-            print(f"DEBUG: Cleared table, now has {self.expense_table.rowCount()} rows")
+            # ResizeToContents re-measuring is suspended while the model is
+            # reset (restored in the finally block)
+            self.expense_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
 
             # Calculate totals from ALL filtered data (not just visible)
-            user_a, user_b = get_user_names()
+            user_a, user_b = self._user_a, self._user_b
             user_a_total = 0
             user_b_total = 0
             category_totals = {}
@@ -1590,91 +1814,18 @@ class ExpensesSubTab(QWidget):
                     category_totals[category] = 0
                 category_totals[category] += amount
 
-            # Update summary cards FIRST with calculated totals
-            self.user_a_summary.value_label.setText(f"${user_a_total:,.2f}")
-            self.user_b_summary.value_label.setText(f"${user_b_total:,.2f}")
-            self.total_summary.value_label.setText(f"${user_a_total + user_b_total:,.2f}")
-
-            # Find and display top category
-            if category_totals:
-                top_category = max(category_totals, key=category_totals.get)
-                self.top_category_summary.value_label.setText(
-                    f"{top_category}\n${category_totals[top_category]:,.2f}"
-                )
-            else:
-                self.top_category_summary.value_label.setText("None")
-
-            # Now populate the table with the same data
-            for i, expense in enumerate(expense_data):
-                row = self.expense_table.rowCount()
-                self.expense_table.insertRow(row)
-
-                # Add checkbox in first column using centralized styling
-                checkbox = create_table_checkbox("Click to select this expense for deletion")
-                checkbox.setObjectName("table-select")
-                checkbox.stateChanged.connect(self.update_selected_count)
-
-                checkbox_widget = QWidget()
-                checkbox_layout = QHBoxLayout(checkbox_widget)
-                checkbox_layout.addWidget(checkbox)
-                checkbox_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                checkbox_layout.setContentsMargins(0, 0, 0, 0)
-                self.expense_table.setCellWidget(row, 0, checkbox_widget)
+            # Update summary cards FIRST with calculated totals; they are
+            # kept so add_expense can update the cards without a reload
+            self._person_totals = [user_a_total, user_b_total]
+            self._category_totals = category_totals
+            self.show_expense_summary()
 
-                # Date
-                self.expense_table.setItem(row, 1, DateTableWidgetItem(expense['date']))
+            # Now show the same data; the model formats every row in one reset
+            self.expense_model.set_expenses(expense_data)
 
-                # Person
-                self.expense_table.setItem(row, 2, QTableWidgetItem(expense['person']))
-
-                # Amount
-                amount = expense['amount']
-                amount_item = CurrencyTableWidgetItem(f"${amount:,.2f}")
-                amount_item.setForeground(Qt.GlobalColor.red)
-                self.expense_table.setItem(row, 3, amount_item)
-
-                # Category
-                self.expense_table.setItem(row, 4, QTableWidgetItem(expense['category']))
-
-                # Subcategory
-                self.expense_table.setItem(row, 5, QTableWidgetItem(expense['subcategory']))
-
-                # Description
-                self.expense_table.setItem(row, 6, QTableWidgetItem(expense.get('description', '')))
-
-                # Payment Method
-                self.expense_table.setItem(row, 7, QTableWidgetItem(expense.get('payment_method', 'Credit Card')))
-
-                # Joint Account (realized) checkbox
-                realized_checkbox = QCheckBox()
-                realized_checkbox.setChecked(expense.get('realized', False))
-                realized_checkbox.setToolTip("Click to toggle if this expense has been paid from joint account")
-                # Store expense ID in the checkbox for easy access
-                realized_checkbox.setProperty("expense_id", expense['id'])
-                realized_checkbox.stateChanged.connect(self.on_realized_checkbox_changed)
-
-                realized_widget = QWidget()
-                realized_layout = QHBoxLayout(realized_widget)
-                realized_layout.addWidget(realized_checkbox)
-                realized_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                realized_layout.setContentsMargins(0, 0, 0, 0)
-                self.expense_table.setCellWidget(row, 8, realized_widget)
-
-                # ID (hidden)
-                self.expense_table.setItem(row, 9, QTableWidgetItem(str(expense['id'])))
-
-                # Debug first few rows
-                if i < 3:
-                    print(f"DEBUG: Added row {row} - {expense['date']} | {expense['person']} | ${expense['amount']:.2f} | "
-                          f"{expense['category']} | {expense['subcategory']} | {expense['description']} | "
-                          f"{expense['payment_method']} | Joint: {expense['realized']}")
-
-            print(f"DEBUG: Final table row count: {self.expense_table.rowCount()}")
+            print(f"DEBUG: Final table row count: {self.expense_model.rowCount()}")
             print(f"DEBUG: Summary totals - {user_a}: ${user_a_total:,.2f}, {user_b}: ${user_b_total:,.2f}, Total: ${user_a_total + user_b_total:,.2f}")
 
-            # CRITICAL FIX: Re-enable sorting AFTER table population is complete
-            self.expense_table.setSortingEnabled(True)
-
             # Force column width refresh to ensure all columns are visible
             self.expense_table.resizeColumnsToContents()
 
@@ -1682,9 +1833,6 @@ class ExpensesSubTab(QWidget):
             self.expense_table.setColumnWidth(0, 80)   # Select column
             self.expense_table.setColumnWidth(8, 100)  # Joint Account column
 
-            # Update selected count
-            self.update_selected_count()
-
             print("DEBUG: refresh_data completed successfully")
 
         except Exception as e:
@@ -1692,34 +1840,45 @@ class ExpensesSubTab(QWidget):
             import traceback
             traceback.print_exc()
         finally:
-            # Ensure sorting is always re-enabled even if there's an error
-            self.expense_table.setSortingEnabled(True)
+            # Ensure resize modes are always restored even if there's an error
+            self.apply_expense_resize_modes()
+
+    def show_expense_summary(self):
+        """Show the running person and category totals in the summary cards"""
+        user_a_total, user_b_total = self._person_totals
+        category_totals = self._category_totals
+        self.user_a_summary.value_label.setText(f"${user_a_total:,.2f}")
+        self.user_b_summary.value_label.setText(f"${user_b_total:,.2f}")
+        self.total_summary.value_label.setText(f"${user_a_total + user_b_total:,.2f}")
+
+        # Find and display top category
+        if category_totals:
+            top_category = max(category_totals, key=category_totals.get)
+            self.top_category_summary.value_label.setText(
+                f"{top_category}\n${category_totals[top_category]:,.2f}"
+            )
+        else:
+            self.top_category_summary.value_label.setText("None")
+
+    def on_realized_toggled(self, expense_id, realized):
+        """Persist a Joint Account (realized) toggle made in the expense table"""
+        try:
+            # Update the expense in the database
+            if realized:
+                ExpenseModel.mark_as_realized(self.db, expense_id)
+            else:
+                ExpenseModel.mark_as_unrealized(self.db, expense_id)
 
-    def on_realized_checkbox_changed(self, state):
-        """Handle changes to the realized checkbox (joint account status)"""
-        checkbox = self.sender()
-        if checkbox and checkbox.property("expense_id"):
-            expense_id = checkbox.property("expense_id")
-            realized = state == Qt.CheckState.Checked.value
+            # Optional: Show a brief notification (you can remove this if it's too noisy)
+            # QMessageBox.information(
+            #     self,
+            #     "Updated",
+            #     f"Expense marked as {'realized' if realized else 'unrealized'}"
+            # )
 
-            try:
-                # Update the expense in the database
-                from src.database.models import ExpenseModel
-                if realized:
-                    ExpenseModel.mark_as_realized(self.db, expense_id)
-                else:
-                    ExpenseModel.mark_as_unrealized(self.db, expense_id)
-
-                # Optional: Show a brief notification (you can remove this if it's too noisy)
-                # QMessageBox.information(
-                #     self,
-                #     "Updated",
-                #     f"Expense marked as {'realized' if realized else 'unrealized'}"
-                # )
-
-            except Exception as e:
-                # Revert the checkbox state if the database update failed
-                checkbox.setChecked(not realized)
-                QMessageBox.critical(self, "Error", f"Failed to update expense: {str(e)}")
-                print(f"Error updating expense {expense_id}: {e}")
+        except Exception as e:
+            # Revert the checkbox state if the database update failed
+            self.expense_model.set_realized(expense_id, not realized)
+            QMessageBox.critical(self, "Error", f"Failed to update expense: {str(e)}")
+            print(f"Error updating expense {expense_id}: {e}")
 
@@ -17,6 +17,7 @@ from datetime import datetime
 import csv
 from src.database.db_manager import DatabaseManager
 from src.config import get_user_names
+from src.gui.tabs.base import RefreshableTab
 
 # Define asset categories and subcategories with default liquidity ratings
 ASSET_CATEGORIES = {
@@ -255,7 +256,7 @@ class AddCategoryDialog(QDialog):
         }
 
 
-class NetWorthTab(QWidget):
+class NetWorthTab(RefreshableTab):
     def __init__(self):
         super().__init__()
         self.db = DatabaseManager()
@@ -3,7 +3,7 @@ Budget Overview Tab - Synopsis of spending and income for the month
 """
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QGroupBox, QGridLayout, QComboBox, QFrame
 )
 from PyQt6.QtCore import Qt, QDate
@@ -11,8 +11,9 @@ from PyQt6.QtGui import QFont
 from datetime import datetime
 from src.database.db_manager import DatabaseManager
 from src.config import get_user_names
+from src.gui.tabs.base import RefreshableTab
 
-class OverviewTab(QWidget):
+class OverviewTab(RefreshableTab):
     def __init__(self):
         super().__init__()
         self.db = DatabaseManager()
@@ -169,14 +170,31 @@ class OverviewTab(QWidget):
     def refresh_data(self):
         """Refresh the overview data"""
         try:
-            month = self.month_combo.currentIndex() + 1
-            year = int(self.year_combo.currentText())
-            
-            # Get user names from config
-            user_a_name, user_b_name = get_user_names()
+            self.apply_data(self.fetch_data(*self.fetch_args()))
+        except Exception as e:
+            print(f"Error refreshing overview data: {e}")
+            import traceback
+            traceback.print_exc()
             
-            # Get monthly summary from database
-            summary = self.db.get_monthly_summary(year, month)
+    def fetch_args(self):
+        """Snapshot the selected month for a (possibly background) fetch"""
+        month = self.month_combo.currentIndex() + 1
+        year = int(self.year_combo.currentText())
+        
+        # Get user names from config
+        user_a_name, user_b_name = get_user_names()
+        return year, month, user_a_name, user_b_name
+        
+    def fetch_data(self, year, month, user_a_name, user_b_name):
+        """Query the monthly summary; safe to run on a worker thread"""
+        with self.db.reader() as conn:
+            summary = self.db.get_monthly_summary(year, month, conn=conn)
+        return year, month, user_a_name, user_b_name, summary
+        
+    def apply_data(self, result):
+        """Update the summary cards from fetch_data's result"""
+        try:
+            year, month, user_a_name, user_b_name, summary = result
             
             # Update Income Card - use safe label access
             user_a_income = summary['income'].get(user_a_name, 0)
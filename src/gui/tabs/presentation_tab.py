@@ -12,8 +12,9 @@ from src.database.models import IncomeModel, ExpenseModel, BudgetEstimateModel
 from src.database.category_manager import get_category_manager
 from src.gui.utils.category_detail_dialog import CategoryDetailDialog
 from src.config import get_user_names
+from src.gui.tabs.base import RefreshableTab
 
-class PresentationTab(QWidget):
+class PresentationTab(RefreshableTab):
     """Monthly presentation tab with subtabs"""
 
     def __init__(self, db):
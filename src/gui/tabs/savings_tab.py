@@ -19,8 +19,9 @@ import csv
 from src.database.db_manager import DatabaseManager
 from src.database.models import SavingsGoalModel, SavingsAllocationModel
 from src.gui.utils.goal_edit_dialog import GoalEditDialog
+from src.gui.tabs.base import RefreshableTab
 
-class SavingsTab(QWidget):
+class SavingsTab(RefreshableTab):
     """Tab for managing savings goals and fund allocation"""
 
     def __init__(self, db_manager):
@@ -24,8 +24,9 @@ from collections import defaultdict
 
 from src.database.db_manager import DatabaseManager
 from src.config import get_user_names
+from src.gui.tabs.base import RefreshableTab
 
-class TrendsTab(QWidget):
+class TrendsTab(RefreshableTab):
     """Trends and analytics tab"""
     
     def __init__(self, db=None):
@@ -35,6 +35,11 @@ import re
 from src.database.category_manager import get_category_manager
 from src.config import get_user_names
 
+# Everything but digits, the decimal point and the minus sign; compiled once
+# for the per-row amount parsing in bulk imports
+_AMOUNT_NON_NUMERIC = re.compile(r'[^\d.-]')
+
+
 class ExpenseLoader:
     """
     Utility class for loading expenses from various file formats.
@@ -595,7 +600,7 @@ class ExpenseLoader:
             return 0.0
 
         # Remove currency symbols, commas, and spaces
-        cleaned = re.sub(r'[^\d.-]', '', amount_str.strip())
+        cleaned = _AMOUNT_NON_NUMERIC.sub('', amount_str.strip())
 
         try:
             return float(cleaned) if cleaned else 0.0
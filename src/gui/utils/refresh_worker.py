@@ -0,0 +1,88 @@
+"""
+Background Data Refresh Worker
+==============================
+
+This module moves the data-fetching half of a tab refresh onto Qt's global
+thread pool so that switching tabs never blocks the GUI thread on SQLite.
+
+A tab opts in to background refreshes by providing three methods:
+- fetch_args(): Runs on the GUI thread; snapshots widget state (selected
+  month, filters, ...) into plain Python values
+- fetch_data(*args): Runs on a worker thread; performs the queries and
+  returns plain Python data. Must not touch widgets or the shared
+  DatabaseManager connection (use DatabaseManager.reader() instead)
+- apply_data(result): Runs on the GUI thread; updates the widgets
+
+Tabs without these methods keep using their synchronous refresh_data().
+
+Classes:
+    RefreshWorker: QRunnable that runs a fetch function and signals the result
+
+Functions:
+    supports_background_refresh(): Check whether a tab implements the protocol
+
+Dependencies:
+    - PyQt6.QtCore: QObject, QRunnable and signal support
+"""
+
+import traceback
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+
+class RefreshSignals(QObject):
+    """
+    Signals emitted by a RefreshWorker.
+
+    QRunnable is not a QObject, so the signals live on this helper object.
+    Connections made from the GUI thread are delivered back on the GUI thread.
+    """
+
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class RefreshWorker(QRunnable):
+    """
+    Run a tab's fetch_data() on a thread pool thread.
+
+    Attributes:
+        signals (RefreshSignals): Emits finished(result) or failed(message)
+    """
+
+    def __init__(self, fetch, *args):
+        """
+        Create a worker for a single fetch.
+
+        Args:
+            fetch (callable): Function to run on the worker thread
+            *args: Arguments for fetch, captured on the GUI thread
+        """
+        super().__init__()
+        self.fetch = fetch
+        self.args = args
+        self.signals = RefreshSignals()
+
+    def run(self):
+        """Execute the fetch and report the result through the signals."""
+        try:
+            result = self.fetch(*self.args)
+        except Exception as e:
+            traceback.print_exc()
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
+
+def supports_background_refresh(tab) -> bool:
+    """
+    Check whether a tab implements the fetch_args/fetch_data/apply_data protocol.
+
+    Args:
+        tab: The tab widget to check
+
+    Returns:
+        bool: True if the tab can be refreshed with a RefreshWorker
+    """
+    return (hasattr(tab, 'fetch_args') and hasattr(tab, 'fetch_data')
+            and hasattr(tab, 'apply_data'))
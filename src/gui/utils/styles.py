@@ -32,12 +32,17 @@ Dependencies:
     None - Pure CSS-like styling for PyQt6 widgets
 """
 
+import functools
+
+
+@functools.lru_cache(maxsize=1)
 def get_app_stylesheet():
     """
     Return the main application stylesheet with Modern Fintech theme.
 
     This function provides a comprehensive stylesheet that applies consistent
     light theme styling to all PyQt6 widgets used in the Zuo application.
+    The assembled string is cached, so every window shares the same object.
 
     Returns:
         str: Complete CSS-style stylesheet for PyQt6 application
@@ -401,6 +406,22 @@ def get_app_stylesheet():
         font-size: 14px;
     }
     
+    /* About Dialog - Title, tagline and details labels */
+    QLabel#aboutTitle {
+        color: #1e3a5f;
+        font-size: 20px;
+        font-weight: bold;
+    }
+    
+    QLabel#aboutTagline {
+        color: #10b981;
+        font-style: italic;
+    }
+    
+    QLabel#aboutCopyright {
+        color: #64748b;
+    }
+    
     /* Menu Bar - Application menu styling */
     QMenuBar {
         background-color: #ffffff;
@@ -0,0 +1,132 @@
+"""
+Embedded GUI resources for Zuo Budget Tracker
+
+Generated by scripts/utilities/build_resources.py - do not edit by hand.
+"""
+
+import base64
+
+# zuo_logo.png
+LOGO_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAZAAAAGQCAYAAACAvzbMAAARUklEQVR4nO3dPZYcxbaA0dRdWCwc"
+    "2TIYCL7GAZPAlCGTScA45DMQDNlyWLj9DOin7lZXZebJ+D97e7pLV110ZcRXEVFZ9ebh4WEDgLP+"
+    "1/sBADAnAQEgREAACBEQAEIEBIAQAQEgREAACBEQAEIEBIAQAQEgREAACBEQAEIEBIAQAQEgREAA"
+    "CBEQAEIEBIAQAQEgREAACBEQAEIEBIAQAQEgREAACBEQAEIEBIAQAQEgREAACBEQAEIEBIAQAQEg"
+    "REAACBEQAEIEBIAQAQEgREAACBEQAEIEBIAQAQEgREAACBEQAEIEBIAQAQEgREAACBEQAEIEBIAQ"
+    "AQEgREAACBEQAEIEBICQ73o/AGjpx59+fqj9M/768483tX8GjODNw0P18QRNtIhDKSLDCgSE6cwU"
+    "irOEhZkICENbORZHiQqjEhCGIhj7BIVRCAhdCcZ1gkIvAkJzolGPmNCSgNCEaLQnJtQmIFQzajRq"
+    "TqwZ/5vJS0AoqvcEOsNE6XfEKgSEy3pMiCtOgn6PzEZACGs14WWe5PyOGZmAcFrtSc1kdpvfPSMR"
+    "EA6pOXGZtOI8L/QkINxVa4IyOZXnuaI1AeFVNSYjE1E7nj9aEBCeKT3xmHT685xSi4CwbVvZScYE"
+    "My7PMyUJSHImlJw875QgIImVmERMHvNzHRAlIAllnzDefvpY7aL/8v7DtL+X7NcF5wlIIlkmiJqB"
+    "uGqGwGS5TrhOQBJYdUIYORRnjRiWVa8byhGQxV2dBEaaAFYKxp6RgrLSNURZArKoFQZ9pmDsGSEo"
+    "K1xTlCUgC7oy0HsOcsE4rmdQZr2+KE9AFjLjwBaN63rFZMbrjbIEZBHRwdxjIItGPT1iMtO1R1kC"
+    "soAZBrBotNcyJjNcg5QnIBObYdAKR39CQi0CMqmRB6pojKtFTEa+NilLQCYUGaDCwVOjhkRE5iIg"
+    "Exl1QArHvISEKwRkEiMOQuFYR+2QjHj9cp2ATGC0wScc66oZktGuY64TkMGdHXTCQQkjhURExiUg"
+    "gxrp1Zpw5FUrJCNd38QJyIBGGVzCwaMaIRnlOidOQAYzyvJePHhplNWIiIxDQAYywkASDvaMsBoR"
+    "kTEIyCB6DyDh4KzSIek9Bjjvf70fAP0HjngQUfq6OXtdl/jKXa6xAunszCAQDkbVczViJdKPFUhH"
+    "4sEqeq5GrET6EZBOxIPViEg+trA66BUP4aCVkltatrPGZQXSmHiQQcnrzUpkXALSkHiQiYiszxZW"
+    "Iz3iIRyMotSWlu2ssViBNCAeZFfqerQSGYuAVCYe8C8RWY+AVCQe8JyIrEVAKhEPeJ2IrMMheiVH"
+    "L9gS8RAOZlXicL3lWOM5K5AKxAOOKXH9Hh1HViHlCUhh4gHniMi8BKQg8YAYEZmTgBQiHnCNiMxH"
+    "QCYjHqzM9T0XASmg1erD4CKDq9e5VUg7AnKReEB5IjIHAblAPKAeERmfgFQmHhDXKiLECEhQi1ct"
+    "4gFtxoFVSIyABPjoBJiHrax6BOQk5x7QnvOQMQlIBeIB5TkPGY+AnODcA/pyHjIWATmoxdaVeMC+"
+    "K+PEVlZZAlKQeEAbLSLCPgE54MirERclzOPIeLUK2ScgO5x7wJich/QnIAXYuoI+bGX1JSB31H71"
+    "IR5wXe1xZBVym4Bc5FUMzMv4vUZAbqh9cG71AeXU3sqyCnmdgHQgHlCecdWegLyi5urDRQ71RMeX"
+    "VUiMgLzgng/ISUTOE5CGrD6gPuOsHQF5wtYVrMFWVhsCAkCIgPzH6gPWYhVSn4AAECIgm9UHrMoq"
+    "pC4BqUg8oD/jsJ70AXHfB/Aaq5B96QNSi1c9MA7jsY7UAbH6AO6xCrkvdUBq8WoHxmNclicgd1h9"
+    "AOaB29IGpNay06scGFet8Zl1GyttQPZ41QE8Mh+8LmVArD4gL6uQclIGZI9XG8BL5oVvpQuI1Qdg"
+    "FVJGuoAAUIaAvBBZplp9wHwi49Y21nOpApJteQm0l2meSRWQPVYfkItVyDXf9X4A5Pbl/YfeD2F6"
+    "bz997P0QSCrNCiTTshLoK8t8kyYge2xfQU62seIEBICQFAGpsZy0+oB11BjPGbaxUgRkj+UocJZ5"
+    "Q0AACFo+ILavgCNsY523fED2WIYCUdnnj/QBASBm6YDYvgLOsI11ztIB2ZN9+Qlcl3keSR0QAOIE"
+    "5ATbV7A+4/y4ZQOy8r4jMJdV56NlA7In874lUFbW+cT3gdCV77L4KvLdKH5/9JR2BXKWfVFqEo+x"
+    "GO/HLBmQVfcbgXmtOC8tGZA9WfcrGZPVxxoyzispAwKjEA9mJiAH2A+lBvEYm3G/T0Cgg0g8YDTL"
+    "BWTFgyrYNquPFaw2Py0XkD0ZD7oYi62rdWWbX9IF5Cz7oJQkHnMx/u8TEGjEuQerERBoIBoPqw9G"
+    "JiAwKPFgdEsFZLV3OLAG5x48tdI8tVRA9mR7hwT9OffIJ9M8kyogZ3kHBlc491iDeeA2AYEKxIMM"
+    "BAQGIR7MRkCgMIfmZCEgUJBDczIRECjEuQfZCAgUIB5ktExAVro5hxzEI69V5qtlArLn7M093vvN"
+    "Uc491nd2PshyM2GagEANtq7ITEAgSDzITkAgQDxAQAAIEhA4yeoD/iUgcIJ4wFcCAgeJBzwnIHCA"
+    "ez3gWwICFVl9sDIBgR22ruB1AgJ3iAfcJiBwg3jAfQICr3BoDvsEBAqy+iATAYEXbF3BMQICT4gH"
+    "HCcg8B/nHnCOgMB2LR5WH2QlIHCBeJCZgJCecw+I+a73A4Ce7sXjn99/ePbn73/5u/bDgalYgZCW"
+    "cw+4Jk1Afvzp54czf//L+w9vaj0W+hMPzjg7H5ydb2a1TED++vMPEz7ViQclrDJfLRMQOMr9HlCG"
+    "Q3RSuRWPlwfmt/7O5yd/fvfu10KPCuYkIKTxNB5HgrHn8+ffnv1ZUMhGQEjhy/sPRaJxz9OgiAkZ"
+    "OANheZ8//1Y9Hq/9zJcrFFiNgLC03pN4758PNdnCuuPL+w9v3n76mOL93Cs6M3m/dpf5y1XLy22p"
+    "o//+58+/2dKamHvCbksVkB9/+vlhlfdfc9/e5L73sSRvP3189o6r15wJiojkkeUmwm1bbAtLHNi2"
+    "+xP597/8fSgeEe/e/Xo3Eraz2La15qmlAgK3Jukj4SjlXkhEhJUICMs7E46SH1Viy4rVCQj8x+dc"
+    "wTkCssM7MObhE3Ypzfi/L11AMr1DIpMzXwzVivOOfLLNL8sFZKV3OHDerfOOf37/4WZISq8+7t2F"
+    "7lwkt9Xmp1T3gbCml6uP73/5+2YsHv/3x9CUjMfeikM8WI2AHOCO9HHd2rq6F5Ft+xqSx5sFI5P7"
+    "mS0q8ZiP8499AsK09g7N9yLy1JEYRM80xINVLXcGckS2g64VHX3HVaubB28RjzwyzitLBmS1gyqu"
+    "aXkX+qO9jzUhnxXnJVtYBzkHGUf0fo/vf/n7/w/Na7zFVjDW4fzjGAGhqys3/137ec9/buRekZer"
+    "mi/RB3WRmyDpJW1AfLQ7Tx35PpDe5ymMK+P5x7YtegaybWvuNwJzWnU+WjYgNdgXhfUZ58cJCAAh"
+    "qQOSdd8SKCfzPLJ0QGrsO1rewrpqjO9Vzz+2bfGAAFBP+oBkXn4C12SfP5YPiG0s4AjbV+elvZEQ"
+    "njpyJ7obC+E5AdnclZ5Ria+5FZTcsm9fbVuCLaxts43Fvx6/1rbWd6TX/vepx/ZVjBUIy+sxob/8"
+    "6lxYUYoVyBGR5ahVyPh6rwZ6/3z2Rcax7at/pVmB/PXnH2886bmcmbwjn8Z79N//5/cfrESSybB9"
+    "tW2JAsKYan2Xxd4XRn3z5U+vPI7PL/78zWN98W/c+5n//P6DL5xiObawnrCNtYZ7E3nNr5rd+7dr"
+    "fAsi19i+uiZVQLIsKzO7NUm3/I7yez9LRNaXaZ5JFZAjrELW02vryJbV2Kw+rhMQAELSBaTW8tIq"
+    "BOZRa7xm2r7atoQBOcIydS29zh2cd6zFvPCtlAGxClnXvcPrVhP6vZ/lXKQ/q49yUgbkCK825rX3"
+    "VtpaIdn7t8VjXuaD1715eMj7e9m7KKKvKN5++pj3lzqQM6F4bXJ/+f9/+Xeu/vu0F1191JorZudO"
+    "9Dt8zPvc3r379fAkf+TvRVcu4jE3q4/bbGFV4CxkHL0n794/n6+My/JSB+TI6sKrj/m1vAu958+k"
+    "vCPjP/MuhS2sSr68//DGWchYnk7oNQ7SBWNcVh91pD5Ef1TrVYaAzCMSFMGYR62PLcm8+tg2K5Cq"
+    "rELmEXkXFnOw+qgn9RnIo5pnIS5e6KfW23a3zepj2wQEgCAB+Y9VCKzF6qM+AQEgxLuwXqj56sOB"
+    "OrRh9dGGFUhDtrKgPuOsHQF5wd3pkJPVx3kC8goH6jAnW1dtCUgHIgLlGVftCcgNtbeyXOxQzpXx"
+    "ZPURJyAXOQ+BeRm/1wjIHbVfdViFwHW1x5HVx20CUoCtLOij9tYV9wnIjhavPkQEzmsxbqw+7hOQ"
+    "A9wbAmtxcF6GgBRkKwvasHU1BgE56OirERGBulrEw+rjGAE5wXkI9OXcYywCUsHVJbKIwLeujgtb"
+    "V+UJyEkttrK2TUTgqVbxsPo4R0ACWkUEuE486hGQIOch0IZzj3EJSGW2siDOucfYBOQC5yFQj3OP"
+    "8QnIRSIC5YnHHASkABGBcsRjHgIyGRFhZa7vuQhIIS3f2muQsaIS17XVR1sCUpCIQIx4zElAChMR"
+    "OEc85iUgFYgIHCMec3vz8OA+mxrOxKHUhf3200dPJlMo9cKnxzjjKyuQSs5crKXulrUaYQbisQ4B"
+    "qUhE4DnxWIuAVCYi8C/xWI+ANCAiZCcea3KI3lCvi9/hOr2UfCEjHuOxAmmox0pk26xG6EM81icg"
+    "jYkIGYhHDrawOuk5KGxpUUvpFyriMTYrkE56rUS2zWqEOsQjHwHpSERYhXjkZAtrAGfjYEuLUfQM"
+    "x7aJR29WIAM4OwisRhiBeGAFMpARBpDVCHtqvOAY4drnPAEZzCgDSUh4qdZKdZRrnvMEZECRLSqr"
+    "EWoaYdWxbeIxGgEZ1EiDS0jyGmXVsW3iMSIBGdxIy3shyaPmGytGuqa5RkAmMNqrNSFZ10jh2Dbx"
+    "GJ2ATGLEwSck66j9Vu4Rr1+uE5CJjDoIhWReLe4BGvW65ToBmdCoA1JI5iEclCAgk4rejS4kuY0a"
+    "jm0TjxkJyMRmGKhi0l/Lj6qZ4ZqkHAFZwAyDVkjaEw5qE5BFzDSAxaSeHh+MOdO1R1kCspArn9Lb"
+    "azCLyXW9Pk15xuuNsgRkQbMObDE5rudH8M96fVGegCzq6neGjDDQBeWrEb6zZYVrirIEZHErDfpM"
+    "QRkhGI9WuoYoS0ASKPENhiNOAisFZaRgPFr1uqEcAUkky4QwclhGDMVLWa4TrhOQhLJPEDUDM0Mg"
+    "bsl+XXCegCRmwmDbXAfECUhyJSaPRyaReXjeKUFA2LbNhJKF55mSBIRnSk4w22aSGYHnlFoEhFeV"
+    "nnS2zcTTkuePFgSEu2pMRNtmMqrBc0VrAsIhtSanbTNBXeF5oScB4bSak9a2mbju8btnJAJCWO3J"
+    "7FHmSc3vmJEJCJe1muSeWnHC83tkNgJCUT0mwadmmBD9jliFgFBN74nylpoTaMb/ZvISEJoYdWJd"
+    "mWhQm4DQnJjUIxq0JCB0JSbXiQa9CAhDEZR9gsEoBIShCYpgMC4BYTorR0UsmImAsIyZwiIUrEBA"
+    "SKVFZMSBLAQEgJD/9X4AAMxJQAAIERAAQgQEgBABASBEQAAIERAAQgQEgBABASBEQAAIERAAQgQE"
+    "gBABASBEQAAIERAAQgQEgBABASBEQAAIERAAQgQEgBABASBEQAAIERAAQgQEgBABASBEQAAIERAA"
+    "QgQEgBABASBEQAAIERAAQgQEgBABASBEQAAIERAAQgQEgBABASBEQAAIERAAQgQEgBABASBEQAAI"
+    "ERAAQgQEgBABASBEQAAIERAAQgQEgJD/A5cjmuY2BtyIAAAAAElFTkSuQmCC"
+)
+
+# zuo_logo_200.png
+LOGO_200_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAMgAAADICAYAAACtWK6eAAAID0lEQVR42u3dP4skRRjH8c1NfAXm"
+    "vgWjjkTB92Aivo6S48BXIYiYGRkIglr+ywyMzAzMzMwEEWS8XrelHadnurqrp7uqPl8o9u72bve2"
+    "u77zPL+qmpmHBwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAWueV197uXoxwNk6JI55/DVcW"
+    "JcowTOC4QII1Y/i+nbuAIwpxOtiIhMGeUsQDSnGrwpAFh5XiPIN0C75/yNTCkQXZwnVcGqZ3WgRI"
+    "lsWdxpbV4pC9/gJhVBXMmlSzpSisEqb8bERBshixhnYkQRaiEONxsjTbesxsJaOZInxvHl5f/vy9"
+    "7sUIoxFfjFPCGP/bUPr1wHHl2HwijGRIlWDpyCLNTFG0XY22U6EgITYVZoYo2q6GqkZYKcXp4CMu"
+    "lWWGKKpJxVlj0SpNIVJck6VbcB2DbNJWSxUSpegO1D5la8NyPtiYcXW0VJEYWUTRclUoRyBGHlFu"
+    "VBOSFNhSdcTYRBQtV+FyxISqERoXY1GYz3HtcWA5nqoGKSZEIUmdcsxtqSIJZo251SSSpAI5ZI3t"
+    "sglJ6pDDhN+25SJJoXKoGndquUhCDpKQ5HCCJMshb+ybSyYkCWZzfjniQjlM5J1zyZJ7B3KQhCSb"
+    "5Y5IjrIkWXIfQQ6SkCRva0WO4iUJWq39cofVqgKWgOWRbVqrQI6qJNFqZdzviOSoS5IlD4KQO+QR"
+    "rVa+1oocVUii1VpRPbRWbbZaqsjaC0WOqiSJqkh6MNdatd1qCezXwtqN1sqEq+z0b+ocUD2m5fDq"
+    "IwUPVWTD6qG1qrvVUkXWVw/BvP7AroqoHqqIKrJs30P1UEUe7ItM7HuoHqrIRBWJqofqoYqoIukX"
+    "QPVotorEZsN6SglVPdqsIikteOvt1aFv8NF5/+evS95db7PNSgjngSDVC3JK6DSC9qqwM1cE2a6K"
+    "NNlmzW2vSgnnBNk8rLfVZtXUXhFEm6W9Iog2a0dBim6vCLJPm2VzsKDnfBDkLm1WG5uGCfnD5mDC"
+    "+O63Xy7K0f95JZuG9eeQGvPHEcZbP3w4WT36z9XwlNwmckiN+YMccsge+x+ec74y/xTYWs3JIXXv"
+    "h8gfcocckkcQAiyUo+DWak4OqVeQxGcPkqCt3LFUkFiTIAL6xnJU0Fq1G9QTBBHQGwvla4I6QYxZ"
+    "uaOVV18kCEFaDOUESTiDZYk3IXeUdM4q01JvnWeyrGAJ5ZZ6CXLXk8Itvk0CQUjRbO4gCEGyyFFx"
+    "7iAIQeQOghCEHAQhyL1DeQO5gyAEEcoJQpCscjTWWhGEIHIHQQiySI4/f3x++v2Dlx4/NtpaNSuI"
+    "56PPCOVjQRqWo73npTvNez139EL044/P3ngUpP/47JPXT29++g5BHHdvT5Bvfvro32oxZ3zx8auP"
+    "whCEINUL0k/2uWJcGi1UFYI0+qqK53IMrdXAV1+++/jnQ7XoZeh/ff7vKpdkKqDX/eqKra9kjSf5"
+    "WIrxIcRehrEg49FLMf4aFUvS1goWQf4Z1+QY9juuCXL+dSrOJASp5a0PUlashondr1BNPfnpliB9"
+    "1ahdkLVbBYJ6oZuBf/367f/yx/lm4JQg5+1V/2sBvTJSSmStO+XnkoyrwTiMD8u6l1a8apbj5YT3"
+    "TK9RkOZefvQSvSTDhmDqaGAvZG7+iA81Uts73PajX326NK6d0B1WrYZl3ikhepH6z/cbi1Pf59Yo"
+    "6chKju7DmayCnuSUyvlhRe9RWPkZrBZyCEHkj71ySCRIU4J0TeePWvdDCGL/Q5u1sSCXjrv3v+9X"
+    "vBoRRHtVa5u1hH7ipxx3H4SpWBDt1cI2q6tNkKV7IMNIrSoFCBK1VxW3WSl7EudyDDvow+eH4+79"
+    "x/73z79/dnFHPWVfpIB9EO3VyjarirNZ40k+tSPe4nH3hAfR+NASF9qsqs9mzTku0uBx95BjfrTS"
+    "ZsWaq8icw4atHXfP0WEI65VUkfHknprgjR13D8K5KnJVkpaPu6seC8N6zVXkUjVo9Lh7SvWIDy2T"
+    "ckFqe7bhUDluvR5WbS/QkOsBUxUp+BDjUmEaeGJUp3psW0U6ghQ7ouqhiqzKJ5W/Jq/qcY8qUktg"
+    "95YGqseWu+udSVd+a2XXfN2+yK1WK5h85a5aTXQOJyakPZrcarWiSVhs7uhUj40DuzxSZu4QzPMG"
+    "9lutljxSXu6Igvl9Wy2SlCOH1mqjVuuWJEL78UN58n1FplUtof3Yodyq1QHyCEnKkkPu2CaP3HzU"
+    "Icnh5Ahyx4HyCEkOJYfcQRJykOOYeWSOJJaA77yUe0UOuYMk5CBHuZJouTY8PkKOwiWRS7bLG+So"
+    "SxItV8aWihyFSTLnpmi58rRUV/Y5yHFgSWbfHGe4LleNOS1VjuuPfSUJc7+GajI/a4xaKnIUJMlU"
+    "mY8JkrTcdoWEaz2VNyI5ji3J1I1LelRrTJSQeI3j2gci7C/J6parAVHCXtcVx84lyT3ykyihkvAd"
+    "9ryWKKflWtQSPIlSWlUJc8P31tcPZbVcq9qDg8uySIqtrxnKW+XKctNHbVjcUYiw8YOJVarGq0m2"
+    "R8eRMFtIE3IIscd1AVFS5bk5ar0OKL/tqrKtaPXnxrYT5vT097qCf8ZIDNxDlCJkSZCCGMjem59P"
+    "rt2Fefo/pEguY2C1KKkTblxhwhYTcPT/Coki/0dodxhHkWWq4swd2b6nO4nSZNlykAKHCcPhKEII"
+    "2yilwizNCLtmHOAoFWfuUBEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACARvkboTOp58tMeiIA"
+    "AAAASUVORK5CYII="
+)